@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Ecosim - Sonuç Kataloğu
+data/stats altındaki koşuları tek tabloda listeler, süzer ve karşılaştırır
+"""
+
+import re
+import sys
+import time
+import argparse
+
+from core.results_catalog import ResultsCatalog
+from core.utils import configure_logging
+
+CONDITION = re.compile(r'^(.+?)(<=|>=|!=|=|<|>)(.*)$')
+
+DEFAULT_COLUMNS = ['run', 'frame_count', 'final_population', 'peak_population', 'mean_population',
+                   'stats.total_organisms_died', 'stats.average_fitness']
+
+def parse_condition(text):
+    """'config.food.spawn_rate>=0.5' biçimindeki koşulu çöz"""
+    match = CONDITION.match(text)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"Geçersiz koşul: {text}")
+    return match.group(1), match.group(2), match.group(3)
+
+def format_value(value):
+    value = value.item() if hasattr(value, 'item') else value
+    if value == '':
+        return '-'
+    if isinstance(value, float):
+        if value != value:
+            return '-'
+        return str(int(value)) if value.is_integer() else f"{value:.4g}"
+    return str(value)
+
+def main():
+    parser = argparse.ArgumentParser(description='Ecosim - Sonuç kataloğu')
+    parser.add_argument('--dir', default='data/stats',
+                       help='Sonuç dosyalarının dizini')
+    parser.add_argument('--where', '-w', action='append', type=parse_condition, default=[],
+                       metavar='COL<OP>VALUE',
+                       help='Süzgeç (tekrarlanabilir; =, !=, <, <=, >, >=)')
+    parser.add_argument('--columns', '-c',
+                       help='Gösterilecek sütunlar (virgülle ayrılmış; varsayılan: özet metrikler ve değişen config)')
+    parser.add_argument('--sort', '-s',
+                       help='Sıralama sütunu')
+    parser.add_argument('--desc', action='store_true',
+                       help='Azalan sırala')
+    parser.add_argument('--group-by', metavar='COLUMN',
+                       help='Bu sütuna göre grupla')
+    parser.add_argument('--metric', default='final_population',
+                       help='Gruplamada özetlenecek sayısal sütun')
+    parser.add_argument('--find', metavar='TEXT',
+                       help='Adında TEXT geçen sütunları listele')
+    parser.add_argument('--limit', type=int, default=50,
+                       help='Gösterilecek en fazla satır')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Önbelleği kullanma, tüm dosyaları yeniden oku')
+
+    args = parser.parse_args()
+
+    # Logging yalnızca giriş noktasında yapılandırılır
+    configure_logging()
+
+    try:
+        start = time.perf_counter()
+        catalog = ResultsCatalog(args.dir, cache=not args.no_cache)
+        elapsed = time.perf_counter() - start
+        stats = catalog.get_statistics()
+        print(f"🗂️  {stats['runs']} koşu, {stats['columns']} sütun "
+              f"({stats['files_read']} dosya okundu, {stats['files_cached']} önbellekten, {elapsed * 1000:.0f} ms)")
+
+        if args.find:
+            for name in catalog.find_columns(args.find):
+                print(f"  {name}")
+            return
+
+        if args.group_by:
+            print(f"{args.group_by:>24}  {'koşu':>5}  {'ort':>10}  {'min':>10}  {'max':>10}  ({args.metric})")
+            for entry in catalog.group(args.group_by, args.metric, args.where):
+                print(f"{format_value(entry[args.group_by]):>24}  {entry['runs']:>5}  {format_value(entry['mean']):>10}  "
+                      f"{format_value(entry['min']):>10}  {format_value(entry['max']):>10}")
+            return
+
+        if args.columns:
+            columns = args.columns.split(',')
+        else:
+            columns = [name for name in DEFAULT_COLUMNS if name in catalog.columns] + catalog.varying_config()
+        data = catalog.select(columns, args.where, args.sort, args.desc, args.limit)
+
+        rows = [[format_value(value) for value in data[name]] for name in columns]
+        widths = [max([len(name)] + [len(value) for value in values]) for name, values in zip(columns, rows)]
+        print('  '.join(name.rjust(width) for name, width in zip(columns, widths)))
+        for i in range(len(rows[0]) if rows else 0):
+            print('  '.join(values[i].rjust(width) for values, width in zip(rows, widths)))
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Sorgu kullanıcı tarafından durduruldu")
+    except Exception as e:
+        print(f"❌ Hata: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
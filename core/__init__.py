@@ -3,13 +3,32 @@ Ecosim Core Module
 Evrimsel biyoloji simülasyonunun temel bileşenleri
 """
 
-from .world import World
-from .organism import Organism
-from .food import Food
-from .simulation import Simulation
-from .camera import Camera
-from .scenario_handler import ScenarioHandler
+import importlib
+
 from .utils import *
 
+# Ana sınıflar ilk erişimde yüklenir (Camera pygame gerektirir)
+_LAZY_ATTRIBUTES = {
+    'World': '.world',
+    'Organism': '.organism',
+    'Food': '.food',
+    'Simulation': '.simulation',
+    'Engine': '.engine',
+    'Camera': '.camera',
+    'ScenarioHandler': '.scenario_handler',
+}
+
+def __getattr__(name):
+    """Tembel sınıf erişimi: ``core.Simulation`` gibi isimleri ilk kullanımda import et"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
 __version__ = "0.1.0"
-__author__ = "Ecosim Team" 
\ No newline at end of file
+__author__ = "Ecosim Team"
@@ -0,0 +1,501 @@
+"""
+Ecosim Batch Worlds - Ortak Dizilerde Çok Sayıda Bağımsız Küçük Dünya
+"""
+
+import copy
+import numpy as np
+from typing import Dict, Any, List, Optional
+from .utils import lazy_jit, logger
+from .organism import DNA
+from .food import FOOD_TYPE_CODES, FOOD_ENERGY_MULTIPLIERS, FOOD_DECAY_MULTIPLIERS
+from .species_manager import SpeciesManager
+from .timeseries import TimeSeries
+
+# Batch motorunun taşıdığı genler (gen matrisi sütun sırası)
+GENE_NAMES = [
+    'speed',
+    'vision_range',
+    'metabolism',
+    'lifespan',
+    'reproduction_threshold',
+    'exploration_tendency',
+    'mutation_rate',
+    'size'
+]
+GENE_INDEX = {name: i for i, name in enumerate(GENE_NAMES)}
+
+FOOD_TYPE_NAMES = sorted(FOOD_TYPE_CODES, key=FOOD_TYPE_CODES.get)
+DEFAULT_FOOD_TYPES = {'basic': 0.7, 'premium': 0.2, 'nutritious': 0.1}
+
+# Organism davranışıyla aynı sabitler
+EAT_RADIUS = 15.0
+REPRODUCTION_MIN_AGE = 10.0
+REPRODUCTION_CHANCE = 0.03
+REPRODUCTION_COOLDOWN = 10.0
+INITIAL_ENERGY = 100.0
+
+
+@lazy_jit(nopython=True, cache=True)
+def _forage(org_pos, org_world, vision, food_pos, food_alive,
+            cell_start, cell_items, cells_x, cells_y, cell_size, eat_radius,
+            claimable, target, claimed_by):
+    """Her organizma için görüş alanındaki en yakın yiyeceği bul
+
+    Yeme mesafesindeki yiyecek (indeksi ``claimable``'dan küçükse) ilk
+    gelen organizmaya ayrılır (``food_alive`` False, ``claimed_by``
+    organizma indeksi).
+    """
+    n = org_pos.shape[0]
+    eat_sq = eat_radius * eat_radius
+    for i in range(n):
+        px = org_pos[i, 0]
+        py = org_pos[i, 1]
+        w = org_world[i]
+        reach = int(vision[i] // cell_size) + 1
+        cx = min(max(int(px // cell_size), 0), cells_x - 1)
+        cy = min(max(int(py // cell_size), 0), cells_y - 1)
+
+        best = vision[i] * vision[i]
+        best_j = -1
+        for gy in range(max(0, cy - reach), min(cells_y, cy + reach + 1)):
+            row = (w * cells_y + gy) * cells_x
+            for gx in range(max(0, cx - reach), min(cells_x, cx + reach + 1)):
+                cell = row + gx
+                for k in range(cell_start[cell], cell_start[cell + 1]):
+                    j = cell_items[k]
+                    if not food_alive[j]:
+                        continue
+                    dx = food_pos[j, 0] - px
+                    dy = food_pos[j, 1] - py
+                    d = dx * dx + dy * dy
+                    if d <= best:
+                        best = d
+                        best_j = j
+
+        target[i] = best_j
+        if best_j >= 0 and best_j < claimable and best < eat_sq:
+            food_alive[best_j] = False
+            claimed_by[best_j] = i
+
+
+class BatchWorldEngine:
+    """K bağımsız dünyayı ortak structure-of-arrays tamponlarında ilerleten motor
+
+    Organizma ve yiyecek sütunlarının her satırı bir ``world`` kimliği
+    taşır. Uzamsal indeks (dünya kimliği + hücre anahtarıyla counting
+    sort), metabolizma, yiyecek arama, hareket, üreme ve yiyecek üretimi
+    tüm dünyalar için tek vektörel geçişte yapılır. Dünya başına config
+    değerleri (boyut, üretim oranı, enerji tüketimi, nüfus sınırı...)
+    dizilere yayınlanır.
+
+    Davranış modeli ``Organism`` durum makinesinin yiyecek arama,
+    dolaşma, üreme ve yaşlanma kısmıdır; biome'lar, avlanma ve sosyal
+    davranışlar bu modda yoktur.
+    """
+
+    def __init__(self, configs: List[Dict[str, Any]], seed: Optional[int] = None,
+                 cell_size: float = 100.0):
+        """
+        Args:
+            configs: Dünya başına simülasyon config'i (senaryo config.yaml yapısında)
+            seed: Rastgele sayı üreteci tohumu
+            cell_size: Uzamsal indeks hücre boyutu
+        """
+        self.world_count = len(configs)
+        self.rng = np.random.default_rng(seed)
+        self.cell_size = float(cell_size)
+
+        simulation_config = configs[0].get('simulation', {})
+        self.dt = float(simulation_config.get('fixed_dt', 1.0 / simulation_config.get('fps', 60)))
+        self.stats_interval_ticks = max(1, int(round(1.0 / self.dt)))
+        self.tick = 0
+        self.current_time = 0.0
+
+        self._broadcast_configs(configs)
+
+        # Ortak grid boyutu (en büyük dünyaya göre)
+        self.cells_x = int(np.ceil(self.world_sizes[:, 0].max() / self.cell_size))
+        self.cells_y = int(np.ceil(self.world_sizes[:, 1].max() / self.cell_size))
+
+        self._init_food_columns()
+        self._init_organisms(configs)
+
+        self.stats = {
+            'births': np.zeros(self.world_count, dtype=np.int64),
+            'deaths': np.zeros(self.world_count, dtype=np.int64),
+            'food_eaten': np.zeros(self.world_count, dtype=np.int64),
+            'food_spawned': np.zeros(self.world_count, dtype=np.int64),
+            # Dünya başına nüfus; tüm koşunun en büyük/ortalama değerleri sabit bellekle
+            'population_history': TimeSeries(['frame', 'time'] +
+                                             [f'population_{w}' for w in range(self.world_count)])
+        }
+        self._record_population()
+
+        logger.info(f"🌐 BatchWorldEngine: {self.world_count} dünya, "
+                    f"{len(self.org_world)} organizma, dt={self.dt:.4f}")
+
+    def _broadcast_configs(self, configs: List[Dict[str, Any]]):
+        """Dünya başına config değerlerini dizilere çevir"""
+        k = self.world_count
+        self.world_sizes = np.zeros((k, 2), dtype=np.float64)
+        self.max_organisms = np.zeros(k, dtype=np.int64)
+        self.energy_decay = np.zeros(k, dtype=np.float64)
+        self.food_rates = np.zeros(k, dtype=np.float64)
+        self.food_base_energy = np.zeros(k, dtype=np.float64)
+        self.food_base_decay = np.zeros(k, dtype=np.float64)
+        self.food_type_cdf = np.zeros((k, len(FOOD_TYPE_NAMES)), dtype=np.float64)
+
+        for w, config in enumerate(configs):
+            simulation_config = config.get('simulation', {})
+            organism_config = config.get('organism', {})
+            food_config = config.get('food', {})
+
+            self.world_sizes[w] = simulation_config.get('world_size', [2000, 2000])
+            self.max_organisms[w] = simulation_config.get('max_organisms', 2000)
+            self.energy_decay[w] = organism_config.get('energy_decay', 0.08)
+
+            if 'spawn_rate_per_second' in food_config:
+                self.food_rates[w] = food_config['spawn_rate_per_second']
+            else:
+                self.food_rates[w] = food_config.get('spawn_rate', 0.05) * simulation_config.get('fps', 60)
+            self.food_base_energy[w] = food_config.get('base_energy', 10.0)
+            self.food_base_decay[w] = food_config.get('base_decay_rate', 0.0)
+
+            food_types = food_config.get('food_types', DEFAULT_FOOD_TYPES)
+            weights = np.array([food_types.get(name, 0.0) for name in FOOD_TYPE_NAMES])
+            self.food_type_cdf[w] = np.cumsum(weights / weights.sum())
+
+        self.food_energy_multipliers = np.array([FOOD_ENERGY_MULTIPLIERS[n] for n in FOOD_TYPE_NAMES])
+        self.food_decay_multipliers = np.array([FOOD_DECAY_MULTIPLIERS[n] for n in FOOD_TYPE_NAMES])
+
+    def _init_food_columns(self):
+        """Boş yiyecek sütunları"""
+        self.food_world = np.zeros(0, dtype=np.int64)
+        self.food_pos = np.zeros((0, 2), dtype=np.float64)
+        self.food_energy = np.zeros(0, dtype=np.float64)
+        self.food_decay = np.zeros(0, dtype=np.float64)
+
+    def _init_organisms(self, configs: List[Dict[str, Any]]):
+        """Kurucu organizmaları tür ağırlıklarına göre oluştur"""
+        manager = SpeciesManager()
+        base_species = copy.deepcopy(manager.species_config)
+        self.species_names = list(base_species.keys())
+
+        worlds, genes, species = [], [], []
+        for w, config in enumerate(configs):
+            manager.species_config = copy.deepcopy(base_species)
+            manager.apply_overrides(config.get('species', {}))
+            organism_config = config.get('organism', {})
+            count = int(organism_config.get('initial_count', 100))
+
+            # Tür başına gen vektörü (DNA varsayılanları + tür özellikleri)
+            table = np.array([
+                [DNA(species_traits=manager.species_config[name]).genes[g] for g in GENE_NAMES]
+                for name in self.species_names
+            ])
+            has_size = np.array(['size' in manager.species_config[name] for name in self.species_names])
+            weights = np.array([manager.species_config[name].get('spawn_weight', 0.1)
+                                for name in self.species_names])
+
+            chosen = self.rng.choice(len(self.species_names), size=count, p=weights / weights.sum())
+            world_genes = table[chosen]
+            random_size = ~has_size[chosen]
+            world_genes[random_size, GENE_INDEX['size']] = self.rng.uniform(1.2, 4.0, random_size.sum())
+            if 'mutation_rate' in organism_config:
+                world_genes[:, GENE_INDEX['mutation_rate']] = organism_config['mutation_rate']
+
+            worlds.append(np.full(count, w, dtype=np.int64))
+            genes.append(world_genes)
+            species.append(chosen)
+
+        self.org_world = np.concatenate(worlds)
+        n = len(self.org_world)
+        self.org_genes = np.concatenate(genes).astype(np.float64)
+        self.org_species = np.concatenate(species).astype(np.int64)
+        self.org_pos = self._random_positions(self.org_world)
+        self.org_vel = np.zeros((n, 2), dtype=np.float64)
+        self.org_energy = np.full(n, INITIAL_ENERGY)
+        self.org_age = np.zeros(n, dtype=np.float64)
+        self.org_last_reproduction = np.zeros(n, dtype=np.float64)
+        self.org_food_eaten = np.zeros(n, dtype=np.int64)
+        self.org_offspring = np.zeros(n, dtype=np.int64)
+
+    # --- Sütun yardımcıları ---------------------------------------------
+
+    def _random_positions(self, worlds: np.ndarray) -> np.ndarray:
+        """Her satırın dünyasında düzgün dağılımlı pozisyon"""
+        return self.rng.random((len(worlds), 2)) * self.world_sizes[worlds]
+
+    _ORGANISM_COLUMNS = ('org_world', 'org_genes', 'org_species', 'org_pos', 'org_vel',
+                         'org_energy', 'org_age', 'org_last_reproduction',
+                         'org_food_eaten', 'org_offspring')
+    _FOOD_COLUMNS = ('food_world', 'food_pos', 'food_energy', 'food_decay')
+
+    def _keep(self, columns, mask: np.ndarray):
+        """Maskedeki satırları tut"""
+        for name in columns:
+            setattr(self, name, getattr(self, name)[mask])
+
+    def _append(self, columns, values: Dict[str, np.ndarray]):
+        """Sütunların sonuna satır ekle"""
+        for name in columns:
+            setattr(self, name, np.concatenate([getattr(self, name), values[name]]))
+
+    # --- Tick aşamaları --------------------------------------------------
+
+    def step(self, n: int = 1):
+        """Tüm dünyaları n tick ilerlet"""
+        for _ in range(n):
+            self._spawn_food()
+            self._decay_food()
+            target = self._forage()
+            self._move(target)
+            self._metabolize()
+            self._reproduce(target)
+            self._remove_dead()
+
+            self.tick += 1
+            self.current_time += self.dt
+            if self.tick % self.stats_interval_ticks == 0:
+                self._record_population()
+
+    def _spawn_food(self):
+        """Dünya başına Poisson sayıda yiyecek üret"""
+        counts = self.rng.poisson(self.food_rates * self.dt)
+        total = int(counts.sum())
+        if total == 0:
+            return
+        worlds = np.repeat(np.arange(self.world_count), counts)
+        type_index = (self.rng.random(total)[:, np.newaxis] > self.food_type_cdf[worlds]).sum(axis=1)
+        type_index = np.minimum(type_index, len(FOOD_TYPE_NAMES) - 1)
+
+        self._append(self._FOOD_COLUMNS, {
+            'food_world': worlds,
+            'food_pos': self._random_positions(worlds),
+            'food_energy': self.food_base_energy[worlds] * self.food_energy_multipliers[type_index],
+            'food_decay': self.food_base_decay[worlds] * self.food_decay_multipliers[type_index]
+        })
+        self.stats['food_spawned'] += counts
+
+    def _decay_food(self):
+        """Yiyecek bozulması, biten yiyecekler silinir"""
+        decaying = self.food_decay > 0
+        if not np.any(decaying):
+            return
+        self.food_energy[decaying] -= self.food_decay[decaying] * self.dt
+        self._keep(self._FOOD_COLUMNS, ~decaying | (self.food_energy > 0))
+
+    def _visible_foods(self):
+        """Arama yapılacak yiyecekler: (pozisyonlar, dünya kimlikleri, yenebilir sayısı)"""
+        return self.food_pos, self.food_world, len(self.food_world)
+
+    def _forage(self) -> np.ndarray:
+        """En yakın yiyeceği bul, yeme mesafesindekileri ye; hedef indeksleri döndür"""
+        n = len(self.org_world)
+        target = np.full(n, -1, dtype=np.int64)
+        positions, worlds, claimable = self._visible_foods()
+        self._target_positions = positions
+        if n == 0 or len(positions) == 0:
+            return target
+
+        # Dünya kimliği + hücre anahtarıyla counting sort
+        cells = np.minimum((positions // self.cell_size).astype(np.int64),
+                           [self.cells_x - 1, self.cells_y - 1])
+        keys = (worlds * self.cells_y + cells[:, 1]) * self.cells_x + cells[:, 0]
+        cell_count = self.world_count * self.cells_x * self.cells_y
+        cell_items = np.argsort(keys, kind='stable').astype(np.int64)
+        cell_start = np.zeros(cell_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=cell_count), out=cell_start[1:])
+
+        food_alive = np.ones(len(positions), dtype=np.bool_)
+        claimed_by = np.full(len(positions), -1, dtype=np.int64)
+        _forage(self.org_pos, self.org_world, self.org_genes[:, GENE_INDEX['vision_range']].copy(),
+                positions, food_alive, cell_start, cell_items,
+                self.cells_x, self.cells_y, self.cell_size, EAT_RADIUS,
+                claimable, target, claimed_by)
+
+        # Yenen yiyecekler
+        eaten = np.flatnonzero(claimed_by >= 0)
+        if eaten.size:
+            eaters = claimed_by[eaten]
+            np.add.at(self.org_energy, eaters, self.food_energy[eaten])
+            np.add.at(self.org_food_eaten, eaters, 1)
+            self.stats['food_eaten'] += np.bincount(self.food_world[eaten], minlength=self.world_count)
+            target[eaters] = -1
+
+            # Başkasının yediği yiyeceği hedefleyenler hedefsiz kalır
+            has_target = target >= 0
+            has_target[has_target] = claimed_by[target[has_target]] < 0
+            target[~has_target] = -1
+            self._consume_food(eaten, target)
+
+        return target
+
+    def _consume_food(self, eaten: np.ndarray, target: np.ndarray):
+        """Yenen yiyecekleri sil; kayan indeksler için hedefleri yeniden numarala"""
+        keep = np.ones(len(self.food_world), dtype=np.bool_)
+        keep[eaten] = False
+        remap = np.cumsum(keep) - 1
+        has_target = target >= 0
+        target[has_target] = remap[target[has_target]]
+        self._keep(self._FOOD_COLUMNS, keep)
+        self._target_positions = self.food_pos
+
+    def _move(self, target: np.ndarray):
+        """Hedefe yönel veya dolaş, dünya sınırlarında sek"""
+        n = len(self.org_world)
+        if n == 0:
+            return
+        speed = self.org_genes[:, GENE_INDEX['speed']]
+
+        # Yiyeceğe yönelme
+        hunting = np.flatnonzero(target >= 0)
+        if hunting.size:
+            direction = self._target_positions[target[hunting]] - self.org_pos[hunting]
+            distance = np.maximum(np.linalg.norm(direction, axis=1), 1e-9)
+            self.org_vel[hunting] = direction / distance[:, np.newaxis] * speed[hunting, np.newaxis]
+
+        # Dolaşma: keşif eğilimine göre yön değiştir, çok yavaşsa yeniden başlat
+        wandering = target < 0
+        turn = wandering & (
+            (self.rng.random(n) < self.org_genes[:, GENE_INDEX['exploration_tendency']] * 0.3) |
+            (np.linalg.norm(self.org_vel, axis=1) < 5.0)
+        )
+        turning = np.flatnonzero(turn)
+        if turning.size:
+            angles = self.rng.uniform(0, 2 * np.pi, turning.size)
+            self.org_vel[turning] = np.column_stack([np.cos(angles), np.sin(angles)]) * \
+                speed[turning, np.newaxis]
+
+        self.org_pos += self.org_vel * self.dt
+
+        # Sınırda sek
+        bounds = self.world_sizes[self.org_world]
+        hit = (self.org_pos <= 0) | (self.org_pos >= bounds)
+        self.org_vel[hit] *= -0.5
+        np.clip(self.org_pos, 0, bounds, out=self.org_pos)
+
+    def _metabolize(self):
+        """Yaşlanma ve enerji tüketimi"""
+        self.org_age += self.dt
+        self.org_energy -= (self.org_genes[:, GENE_INDEX['metabolism']] +
+                            self.energy_decay[self.org_world]) * self.dt
+
+    def _reproduce(self, target: np.ndarray):
+        """Yiyecek görmeyen, enerjisi eşiği aşan organizmalar ürer"""
+        n = len(self.org_world)
+        if n == 0:
+            return
+        candidates = np.flatnonzero(
+            (target < 0) &
+            (self.org_energy > self.org_genes[:, GENE_INDEX['reproduction_threshold']]) &
+            (self.org_age > REPRODUCTION_MIN_AGE) &
+            (self.org_age - self.org_last_reproduction >= REPRODUCTION_COOLDOWN) &
+            (self.rng.random(n) < REPRODUCTION_CHANCE)
+        )
+        if candidates.size == 0:
+            return
+
+        # Dünya başına nüfus sınırı: her dünyada kalan kapasite kadar aday
+        worlds = self.org_world[candidates]
+        order = np.argsort(worlds, kind='stable')
+        candidates, worlds = candidates[order], worlds[order]
+        first = np.searchsorted(worlds, worlds, side='left')
+        rank = np.arange(len(worlds)) - first
+        population = np.bincount(self.org_world, minlength=self.world_count)
+        parents = candidates[rank < (self.max_organisms - population)[worlds]]
+        if parents.size == 0:
+            return
+
+        count = parents.size
+        self.org_energy[parents] *= 0.7
+        self.org_offspring[parents] += 1
+        self.org_last_reproduction[parents] = self.org_age[parents]
+
+        # Mutasyon (DNA.mutate ile aynı kural, renk genleri hariç)
+        genes = self.org_genes[parents].copy()
+        mutate = self.rng.random(genes.shape) < genes[:, GENE_INDEX['mutation_rate'], np.newaxis]
+        genes[mutate] += self.rng.normal(0, 0.2, int(mutate.sum()))
+        np.maximum(genes, 0.1, out=genes)
+        mr = GENE_INDEX['mutation_rate']
+        genes[:, mr] = np.clip(genes[:, mr], 0.01, 0.5)
+
+        child_world = self.org_world[parents]
+        child_pos = np.clip(self.org_pos[parents] + self.rng.uniform(-20, 20, (count, 2)),
+                            0, self.world_sizes[child_world])
+        self._append(self._ORGANISM_COLUMNS, {
+            'org_world': child_world,
+            'org_genes': genes,
+            'org_species': self.org_species[parents],
+            'org_pos': child_pos,
+            'org_vel': np.zeros((count, 2)),
+            'org_energy': np.full(count, INITIAL_ENERGY),
+            'org_age': np.zeros(count),
+            'org_last_reproduction': np.zeros(count),
+            'org_food_eaten': np.zeros(count, dtype=np.int64),
+            'org_offspring': np.zeros(count, dtype=np.int64)
+        })
+        self.stats['births'] += np.bincount(child_world, minlength=self.world_count)
+
+    def _remove_dead(self):
+        """Açlık veya yaşlılıktan ölenleri sil"""
+        dead = (self.org_energy <= 0) | (self.org_age >= self.org_genes[:, GENE_INDEX['lifespan']])
+        if np.any(dead):
+            self.stats['deaths'] += np.bincount(self.org_world[dead], minlength=self.world_count)
+            self._keep(self._ORGANISM_COLUMNS, ~dead)
+
+    def _record_population(self):
+        """Dünya başına nüfusu geçmişe ekle"""
+        self.stats['population_history'].append_row(
+            np.concatenate(([self.tick, self.current_time], self.get_populations()))
+        )
+
+    # --- Sorgular ----------------------------------------------------------
+
+    def get_populations(self) -> np.ndarray:
+        """Dünya başına canlı organizma sayısı"""
+        return np.bincount(self.org_world, minlength=self.world_count)
+
+    def get_fitness(self) -> np.ndarray:
+        """Organizma başına uygunluk (Organism.get_fitness ile aynı formül)"""
+        fitness = (self.org_food_eaten * 5.0 + self.org_offspring * 20.0 +
+                   np.minimum(self.org_age * 0.5, 50.0) +
+                   np.minimum(self.org_energy * 0.1, 20.0))
+        return np.minimum(fitness, 100.0)
+
+    def get_world_summaries(self) -> List[Dict[str, Any]]:
+        """Dünya başına özet metrikler (sweep SUMMARY_METRICS ile aynı anahtarlar)"""
+        populations = self.get_populations()
+        history = self.stats['population_history'].summary()
+        fitness_sum = np.bincount(self.org_world, weights=self.get_fitness(), minlength=self.world_count)
+        species_alive = np.zeros(self.world_count, dtype=np.int64)
+        if len(self.org_world):
+            pairs = np.unique(self.org_world * len(self.species_names) + self.org_species)
+            species_alive = np.bincount(pairs // len(self.species_names), minlength=self.world_count)
+
+        summaries = []
+        for w in range(self.world_count):
+            summaries.append({
+                'final_population': int(populations[w]),
+                'peak_population': int(history[f'population_{w}']['max']),
+                'mean_population': history[f'population_{w}']['mean'],
+                'species_alive': int(species_alive[w]),
+                'total_organisms_died': int(self.stats['deaths'][w]),
+                'total_food_eaten': int(self.stats['food_eaten'][w]),
+                'average_fitness': float(fitness_sum[w] / populations[w]) if populations[w] else 0.0,
+                'extinct': int(populations[w] == 0)
+            })
+        return summaries
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Motor istatistiklerini döndür"""
+        return {
+            'world_count': self.world_count,
+            'tick': self.tick,
+            'current_time': self.current_time,
+            'organism_count': int(len(self.org_world)),
+            'food_count': int(len(self.food_world)),
+            'births': int(self.stats['births'].sum()),
+            'deaths': int(self.stats['deaths'].sum()),
+            'food_eaten': int(self.stats['food_eaten'].sum())
+        }
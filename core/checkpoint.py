@@ -0,0 +1,835 @@
+"""
+Ecosim Checkpoint - Simülasyon Durumunu Kaydetme ve Geri Yükleme
+"""
+
+import gc
+import json
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .timeseries import encode_series, decode_series
+from .utils import logger
+
+CHECKPOINT_VERSION = 1
+
+# Zamanlama çarkı olay türleri (checkpoint'teki kod sırası)
+EVENT_KINDS = ['old_age', 'food_expiry', 'reproduction_ready']
+
+# Organizma referans kodlaması: >= 0 organizma slot'u, -1 None, <= -2 hayalet
+NO_REF = -1
+
+# Organizmanın checkpoint'e yazılan kayan noktalı alanları
+ORGANISM_FLOAT_FIELDS = [
+    'energy',
+    'age',
+    'size',
+    'last_update_time',
+    'update_interval',
+    'accumulated_time',
+    'last_reproduction_time',
+    'reproduction_cooldown'
+]
+
+
+def _json_default(value):
+    """NumPy skalerlerini ve dizilerini JSON'a çevir"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(value).__name__}")
+
+
+def _encode_json(data: Any) -> np.ndarray:
+    """JSON verisini npz içinde saklanabilir bayt dizisine çevir"""
+    return np.frombuffer(json.dumps(data, default=_json_default).encode('utf-8'), dtype=np.uint8)
+
+
+def _decode_json(array: np.ndarray) -> Any:
+    """_encode_json çıktısını geri çöz"""
+    return json.loads(array.tobytes().decode('utf-8'))
+
+
+@contextmanager
+def _gc_paused():
+    """Döngüsel çöp toplayıcıyı geçici olarak durdur
+
+    Yüz binlerce küçük nesne art arda oluşturulurken tekrarlanan
+    taramalar yakalama ve yükleme süresini katlarca uzatır.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+class _CodeTable:
+    """Metin değerlerini küçük tamsayı kodlarına çeviren tablo (None = -1)"""
+
+    def __init__(self):
+        self.codes: Dict[Any, int] = {}
+        self.values: List[Any] = []
+
+    def code(self, value) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def _scenario_state(scenario_handler) -> Optional[Dict[str, Any]]:
+    """Senaryo işleyicisinin ve örneğinin JSON'a çevrilebilir durumu"""
+    if scenario_handler is None:
+        return None
+    instance = scenario_handler.scenario_instance
+    if instance is not None and hasattr(instance, 'get_state'):
+        instance_state = instance.get_state()
+    else:
+        instance_state = {}
+        for name, value in vars(instance or object()).items():
+            if name == 'simulation':
+                continue
+            try:
+                json.dumps(value, default=_json_default)
+            except (TypeError, ValueError):
+                continue
+            instance_state[name] = value
+    return {
+        'name': scenario_handler.scenario_name,
+        'is_active': scenario_handler.is_active,
+        'stats': scenario_handler.stats,
+        'instance': instance_state
+    }
+
+
+def _restore_scenario(scenario_handler, state: Optional[Dict[str, Any]]):
+    """_scenario_state çıktısını senaryo işleyicisine uygula"""
+    if scenario_handler is None or state is None:
+        return
+    if state['name'] != scenario_handler.scenario_name:
+        logger.warning(f"⚠️  Checkpoint senaryosu farklı: {state['name']} != {scenario_handler.scenario_name}")
+    scenario_handler.is_active = state['is_active']
+    scenario_handler.stats.update(state['stats'])
+    instance = scenario_handler.scenario_instance
+    if instance is None:
+        return
+    if hasattr(instance, 'set_state'):
+        instance.set_state(state['instance'])
+    else:
+        for name, value in state['instance'].items():
+            setattr(instance, name, value)
+
+
+def _flatten_chunks(chunks: Dict[Tuple[int, int], Dict[str, List[int]]]) -> Dict[str, np.ndarray]:
+    """Chunk sözlüğünü anahtar, sayı ve birleşik indeks dizilerine çevir (sıra korunur)"""
+    keys = np.array(list(chunks.keys()), dtype=np.int64).reshape(-1, 2)
+    organisms = [chunk['organisms'] for chunk in chunks.values()]
+    foods = [chunk['foods'] for chunk in chunks.values()]
+    return {
+        'keys': keys,
+        'organism_counts': np.array([len(items) for items in organisms], dtype=np.int64),
+        'organisms': np.array([i for items in organisms for i in items], dtype=np.int64),
+        'food_counts': np.array([len(items) for items in foods], dtype=np.int64),
+        'foods': np.array([i for items in foods for i in items], dtype=np.int64)
+    }
+
+
+def _unflatten_chunks(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[Tuple[int, int], Dict[str, List[int]]]:
+    """_flatten_chunks çıktısından chunk sözlüğünü yeniden kur"""
+    keys = [tuple(key) for key in arrays[f'{prefix}_keys'].tolist()]
+    organism_counts = arrays[f'{prefix}_organism_counts']
+    food_counts = arrays[f'{prefix}_food_counts']
+    organisms = arrays[f'{prefix}_organisms'].tolist()
+    foods = arrays[f'{prefix}_foods'].tolist()
+    organism_ends = np.cumsum(organism_counts).tolist()
+    food_ends = np.cumsum(food_counts).tolist()
+
+    chunks = {}
+    org_start = food_start = 0
+    for key, org_end, food_end in zip(keys, organism_ends, food_ends):
+        chunks[key] = {
+            'organisms': organisms[org_start:org_end],
+            'foods': foods[food_start:food_end]
+        }
+        org_start, food_start = org_end, food_end
+    return chunks
+
+
+def capture_state(simulation, scenario_handler=None) -> Dict[str, np.ndarray]:
+    """Simülasyonun tam durumunu NumPy dizileri olarak yakala
+
+    Ana thread'de, iki tick arasında çağrılmalıdır. Dönen diziler
+    simülasyondan bağımsız kopyalardır; arka planda diske yazılabilir.
+
+    Organizmalar slot sırasıyla sütunlara yazılır; organizma nesnesine
+    işaret eden referanslar (hedef organizma, zamanlama çarkı olayları)
+    slot indeksine çevrilir. Dünyadan çıkmış ama hâlâ referans verilen
+    organizmalar "hayalet" kaydı (kimlik ve pozisyon) olarak saklanır.
+    """
+    world = simulation.world
+    arrays: Dict[str, np.ndarray] = {}
+
+    # --- Organizmalar ---
+    slots = [i for i, org in enumerate(world.organisms) if org is not None]
+    organisms = [world.organisms[i] for i in slots]
+    slot_of = {id(org): slot for slot, org in zip(slots, organisms)}
+    ghosts: List[Any] = []
+    ghost_of: Dict[int, int] = {}
+
+    def ref(target) -> int:
+        if target is None:
+            return NO_REF
+        slot = slot_of.get(id(target))
+        if slot is not None:
+            return slot
+        index = ghost_of.get(id(target))
+        if index is None:
+            index = len(ghosts)
+            ghost_of[id(target)] = index
+            ghosts.append(target)
+        return -2 - index
+
+    n = len(organisms)
+    gene_dicts = [org.dna.genes for org in organisms]
+    gene_names: List[str] = []
+    gene_index: Dict[str, int] = {}
+    for gene_dict in gene_dicts:
+        if len(gene_dict) == len(gene_names) and all(name in gene_index for name in gene_dict):
+            continue
+        for name in gene_dict:
+            if name not in gene_index:
+                gene_index[name] = len(gene_names)
+                gene_names.append(name)
+    genes = np.array([[gene_dict.get(name, np.nan) for name in gene_names] for gene_dict in gene_dicts],
+                     dtype=np.float64).reshape(n, len(gene_names))
+
+    species = _CodeTable()
+    diets = _CodeTable()
+    states = _CodeTable()
+    behaviors = _CodeTable()
+    causes = _CodeTable()
+    traits = _CodeTable()
+    trait_codes: Dict[int, int] = {}  # id(species_traits) -> kod (aynı sözlük paylaşılır)
+
+    code_rows = []  # species, diet, state, behavior, cause, traits
+    int_rows = []  # id, food_eaten, offspring, target_food, target_org, r, g
+    flag_rows = []  # ready, lifespan_scheduled, alias, has_target_pos, has_target_food
+    extra_rows = []  # color_b, distance_traveled, stats_lifespan
+    target_rows = []
+    for org in organisms:
+        stats = org.stats
+        species_traits = org.species_traits
+        trait_code = trait_codes.get(id(species_traits))
+        if trait_code is None:
+            trait_code = traits.code(json.dumps(species_traits, sort_keys=True, default=_json_default))
+            trait_codes[id(species_traits)] = trait_code
+        target_food = org.target_food
+        target_position = org.target_position
+        color = org.color
+        code_rows.append((species.code(org.species), diets.code(org.diet_type), states.code(org.state),
+                          behaviors.code(org.behavior_state), causes.code(stats['cause_of_death']), trait_code))
+        int_rows.append((org.organism_id, stats['food_eaten'], stats['offspring_count'],
+                         -1 if target_food is None else target_food, ref(org.target_organism),
+                         color[0], color[1]))
+        flag_rows.append((org.reproduction_ready, org.lifespan_scheduled,
+                          org.previous_position is org.position, target_position is not None,
+                          target_food is not None))
+        extra_rows.append((color[2], stats['distance_traveled'], stats['lifespan']))
+        target_rows.append((0.0, 0.0) if target_position is None else target_position)
+
+    vectors = np.empty((n, 4, 2))  # position, previous_position, velocity, target_position
+    vector_f32 = np.empty((n, 3), dtype=np.bool_)
+    for column, name in enumerate(('position', 'previous_position', 'velocity')):
+        values = [getattr(org, name) for org in organisms]
+        if n:
+            vectors[:, column] = values
+        vector_f32[:, column] = [value.dtype == np.float32 for value in values]
+    if n:
+        vectors[:, 3] = target_rows
+    floats = np.array([[getattr(org, field) for field in ORGANISM_FLOAT_FIELDS] for org in organisms],
+                      dtype=np.float64).reshape(n, len(ORGANISM_FLOAT_FIELDS))
+    codes = np.array(code_rows, dtype=np.int32).reshape(n, 6)
+    ints = np.array(int_rows, dtype=np.int64).reshape(n, 7)
+    flags = np.array(flag_rows, dtype=np.bool_).reshape(n, 5)
+    extra = np.array(extra_rows, dtype=np.float64).reshape(n, 3)
+
+    arrays.update({
+        'organism_slots': np.array(slots, dtype=np.int64),
+        'organism_floats': floats,
+        'organism_vectors': vectors,
+        'organism_vector_f32': vector_f32,
+        'organism_codes': codes,
+        'organism_ints': ints,
+        'organism_flags': flags,
+        'organism_extra': extra,
+        'organism_genes': genes
+    })
+
+    # --- Zamanlama çarkı (kova sırası korunur) ---
+    scheduler = world.scheduler
+    buckets = [bucket for level in scheduler.levels for bucket in level] + [scheduler.overflow]
+    overflow_index = len(buckets) - 1
+    event_rows = []
+    for bucket_index, bucket in enumerate(buckets):
+        for tick, item in bucket:
+            kind = EVENT_KINDS.index(item[0])
+            if item[0] == 'food_expiry':
+                event_rows.append((bucket_index, tick, kind, item[1], item[2]))
+            else:
+                event_rows.append((bucket_index, tick, kind, ref(item[1]), 0))
+    arrays['scheduler_events'] = np.array(event_rows, dtype=np.int64).reshape(-1, 5)
+    arrays['scheduler_overflow_index'] = np.array(overflow_index)
+
+    # Hayaletler: yalnızca pozisyon ve kimlik okunur
+    arrays['ghost_ids'] = np.array([ghost.organism_id for ghost in ghosts], dtype=np.int64)
+    arrays['ghost_positions'] = np.array([ghost.position for ghost in ghosts], dtype=np.float64).reshape(-1, 2)
+    arrays['ghost_f32'] = np.array([ghost.position.dtype == np.float32 for ghost in ghosts], dtype=np.bool_)
+
+    # --- Yiyecekler ---
+    store = world.food_store
+    size = store.size
+    for column in ('positions', 'energies', 'decay_rates', 'ages', 'moving', 'speeds',
+                   'directions', 'type_codes', 'alive', 'generations'):
+        arrays[f'food_{column}'] = getattr(store, column)[:size].copy()
+    food_slots = [i for i, food in enumerate(world.foods) if food is not None]
+    food_types = _CodeTable()
+    arrays['food_slots'] = np.array(food_slots, dtype=np.int64)
+    arrays['food_type_names'] = np.array([food_types.code(world.foods[i].food_type) for i in food_slots],
+                                         dtype=np.int32)
+    arrays['food_sizes'] = np.array([world.foods[i].size for i in food_slots], dtype=np.float64)
+    arrays['food_created_at'] = np.array([world.foods[i].stats['created_at'] for i in food_slots],
+                                         dtype=np.int64)
+    arrays['food_lifetimes'] = np.array([world.foods[i].stats['lifetime'] for i in food_slots],
+                                        dtype=np.float64)
+    arrays['free_food_slots'] = np.array(world.free_food_slots, dtype=np.int64)
+    arrays['free_organism_slots'] = np.array(world.free_organism_slots, dtype=np.int64)
+
+    # --- Uzamsal indeksler ---
+    for prefix, chunks in (('chunks', world.chunks), ('spatial_hash', world.spatial_hash)):
+        for name, array in _flatten_chunks(chunks).items():
+            arrays[f'{prefix}_{name}'] = array
+    arrays['active_chunks'] = np.array(sorted(world.active_chunks), dtype=np.int64).reshape(-1, 2)
+
+    # --- Koku alanı ve biome gürültüsü ---
+    scent = world.scent_field
+    arrays['scent_density'] = scent.density.copy()
+    arrays['scent_counts'] = scent.counts.copy()
+    arrays['scent_scent'] = scent.scent.copy()
+    arrays['scent_food_cells'] = scent.food_cells.copy()
+    arrays['biome_noise'] = world.biome_noise.copy()
+
+    # --- Rastgele sayı üreteçleri ---
+    py_version, py_internal, py_gauss = random.getstate()
+    np_kind, np_keys, np_pos, np_has_gauss, np_gauss = np.random.get_state()
+    arrays['rng_python'] = np.array(py_internal, dtype=np.uint64)
+    arrays['rng_numpy'] = np.array(np_keys, dtype=np.uint32)
+
+    # --- Skalerler ve sözlükler ---
+    spawner = simulation.food_spawner
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'created_at': time.time(),
+        'simulation': {
+            'frame_count': simulation.frame_count,
+            'current_time': simulation.current_time,
+            'accumulator': simulation.accumulator,
+            'fixed_dt': simulation.fixed_dt,
+            'stats': encode_series(simulation.stats)
+        },
+        'world': {
+            'size': world.size.tolist(),
+            'stats': world.stats,
+            'noise_seed': world.noise_seed,
+            'energy_decay': world.energy_decay,
+            'max_organisms': getattr(world, 'max_organisms', None),
+            'organism_list_length': len(world.organisms),
+            'food_list_length': len(world.foods),
+            'biome_fertility': {key: biome.fertility for key, biome in world.biomes.items()}
+        },
+        'organisms': {
+            'gene_names': gene_names,
+            'species': species.values,
+            'diets': diets.values,
+            'states': states.values,
+            'behaviors': behaviors.values,
+            'causes': causes.values,
+            'traits': traits.values
+        },
+        'foods': {
+            'type_names': food_types.values,
+            'capacity': store.capacity
+        },
+        'scheduler': {
+            'now': scheduler.now,
+            'pending': scheduler.pending,
+            'stats': scheduler.stats,
+            'level_bits': list(scheduler.level_bits),
+            'tick_seconds': scheduler.tick_seconds
+        },
+        'scent': {
+            'shape': list(scent.shape),
+            'ticks_since_blur': scent.ticks_since_blur,
+            'stats': scent.stats
+        },
+        'neighborhood': {
+            'tick': world.neighborhood.tick,
+            'species_codes': world.neighborhood.species_codes
+        },
+        'spawner': {
+            'spawn_config': spawner.spawn_config,
+            'stats': spawner.stats,
+            'world_size': list(spawner.world_size)
+        },
+        'rng': {
+            'python': [py_version, py_gauss],
+            'numpy': [np_kind, np_pos, np_has_gauss, np_gauss]
+        },
+        'scenario': _scenario_state(scenario_handler),
+        'counts': {
+            'organisms': n,
+            'foods': len(food_slots),
+            'scheduled_events': len(event_rows)
+        }
+    }
+    arrays['meta'] = _encode_json(meta)
+    return arrays
+
+
+def write_checkpoint(path, arrays: Dict[str, np.ndarray], compress: bool = True) -> Path:
+    """Yakalanan durumu .npz dosyasına atomik olarak yaz
+
+    Önce geçici dosyaya yazılır, ardından ``os.replace`` ile yerine
+    taşınır; yazma yarıda kesilse bile eski checkpoint bozulmaz.
+    """
+    path = Path(path)
+    if path.suffix != '.npz':
+        path = path.with_suffix('.npz')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    save = np.savez_compressed if compress else np.savez
+    with open(temp_path, 'wb') as f:
+        save(f, **arrays)
+    os.replace(temp_path, path)
+    return path
+
+
+def read_checkpoint(path) -> Dict[str, np.ndarray]:
+    """Checkpoint dosyasındaki tüm dizileri belleğe oku"""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = _decode_json(arrays['meta'])
+    if meta.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Desteklenmeyen checkpoint sürümü: {meta.get('version')}")
+    return arrays
+
+
+def _lookup(table: List[Any], codes: np.ndarray) -> List[Any]:
+    """Kod dizisini tablo değerleri listesine çevir (-1 = None)"""
+    values = np.empty(len(table) + 1, dtype=object)
+    for i, value in enumerate(table):
+        values[i] = value
+    return values[codes].tolist()
+
+
+def _build_ghost(organism_class, organism_id: int, position: np.ndarray):
+    """Dünyadan çıkmış ama referansı süren organizma için hafif nesne"""
+    ghost = organism_class.__new__(organism_class)
+    ghost.__dict__.update({
+        'organism_id': organism_id,
+        'position': position,
+        'previous_position': position,
+        'alive': False,
+        'reproduction_ready': False
+    })
+    return ghost
+
+
+def restore_state(simulation, arrays: Dict[str, np.ndarray], scenario_handler=None):
+    """capture_state çıktısını mevcut simülasyona uygula
+
+    Simülasyon aynı yapılandırmayla oluşturulmuş olmalıdır; dünya,
+    organizmalar, yiyecekler, zamanlama çarkı ve RNG durumları
+    checkpoint'tekiyle değiştirilir. Organizmalar ``__init__``
+    çağrılmadan doğrudan alanlarıyla kurulur.
+    """
+    from .organism import Organism, DNA
+    from .food import Food
+
+    meta = _decode_json(arrays['meta'])
+    world = simulation.world
+    sim_meta = meta['simulation']
+    world_meta = meta['world']
+    org_meta = meta['organisms']
+
+    if abs(sim_meta['fixed_dt'] - simulation.fixed_dt) > 1e-12:
+        logger.warning(f"⚠️  Checkpoint fixed_dt={sim_meta['fixed_dt']} yapılandırmadan farklı, checkpoint değeri kullanılıyor")
+        simulation.fixed_dt = sim_meta['fixed_dt']
+        simulation.stats_interval_ticks = max(1, int(round(1.0 / simulation.fixed_dt)))
+
+    # --- Simülasyon skalerleri ---
+    simulation.frame_count = sim_meta['frame_count']
+    simulation.current_time = sim_meta['current_time']
+    simulation.accumulator = sim_meta['accumulator']
+    simulation.stats = decode_series(sim_meta['stats'], simulation._create_history())
+
+    # --- Dünya ve çevre ---
+    world.size = np.array(world_meta['size'], dtype=np.float32)
+    world.stats = world_meta['stats']
+    world.noise_seed = world_meta['noise_seed']
+    world.energy_decay = world_meta['energy_decay']
+    if world_meta['max_organisms'] is not None:
+        world.max_organisms = world_meta['max_organisms']
+    world.biome_noise = arrays['biome_noise']
+    for key, fertility in world_meta['biome_fertility'].items():
+        biome = world.biomes[key]
+        biome.fertility = fertility
+        biome.food_spawn_rate = fertility * 0.5 + 0.1
+        biome.organism_energy_cost = (1.0 - fertility) * 0.3 + 0.7
+    world.biome_food_rates = np.array([world.biomes[key].food_spawn_rate for key in world.biome_keys])
+
+    # --- Organizmalar (sütun sütun; organizma başına tek sözlük güncellemesi) ---
+    slots = arrays['organism_slots'].tolist()
+    n = len(slots)
+    floats = arrays['organism_floats']
+    codes = arrays['organism_codes']
+    ints = arrays['organism_ints']
+    flags = arrays['organism_flags']
+    extra = arrays['organism_extra']
+
+    species = _lookup(org_meta['species'], codes[:, 0])
+    diets = _lookup(org_meta['diets'], codes[:, 1])
+    causes = _lookup(org_meta['causes'], codes[:, 4])
+    # Aynı türün organizmaları tür özelliklerini paylaşır (yalnızca okunur)
+    traits = _lookup([json.loads(value) for value in org_meta['traits']], codes[:, 5])
+
+    gene_names = org_meta['gene_names']
+    genes = arrays['organism_genes']
+    if np.isnan(genes).any():
+        present = (~np.isnan(genes)).tolist()
+        gene_dicts = [{name: value for name, value, ok in zip(gene_names, row, mask) if ok}
+                      for row, mask in zip(genes.tolist(), present)]
+    else:
+        gene_dicts = [dict(zip(gene_names, row)) for row in genes.tolist()]
+    dna_new = DNA.__new__
+    dnas = [dna_new(DNA) for _ in range(n)]
+    for dna, gene_dict in zip(dnas, gene_dicts):
+        dna.genes = gene_dict
+
+    # Vektörler iki blok dizinin (float32/float64) satır görünümleri olarak verilir
+    vectors = arrays['organism_vectors']
+    vector_f32 = arrays['organism_vector_f32']
+    vector_columns = []
+    for column in range(3):
+        use_f32 = vector_f32[:, column]
+        if use_f32.all():
+            vector_columns.append(list(vectors[:, column].astype(np.float32)))
+        elif not use_f32.any():
+            vector_columns.append(list(vectors[:, column].copy()))
+        else:
+            as_f32 = list(vectors[:, column].astype(np.float32))
+            as_f64 = list(vectors[:, column].copy())
+            vector_columns.append([f32 if is_f32 else f64 for f32, f64, is_f32
+                                   in zip(as_f32, as_f64, use_f32.tolist())])
+    positions, previous, velocities = vector_columns
+    aliased, has_target_position, has_target_food = flags[:, 2].tolist(), flags[:, 3].tolist(), flags[:, 4].tolist()
+    previous = [position if alias else prev for position, prev, alias in zip(positions, previous, aliased)]
+    target_positions = [target if has else None for target, has
+                        in zip(list(vectors[:, 3].copy()), has_target_position)]
+    target_foods = [food if has else None for food, has in zip(ints[:, 3].tolist(), has_target_food)]
+    colors = list(zip(ints[:, 5].tolist(), ints[:, 6].tolist(), extra[:, 0].astype(np.int64).tolist()))
+    stats = [{
+        'food_eaten': food_eaten,
+        'offspring_count': offspring_count,
+        'distance_traveled': distance,
+        'lifespan': lifespan,
+        'cause_of_death': cause,
+        'species': species_name,
+        'diet_type': diet_type
+    } for food_eaten, offspring_count, distance, lifespan, cause, species_name, diet_type in zip(
+        ints[:, 1].tolist(), ints[:, 2].tolist(), extra[:, 1].tolist(), extra[:, 2].tolist(),
+        causes, species, diets)]
+
+    keys = ORGANISM_FLOAT_FIELDS + [
+        'organism_id', 'position', 'previous_position', 'velocity', 'species', 'species_traits',
+        'diet_type', 'dna', 'color', 'state', 'behavior_state', 'target_position', 'target_food',
+        'stats', 'reproduction_ready', 'lifespan_scheduled'
+    ]
+    columns = floats.T.tolist() + [
+        ints[:, 0].tolist(), positions, previous, velocities, species, traits,
+        diets, dnas, colors, _lookup(org_meta['states'], codes[:, 2]),
+        _lookup(org_meta['behaviors'], codes[:, 3]), target_positions, target_foods,
+        stats, flags[:, 0].tolist(), flags[:, 1].tolist()
+    ]
+    constants = {
+        'target_organism': None,
+        'social_group': None,
+        'alive': True,
+        'sense_row': -1,
+        'sense_tick': -1
+    }
+
+    organism_new = Organism.__new__
+    organisms_list: List[Any] = [None] * world_meta['organism_list_length']
+    for slot, values in zip(slots, zip(*columns)):
+        org = organism_new(Organism)
+        state = dict(zip(keys, values))
+        state.update(constants)
+        state['relationships'] = {}
+        org.__dict__.update(state)
+        organisms_list[slot] = org
+
+    ghosts = [_build_ghost(Organism, ghost_id, position.astype(np.float32) if use_f32 else position.copy())
+              for ghost_id, position, use_f32 in zip(arrays['ghost_ids'].tolist(), arrays['ghost_positions'],
+                                                     arrays['ghost_f32'].tolist())]
+
+    def resolve(code: int):
+        if code == NO_REF:
+            return None
+        if code >= 0:
+            return organisms_list[code]
+        return ghosts[-2 - code]
+
+    for slot, code in zip(slots, ints[:, 4].tolist()):
+        if code != NO_REF:
+            organisms_list[slot].target_organism = resolve(code)
+    world.organisms = organisms_list
+    if 'free_organism_slots' in arrays:
+        world.free_organism_slots = arrays['free_organism_slots'].tolist()
+    else:
+        # Eski checkpoint'lerde boş slot listesi yok; None slot'lardan kur
+        world.free_organism_slots = [i for i, org in enumerate(organisms_list) if org is None]
+
+    # --- Yiyecekler ---
+    store = world.food_store
+    food_meta = meta['foods']
+    store.capacity = 0
+    store.size = 0
+    store._allocate(max(1, food_meta['capacity']))
+    size = len(arrays['food_alive'])
+    for column in ('positions', 'energies', 'decay_rates', 'ages', 'moving', 'speeds',
+                   'directions', 'type_codes', 'alive', 'generations'):
+        getattr(store, column)[:size] = arrays[f'food_{column}']
+    store.size = size
+
+    foods_list: List[Any] = [None] * world_meta['food_list_length']
+    type_names = food_meta['type_names']
+    bound = Food.bound_to_store
+    for slot, type_code, food_size, created_at, lifetime in zip(
+            arrays['food_slots'].tolist(), arrays['food_type_names'].tolist(),
+            arrays['food_sizes'].tolist(), arrays['food_created_at'].tolist(),
+            arrays['food_lifetimes'].tolist()):
+        food = bound(store, slot, type_names[type_code], food_size, created_at)
+        food.stats['lifetime'] = lifetime
+        foods_list[slot] = food
+    world.foods = foods_list
+    world.free_food_slots = arrays['free_food_slots'].tolist()
+
+    # --- Uzamsal indeksler ---
+    world.chunks = _unflatten_chunks(arrays, 'chunks')
+    world.spatial_hash = _unflatten_chunks(arrays, 'spatial_hash')
+    world.active_chunks = {tuple(key) for key in arrays['active_chunks'].tolist()}
+
+    # --- Zamanlama çarkı ---
+    scheduler = world.scheduler
+    sched_meta = meta['scheduler']
+    if tuple(sched_meta['level_bits']) != tuple(scheduler.level_bits):
+        raise ValueError(f"Zamanlama çarkı seviyeleri uyuşmuyor: {sched_meta['level_bits']}")
+    scheduler.clear()
+    scheduler.now = sched_meta['now']
+    scheduler.pending = sched_meta['pending']
+    scheduler.stats = sched_meta['stats']
+    scheduler.tick_seconds = sched_meta['tick_seconds']
+    buckets = [bucket for level in scheduler.levels for bucket in level] + [scheduler.overflow]
+    food_expiry = EVENT_KINDS.index('food_expiry')
+    for bucket_index, tick, kind, a, b in arrays['scheduler_events'].tolist():
+        if kind == food_expiry:
+            item = ('food_expiry', a, b)
+        else:
+            item = (EVENT_KINDS[kind], resolve(a))
+        buckets[bucket_index].append((tick, item))
+
+    # --- Koku alanı ---
+    scent = world.scent_field
+    scent_meta = meta['scent']
+    scent.shape = tuple(scent_meta['shape'])
+    scent.density = arrays['scent_density'].copy()
+    scent.counts = arrays['scent_counts'].copy()
+    scent.scent = arrays['scent_scent'].copy()
+    scent.food_cells = arrays['scent_food_cells'].copy()
+    scent.ticks_since_blur = scent_meta['ticks_since_blur']
+    scent.stats = scent_meta['stats']
+
+    # --- Komşuluk algılayıcısı ---
+    world.neighborhood.tick = meta['neighborhood']['tick']
+    world.neighborhood.species_codes = dict(meta['neighborhood']['species_codes'])
+
+    # --- Yiyecek üretici (yapılandırma nesnesi paylaşıldığı için yerinde güncellenir) ---
+    spawner = simulation.food_spawner
+    spawner_meta = meta['spawner']
+    spawner.spawn_config.clear()
+    spawner.spawn_config.update(spawner_meta['spawn_config'])
+    spawner.stats = spawner_meta['stats']
+    spawner.world_size = tuple(spawner_meta['world_size'])
+    spawner.attach_world(world)
+
+    # --- Senaryo ---
+    _restore_scenario(scenario_handler, meta['scenario'])
+
+    # --- Rastgele sayı üreteçleri (en son: yukarıdaki adımlar RNG tüketmez) ---
+    py_version, py_gauss = meta['rng']['python']
+    random.setstate((py_version, tuple(arrays['rng_python'].tolist()), py_gauss))
+    np_kind, np_pos, np_has_gauss, np_gauss = meta['rng']['numpy']
+    np.random.set_state((np_kind, arrays['rng_numpy'], np_pos, np_has_gauss, np_gauss))
+
+    return meta
+
+
+class CheckpointWriter:
+    """Periyodik checkpoint'leri arka plan thread'inde diske yazar
+
+    Durum ana thread'de tick aralarında yakalanır (tutarlı anlık görüntü),
+    sıkıştırma ve disk yazımı arka planda yapılır. Önceki yazım sürerken
+    gelen checkpoint atlanır; simülasyon diski beklemez.
+    """
+
+    def __init__(self, checkpoint_config: Optional[Dict[str, Any]] = None,
+                 fixed_dt: float = 1.0 / 60.0):
+        """
+        Args:
+            checkpoint_config: ``simulation.checkpoint`` yapılandırması
+                (interval_seconds, directory, keep, compress)
+            fixed_dt: Simülasyon adımı (saniye)
+        """
+        checkpoint_config = checkpoint_config or {}
+        self.interval_seconds = float(checkpoint_config.get('interval_seconds', 60.0))
+        self.interval_ticks = max(1, int(round(self.interval_seconds / fixed_dt)))
+        self.directory = Path(checkpoint_config.get('directory', 'data/checkpoints'))
+        self.keep = int(checkpoint_config.get('keep', 3))
+        self.compress = bool(checkpoint_config.get('compress', True))
+
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+        self._written: List[Path] = []
+
+        self.stats = {
+            'captured': 0,
+            'written': 0,
+            'skipped': 0,
+            'failed': 0,
+            'last_capture_seconds': 0.0,
+            'last_write_seconds': 0.0,
+            'last_path': None
+        }
+
+        logger.info(f"💾 CheckpointWriter: her {self.interval_seconds:.0f} sn ({self.interval_ticks} tick) -> {self.directory}")
+
+    def _ensure_thread(self):
+        """Yazıcı thread'ini ilk checkpoint'te başlat"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='ecosim-checkpoint', daemon=True)
+            self._thread.start()
+
+    def maybe_save(self, simulation, scenario_handler=None):
+        """Aralık dolduysa durumu yakala ve yazım kuyruğuna ekle"""
+        if simulation.frame_count % self.interval_ticks != 0:
+            return
+        if self._queue.full():
+            self.stats['skipped'] += 1
+            logger.warning("⚠️  Önceki checkpoint hâlâ yazılıyor, bu checkpoint atlandı")
+            return
+        start = time.perf_counter()
+        with _gc_paused():
+            arrays = capture_state(simulation, scenario_handler)
+        self.stats['last_capture_seconds'] = time.perf_counter() - start
+        self.stats['captured'] += 1
+        path = self.directory / f'checkpoint_{simulation.frame_count:010d}.npz'
+        self._ensure_thread()
+        self._queue.put((path, arrays))
+
+    def _run(self):
+        """Kuyruktaki checkpoint'leri sırayla yaz"""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                path, arrays = job
+                start = time.perf_counter()
+                path = write_checkpoint(path, arrays, compress=self.compress)
+                self.stats['last_write_seconds'] = time.perf_counter() - start
+                self.stats['written'] += 1
+                self.stats['last_path'] = str(path)
+                self._written.append(path)
+                self._prune()
+                logger.info(f"💾 Checkpoint yazıldı: {path} ({self.stats['last_write_seconds']:.2f} sn)")
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.error(f"Checkpoint yazılırken hata: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _prune(self):
+        """En yeni ``keep`` checkpoint dışındakileri sil"""
+        if self.keep <= 0:
+            return
+        while len(self._written) > self.keep:
+            old = self._written.pop(0)
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def flush(self):
+        """Bekleyen yazımın bitmesini bekle"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Bekleyen yazımı bitir ve thread'i durdur"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Checkpoint istatistiklerini döndür"""
+        return dict(self.stats, interval_ticks=self.interval_ticks, directory=str(self.directory))
+
+
+def save_checkpoint(simulation, path, scenario_handler=None, compress: bool = True) -> Path:
+    """Simülasyonu eşzamanlı olarak checkpoint dosyasına kaydet"""
+    start = time.perf_counter()
+    with _gc_paused():
+        arrays = capture_state(simulation, scenario_handler)
+    path = write_checkpoint(path, arrays, compress=compress)
+    logger.info(f"💾 Checkpoint kaydedildi: {path} ({time.perf_counter() - start:.2f} sn)")
+    return path
+
+
+def load_checkpoint(simulation, path, scenario_handler=None) -> Dict[str, Any]:
+    """Checkpoint dosyasını simülasyona yükle, meta verisini döndür"""
+    start = time.perf_counter()
+    with _gc_paused():
+        meta = restore_state(simulation, read_checkpoint(path), scenario_handler)
+    counts = meta['counts']
+    logger.info(f"📂 Checkpoint yüklendi: {path} (tick {meta['simulation']['frame_count']}, "
+                f"{counts['organisms']} organizma, {counts['foods']} yiyecek, "
+                f"{time.perf_counter() - start:.2f} sn)")
+    return meta
@@ -0,0 +1,303 @@
+"""
+Ecosim Engine - Gömülebilir Adım Adım Simülasyon API'si
+"""
+
+import random
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+from .simulation import Simulation
+from .food import FOOD_TYPE_CODES
+from .utils import logger, get_event_log
+
+# Gen matrisi sütun sırası (DNA varsayılan genleriyle aynı)
+GENE_NAMES = [
+    'speed',
+    'vision_range',
+    'energy_efficiency',
+    'reproduction_threshold',
+    'mutation_rate',
+    'aggression',
+    'size',
+    'color_r',
+    'color_g',
+    'color_b',
+    'lifespan',
+    'metabolism',
+    'social_attraction',
+    'exploration_tendency'
+]
+GENE_INDEX = {name: i for i, name in enumerate(GENE_NAMES)}
+
+FOOD_TYPE_NAMES = sorted(FOOD_TYPE_CODES, key=FOOD_TYPE_CODES.get)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Dizinin salt okunur görünümü (taban dizi yazılabilir kalır)"""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class Engine:
+    """pygame'siz, programatik olarak sürülen simülasyon
+
+    ``Simulation``'ı headless kurar ve ``step(n)`` ile sabit ``fixed_dt``
+    adımlarını duvar saatinden bağımsız, tam hızda çalıştırır. Durum NumPy
+    dizileri olarak okunur:
+
+    - Yiyecek sütunları ``FoodStore`` dizilerinin kopyasız görünümleridir.
+    - Organizmalar nesne olduğundan sütunları tick başına bir kez, ilk
+      erişimde yeniden kullanılan tamponlara toplanır; aynı tick içindeki
+      sonraki erişimler aynı dizileri döndürür.
+
+    Dönen diziler salt okunurdur ve bir sonraki ``step`` çağrısına kadar
+    geçerlidir; saklanacaksa kopyalanmalıdır.
+    """
+
+    def __init__(self, config: Dict[str, Any], seed: Optional[int] = None, scenario: Optional[str] = None):
+        """
+        Args:
+            config: Simülasyon yapılandırması
+            seed: ``random`` ve ``np.random`` tohumu (None: tohumlanmaz)
+            scenario: Senaryo adı (None: senaryosuz)
+        """
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+
+        self.simulation = Simulation(config, headless=True)
+        self.scenario_handler = None
+        if scenario:
+            from .scenario_handler import ScenarioHandler
+            self.scenario_handler = ScenarioHandler(scenario, self.simulation)
+
+        # Organizma sütun tamponları (kapasite gerektikçe ikiye katlanır)
+        self._capacity = 0
+        self._gathered_tick = -1
+        self._count = 0
+        self._allocate(max(1, len(self.simulation.world.organisms)))
+
+        # Tür kod tablosu koşu boyunca sabittir (tampon büyümesi kodları değiştirmez)
+        self.species_names: List[str] = []
+        self._species_codes: Dict[str, int] = {}
+
+        self.stats = {
+            'steps': 0,
+            'ticks': 0,
+            'gathers': 0
+        }
+
+        logger.info(f"🧩 Engine oluşturuldu (seed={seed})")
+
+    def _allocate(self, capacity: int):
+        """Organizma sütun tamponlarını oluştur"""
+        self._capacity = capacity
+        self._slots = np.zeros(capacity, dtype=np.int64)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._positions = np.zeros((capacity, 2), dtype=np.float64)
+        self._velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self._energies = np.zeros(capacity, dtype=np.float64)
+        self._ages = np.zeros(capacity, dtype=np.float64)
+        self._genes = np.zeros((capacity, len(GENE_NAMES)), dtype=np.float64)
+        self._species = np.zeros(capacity, dtype=np.int32)
+
+    # --- Adım ---
+
+    @property
+    def world(self):
+        return self.simulation.world
+
+    @property
+    def tick(self) -> int:
+        return self.simulation.frame_count
+
+    @property
+    def time(self) -> float:
+        return self.simulation.current_time
+
+    def step(self, n: int = 1) -> int:
+        """n sabit adım çalıştır, güncel tick'i döndür"""
+        simulation = self.simulation
+        step = simulation._step
+        dt = simulation.fixed_dt
+        scenario_handler = self.scenario_handler
+        for _ in range(int(n)):
+            step(dt, scenario_handler)
+        self.stats['steps'] += 1
+        self.stats['ticks'] += int(n)
+        return simulation.frame_count
+
+    # --- Organizma sütunları ---
+
+    def _gather(self):
+        """Canlı organizmaları sütun tamponlarına topla (tick başına bir kez)"""
+        if self._gathered_tick == self.tick:
+            return
+        organisms = self.world.organisms
+        slots = [i for i, org in enumerate(organisms) if org is not None]
+        n = len(slots)
+        if n > self._capacity:
+            capacity = self._capacity
+            while capacity < n:
+                capacity *= 2
+            self._allocate(capacity)
+
+        species_codes = self._species_codes
+        for row, slot in enumerate(slots):
+            org = organisms[slot]
+            genes = org.dna.genes
+            self._ids[row] = org.organism_id
+            self._positions[row] = org.position
+            self._velocities[row] = org.velocity
+            self._energies[row] = org.energy
+            self._ages[row] = org.age
+            self._genes[row] = [genes.get(name, np.nan) for name in GENE_NAMES]
+            code = species_codes.get(org.species)
+            if code is None:
+                code = species_codes[org.species] = len(self.species_names)
+                self.species_names.append(org.species)
+            self._species[row] = code
+        self._slots[:n] = slots
+
+        self._count = n
+        self._gathered_tick = self.tick
+        self.stats['gathers'] += 1
+
+    def _column(self, array: np.ndarray) -> np.ndarray:
+        self._gather()
+        return _read_only(array[:self._count])
+
+    @property
+    def organism_count(self) -> int:
+        self._gather()
+        return self._count
+
+    @property
+    def organism_slots(self) -> np.ndarray:
+        """``world.organisms`` indeksleri (n,)"""
+        return self._column(self._slots)
+
+    @property
+    def organism_ids(self) -> np.ndarray:
+        return self._column(self._ids)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Organizma pozisyonları (n, 2)"""
+        return self._column(self._positions)
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._column(self._velocities)
+
+    @property
+    def energies(self) -> np.ndarray:
+        return self._column(self._energies)
+
+    @property
+    def ages(self) -> np.ndarray:
+        return self._column(self._ages)
+
+    @property
+    def genes(self) -> np.ndarray:
+        """Gen matrisi (n, len(GENE_NAMES)); sütun sırası GENE_NAMES"""
+        return self._column(self._genes)
+
+    @property
+    def species(self) -> np.ndarray:
+        """Tür kodları (n,); adlar ``species_names`` içinde"""
+        return self._column(self._species)
+
+    def gene(self, name: str) -> np.ndarray:
+        """Tek bir genin sütunu (n,)"""
+        return self.genes[:, GENE_INDEX[name]]
+
+    def organism_at(self, row: int):
+        """Sütun satırındaki Organism nesnesi"""
+        return self.world.organisms[int(self.organism_slots[row])]
+
+    # --- Yiyecek sütunları (FoodStore görünümleri) ---
+
+    def _food_column(self, name: str) -> np.ndarray:
+        store = self.world.food_store
+        return _read_only(getattr(store, name)[:store.size])
+
+    @property
+    def food_alive(self) -> np.ndarray:
+        """Yiyecek slot'larının canlılık maskesi; tüm food_* dizileri slot indekslidir"""
+        return self._food_column('alive')
+
+    @property
+    def food_positions(self) -> np.ndarray:
+        return self._food_column('positions')
+
+    @property
+    def food_energies(self) -> np.ndarray:
+        return self._food_column('energies')
+
+    @property
+    def food_ages(self) -> np.ndarray:
+        return self._food_column('ages')
+
+    @property
+    def food_types(self) -> np.ndarray:
+        """Yiyecek tür kodları; adlar FOOD_TYPE_NAMES sırasıyla"""
+        return self._food_column('type_codes')
+
+    @property
+    def food_moving(self) -> np.ndarray:
+        return self._food_column('moving')
+
+    # --- Toplu erişim ---
+
+    def state(self) -> Dict[str, Any]:
+        """Tüm sütunları tek sözlükte döndür"""
+        return {
+            'tick': self.tick,
+            'time': self.time,
+            'organism_slots': self.organism_slots,
+            'organism_ids': self.organism_ids,
+            'positions': self.positions,
+            'velocities': self.velocities,
+            'energies': self.energies,
+            'ages': self.ages,
+            'genes': self.genes,
+            'gene_names': GENE_NAMES,
+            'species': self.species,
+            'species_names': list(self.species_names),
+            'food_alive': self.food_alive,
+            'food_positions': self.food_positions,
+            'food_energies': self.food_energies,
+            'food_types': self.food_types,
+            'food_type_names': FOOD_TYPE_NAMES
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Simülasyon ve motor istatistiklerini döndür"""
+        return dict(self.simulation.get_statistics(), engine=dict(self.stats))
+
+    def close(self):
+        """Thread havuzunu, açık yazıcıları ve sunucuları kapat (sonuç JSON'u yazılmaz; akış açıksa özeti eklenir)"""
+        simulation = self.simulation
+        get_event_log().flush()
+        simulation.world.neighborhood.pool.close()
+        if simulation.checkpointer is not None:
+            simulation.checkpointer.close()
+        if simulation.recorder is not None:
+            simulation.recorder.close()
+        if simulation.telemetry is not None:
+            simulation.telemetry.close()
+        if simulation.exporter is not None:
+            simulation.exporter.finish(simulation)
+        if simulation.render_bridge is not None:
+            simulation.render_bridge.close()
+            simulation.render_bridge = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
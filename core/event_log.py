@@ -0,0 +1,218 @@
+"""
+Ecosim Event Log - Tamponlu, Toplu Yazılan Organizma Olay Günlüğü
+"""
+
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .event_store import ColumnarEventSink, DEFAULT_EVENT_STORE_PATH
+from .utils import logger
+
+DEFAULT_EVENT_LOG_PATH = 'data/logs/organism_events.jsonl'
+
+_zstandard = {}
+
+
+def _get_zstandard():
+    """zstandard modülünü döndür (yoksa None), ilk çağrıda yüklenir"""
+    if 'module' not in _zstandard:
+        try:
+            import zstandard
+            _zstandard['module'] = zstandard
+        except ImportError:
+            _zstandard['module'] = None
+            logger.warning("⚠️  zstandard bulunamadı, olay günlüğü gzip ile sıkıştırılacak")
+    return _zstandard['module']
+
+
+class EventLogWriter:
+    """Organizma olaylarını bellekte biriktirip arka plan thread'inde toplu yazar
+
+    ``emit`` yalnızca olayı listeye ekler; dosya açık tutulur ve tampon
+    ``flush_interval`` saniyede bir ya da ``max_buffer`` olaya ulaşınca
+    tek seferde JSON satırları olarak yazılır. Aktif dosya ``rotate_mb``
+    boyutuna ya da ``rotate_seconds`` yaşına ulaşınca zaman damgalı bir
+    parçaya taşınır ve istenirse gzip/zstd ile sıkıştırılır; en yeni
+    ``keep`` parça saklanır.
+
+    ``format: columnar`` ile olaylar JSON yerine ``ColumnarEventSink``
+    üzerinden tipli sütun parçalarına yazılır (``path`` bir dizindir;
+    döndürme ve sıkıştırma ayarları kullanılmaz, parçalar zaten
+    yalnızca eklenir).
+    """
+
+    def __init__(self, event_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            event_config: Günlük ayarları (enabled, format, path, flush_interval, max_buffer,
+                rotate_mb, rotate_seconds, compression, keep, console, chunk_rows,
+                chunk_seconds, backend)
+        """
+        event_config = event_config or {}
+        self.enabled = bool(event_config.get('enabled', True))
+        self.format = event_config.get('format', 'jsonl')
+        if self.format not in ('jsonl', 'columnar'):
+            raise ValueError(f"Bilinmeyen olay günlüğü biçimi: {self.format}")
+        default_path = DEFAULT_EVENT_LOG_PATH if self.format == 'jsonl' else DEFAULT_EVENT_STORE_PATH
+        self.path = Path(event_config.get('path', default_path))
+        self.flush_interval = float(event_config.get('flush_interval', 1.0))
+        self.max_buffer = max(1, int(event_config.get('max_buffer', 10000)))
+        rotate_mb = event_config.get('rotate_mb', 64)
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024) if rotate_mb else None
+        self.rotate_seconds = event_config.get('rotate_seconds')
+        self.compression = event_config.get('compression')
+        if self.compression not in (None, 'gzip', 'zstd'):
+            raise ValueError(f"Bilinmeyen sıkıştırma: {self.compression}")
+        self.keep = event_config.get('keep')
+        self.console = bool(event_config.get('console', False))
+        # frame bilgisi verilmeyen olaylar için simülasyonun güncel tick'i
+        self.tick = 0
+
+        self._sink = None
+        if self.format == 'columnar':
+            self._sink = ColumnarEventSink(self.path,
+                                           chunk_rows=event_config.get('chunk_rows', 65536),
+                                           chunk_seconds=event_config.get('chunk_seconds', 60.0),
+                                           backend=event_config.get('backend', 'auto'))
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._file = None
+        self._file_bytes = 0
+        self._file_opened = 0.0
+        self._thread = None
+
+        self.stats = {
+            'events': 0,
+            'flushes': 0,
+            'bytes_written': 0,
+            'rotations': 0
+        }
+
+    def emit(self, event: Dict[str, Any]):
+        """Olayı tampona ekle (dosyaya dokunmaz)"""
+        if not self.enabled:
+            return
+        if self._thread is None:
+            self._start()
+        with self._lock:
+            self._buffer.append(event)
+            pending = len(self._buffer)
+        self.stats['events'] += 1
+        if self._closed:
+            self.flush()
+        elif pending >= self.max_buffer:
+            self._wake.set()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name='ecosim-event-log', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Olay günlüğü yazılamadı: {e}")
+
+    def flush(self):
+        """Tampondaki olayları dosyaya yaz"""
+        with self._lock:
+            events, self._buffer = self._buffer, []
+        with self._write_lock:
+            if self._sink is not None:
+                # Sink parçayı doldurana ya da bekleme süresi dolana kadar biriktirir
+                written = self._sink.stats['bytes_written']
+                self._sink.write(events)
+                if self._sink.stats['bytes_written'] != written:
+                    self.stats['bytes_written'] = self._sink.stats['bytes_written']
+                    self.stats['flushes'] += 1
+                return
+            if events:
+                data = ''.join(json.dumps(event, ensure_ascii=False) + '\n' for event in events).encode('utf-8')
+                if self._file is None:
+                    self._open()
+                self._file.write(data)
+                self._file.flush()
+                self._file_bytes += len(data)
+                self.stats['bytes_written'] += len(data)
+                self.stats['flushes'] += 1
+            if self._file is not None and self._should_rotate():
+                self._rotate()
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._file_bytes = self._file.tell()
+        self._file_opened = time.time()
+
+    def _should_rotate(self) -> bool:
+        if self.rotate_bytes and self._file_bytes >= self.rotate_bytes:
+            return True
+        return bool(self.rotate_seconds) and time.time() - self._file_opened >= self.rotate_seconds
+
+    def _rotate(self):
+        """Aktif dosyayı zaman damgalı parçaya taşı, sıkıştır ve eski parçaları sil"""
+        self._file.close()
+        self._file = None
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        segment = self.path.with_name(f"{self.path.stem}.{stamp}.{self.stats['rotations']:04d}{self.path.suffix}")
+        os.replace(self.path, segment)
+        if self.compression:
+            segment = self._compress(segment)
+        self.stats['rotations'] += 1
+        logger.info(f"🗂️  Olay günlüğü döndürüldü: {segment.name}")
+        if self.keep:
+            for old in self.segments()[:-int(self.keep)]:
+                old.unlink()
+
+    def _compress(self, segment: Path) -> Path:
+        zstandard = _get_zstandard() if self.compression == 'zstd' else None
+        if zstandard is not None:
+            target = segment.with_name(segment.name + '.zst')
+            with open(segment, 'rb') as src, open(target, 'wb') as dst:
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+        else:
+            target = segment.with_name(segment.name + '.gz')
+            with open(segment, 'rb') as src, gzip.open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        segment.unlink()
+        return target
+
+    def segments(self) -> List[Path]:
+        """Döndürülmüş parçalar (eskiden yeniye)"""
+        return sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}*"))
+
+    def close(self):
+        """Thread'i durdur, kalan olayları yaz ve dosyayı kapat"""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        self.flush()
+        with self._write_lock:
+            if self._sink is not None:
+                self._sink.close()
+                self.stats['bytes_written'] = self._sink.stats['bytes_written']
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Günlük istatistiklerini döndür"""
+        with self._lock:
+            pending = len(self._buffer)
+        return dict(self.stats, pending=pending, path=str(self.path))
@@ -0,0 +1,464 @@
+"""
+Ecosim Event Store - Sütunlu, Parçalı Organizma Olay Deposu ve Sorgulama
+"""
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .utils import logger
+
+DEFAULT_EVENT_STORE_PATH = 'data/logs/organism_events'
+
+# Her olayda bulunan sabit sütunlar; geri kalan alanlar olaydan türetilir
+CORE_COLUMNS = {
+    'tick': np.int64,
+    'timestamp': np.float64,
+    'organism_id': np.int64,
+    'event_type': np.int16
+}
+
+# Eksik değerler: tamsayı ve kod sütunlarında -1, ondalıklarda NaN
+MISSING_INT = -1
+MISSING_CODE = -1
+
+_pyarrow = {}
+
+
+def _get_pyarrow():
+    """(pyarrow, pyarrow.parquet) çiftini döndür (yoksa None), ilk çağrıda yüklenir"""
+    if 'modules' not in _pyarrow:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            _pyarrow['modules'] = (pyarrow, pyarrow.parquet)
+        except ImportError:
+            _pyarrow['modules'] = None
+    return _pyarrow['modules']
+
+
+def _encode_column(values: List[Any]) -> Optional[Tuple[np.ndarray, Optional[List[str]]]]:
+    """Olay alanının değerlerini tipli sütuna çevir (None: eksik)
+
+    Metinler yerel sözlük kodlarına, tamsayılar int64'e, diğer sayılar
+    float64'e dönüşür. Liste/sözlük gibi skaler olmayan alanlar sütun
+    olmaz (None döner).
+    """
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    if all(isinstance(value, str) for value in present):
+        dictionary = sorted(set(present))
+        codes = {name: code for code, name in enumerate(dictionary)}
+        column = np.array([MISSING_CODE if value is None else codes[value] for value in values], dtype=np.int16)
+        return column, dictionary
+    if all(isinstance(value, (bool, int, np.integer)) for value in present):
+        column = np.array([MISSING_INT if value is None else value for value in values], dtype=np.int64)
+        return column, None
+    if all(isinstance(value, (bool, int, float, np.integer, np.floating)) for value in present):
+        column = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        return column, None
+    return None
+
+
+def _missing_value(dtype: np.dtype):
+    return np.nan if np.issubdtype(dtype, np.floating) else MISSING_INT
+
+
+class ColumnarEventSink:
+    """Olayları tipli sütunlar halinde yalnızca eklenen parçalara yazar
+
+    Olaylar ``chunk_rows`` satıra ya da ``chunk_seconds`` yaşına ulaşınca
+    tek bir parça olarak yazılır. pyarrow varsa parça bir Parquet dosyası,
+    yoksa her sütunun ayrı ``.npy`` dosyası olduğu bir dizindir; her iki
+    durumda da yanına tick/organizma aralıklarını, sütun tiplerini ve metin
+    sözlüklerini tutan bir JSON özeti yazılır. Özet en son yazıldığı için
+    okuyucular yarım parçaları görmez. Parça numarası, özetin geçici
+    dosyası ``O_EXCL`` ile oluşturularak ayrılır; aynı dizine yazan birden
+    çok yazıcı birbirinin parçalarının üzerine yazmaz.
+    """
+
+    def __init__(self, path=DEFAULT_EVENT_STORE_PATH, chunk_rows: int = 65536,
+                 chunk_seconds: Optional[float] = 60.0, backend: str = 'auto',
+                 compression: Optional[str] = 'zstd'):
+        """
+        Args:
+            path: Parçaların yazılacağı dizin
+            chunk_rows: Parça başına en fazla satır
+            chunk_seconds: Bekleyen olaylar en geç bu kadar saniyede yazılır
+            backend: 'parquet', 'npy' ya da 'auto' (pyarrow varsa parquet)
+            compression: Parquet sıkıştırması (npy parçaları sıkıştırılmaz)
+        """
+        self.path = Path(path)
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.chunk_seconds = chunk_seconds
+        self.compression = compression
+
+        if backend == 'auto':
+            backend = 'parquet' if _get_pyarrow() is not None else 'npy'
+        elif backend == 'parquet' and _get_pyarrow() is None:
+            logger.warning("⚠️  pyarrow bulunamadı, olaylar .npy parçalarına yazılacak")
+            backend = 'npy'
+        if backend not in ('parquet', 'npy'):
+            raise ValueError(f"Bilinmeyen olay deposu biçimi: {backend}")
+        self.backend = backend
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        existing = [int(p.name.split('.')[0].split('_')[1]) for p in self.path.glob('chunk_*.json*')]
+        self._next_chunk = max(existing) + 1 if existing else 0
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_since = None
+
+        self.stats = {
+            'events': 0,
+            'chunks': 0,
+            'bytes_written': 0
+        }
+
+    def write(self, events: Sequence[Dict[str, Any]]):
+        """Olayları ekle; parça dolduysa ya da yeterince beklediyse yaz"""
+        if events:
+            if not self._pending:
+                self._pending_since = time.time()
+            self._pending.extend(events)
+            self.stats['events'] += len(events)
+        while len(self._pending) >= self.chunk_rows:
+            self._write_chunk(self._pending[:self.chunk_rows])
+            self._pending = self._pending[self.chunk_rows:]
+        if (self._pending and self.chunk_seconds is not None
+                and time.time() - self._pending_since >= self.chunk_seconds):
+            self.flush()
+
+    def flush(self):
+        """Bekleyen olayları (parça dolmasa da) yaz"""
+        if self._pending:
+            self._write_chunk(self._pending)
+            self._pending = []
+
+    def _claim_chunk(self) -> Tuple[str, Path]:
+        """Sıradaki boş parça adını ayır
+
+        Özetin geçici dosyası ``O_EXCL`` ile oluşturulur ve parça yazılana
+        kadar tutulur; ad başka bir yazıcıda ya da tamamlanmış bir parçada
+        ise sonraki numara denenir.
+
+        Returns:
+            (parça adı, özetin geçici dosya yolu)
+        """
+        while True:
+            name = f'chunk_{self._next_chunk:06d}'
+            self._next_chunk += 1
+            temp_path = self.path / f'{name}.json.tmp'
+            try:
+                os.close(os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                continue
+            if (self.path / f'{name}.json').exists():
+                # Başka bir yazıcı bu parçayı biz dizini taramadan sonra tamamlamış
+                os.remove(temp_path)
+                continue
+            return name, temp_path
+
+    def _write_chunk(self, events: List[Dict[str, Any]]):
+        """Olay listesini sütunlara çevirip tek parça olarak yaz"""
+        columns: Dict[str, np.ndarray] = {}
+        dictionaries: Dict[str, List[str]] = {}
+
+        for name, dtype in CORE_COLUMNS.items():
+            if name == 'event_type':
+                encoded = _encode_column([str(event.get('event_type', '')) for event in events])
+                columns[name], dictionaries[name] = encoded
+            else:
+                source = 'frame' if name == 'tick' else name
+                columns[name] = np.array([event.get(source, MISSING_INT) for event in events], dtype=dtype)
+
+        extra_keys = []
+        for event in events:
+            for key in event:
+                if key not in columns and key != 'frame' and key not in extra_keys:
+                    extra_keys.append(key)
+        for key in extra_keys:
+            encoded = _encode_column([event.get(key) for event in events])
+            if encoded is None:
+                continue
+            columns[key], dictionary = encoded
+            if dictionary is not None:
+                dictionaries[key] = dictionary
+
+        name, temp_path = self._claim_chunk()
+        if self.backend == 'parquet':
+            pyarrow, parquet = _get_pyarrow()
+            data_path = self.path / f'{name}.parquet'
+            table = pyarrow.table({key: pyarrow.array(column) for key, column in columns.items()})
+            parquet.write_table(table, data_path, compression=self.compression or 'none')
+            size = data_path.stat().st_size
+        else:
+            data_path = self.path / name
+            data_path.mkdir(exist_ok=True)
+            size = 0
+            for key, column in columns.items():
+                np.save(data_path / f'{key}.npy', column)
+                size += column.nbytes
+
+        ticks = columns['tick']
+        organism_ids = columns['organism_id']
+        meta = {
+            'backend': self.backend,
+            'rows': len(events),
+            'tick_range': [int(ticks.min()), int(ticks.max())],
+            'organism_range': [int(organism_ids.min()), int(organism_ids.max())],
+            'columns': {key: column.dtype.str for key, column in columns.items()},
+            'dictionaries': dictionaries
+        }
+        meta_path = self.path / f'{name}.json'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+
+        self.stats['chunks'] += 1
+        self.stats['bytes_written'] += size
+
+    def close(self):
+        """Kalan olayları yaz"""
+        self.flush()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Depo yazım istatistiklerini döndür"""
+        return dict(self.stats, pending=len(self._pending), backend=self.backend, path=str(self.path))
+
+
+class EventStore:
+    """ColumnarEventSink parçalarını okur, süzer ve gruplar
+
+    Yalnızca sorgunun istediği ve süzgeçlerin kullandığı sütunlar okunur
+    (npy parçaları mmap ile, Parquet parçaları sütun seçimiyle). Tick ve
+    organizma aralığı dışında kalan ya da istenen olay türünü hiç içermeyen
+    parçalar özetlerine bakılarak tamamen atlanır.
+    """
+
+    def __init__(self, path=DEFAULT_EVENT_STORE_PATH):
+        """
+        Args:
+            path: Parçaların bulunduğu dizin
+        """
+        self.path = Path(path)
+        if not self.path.is_dir():
+            raise FileNotFoundError(f"Olay deposu bulunamadı: {self.path}")
+        self.refresh()
+
+    def refresh(self):
+        """Parça özetlerini (yeniden) oku"""
+        self.chunks = []
+        for meta_path in sorted(self.path.glob('chunk_*.json')):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta['name'] = meta_path.stem
+            self.chunks.append(meta)
+
+    @property
+    def columns(self) -> List[str]:
+        """Depodaki tüm sütunlar (ilk görülme sırasıyla)"""
+        names = {}
+        for meta in self.chunks:
+            names.update(dict.fromkeys(meta['columns']))
+        return list(names)
+
+    def _read_columns(self, meta: Dict[str, Any], names: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Parçadan yalnızca istenen sütunları oku (olmayanlar eksik değerle doldurulur)"""
+        present = [name for name in names if name in meta['columns']]
+        if meta['backend'] == 'parquet':
+            modules = _get_pyarrow()
+            if modules is None:
+                raise RuntimeError("Parquet parçalarını okumak için pyarrow gerekli")
+            table = modules[1].read_table(self.path / f"{meta['name']}.parquet", columns=present)
+            data = {name: table.column(name).to_numpy() for name in present}
+        else:
+            directory = self.path / meta['name']
+            data = {name: np.load(directory / f'{name}.npy', mmap_mode='r') for name in present}
+        for name in names:
+            if name not in data:
+                dtype = np.dtype(self._column_dtype(name))
+                data[name] = np.full(meta['rows'], _missing_value(dtype), dtype=dtype)
+        return data
+
+    def _column_dtype(self, name: str) -> str:
+        for meta in self.chunks:
+            if name in meta['columns']:
+                return meta['columns'][name]
+        raise KeyError(f"Bilinmeyen sütun: {name}")
+
+    def _is_text(self, name: str) -> bool:
+        return any(name in meta['dictionaries'] for meta in self.chunks)
+
+    def query(self, columns: Optional[Sequence[str]] = None, organism_id: Optional[int] = None,
+              event_type: Optional[str] = None, tick_range: Optional[Tuple[int, int]] = None,
+              limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Süzgeçlere uyan olayların sütunlarını döndür
+
+        Args:
+            columns: İstenen sütunlar (None: hepsi)
+            organism_id: Yalnızca bu organizmanın olayları
+            event_type: Yalnızca bu türdeki olaylar
+            tick_range: Kapalı tick aralığı (başlangıç, bitiş); uçlardan biri None olabilir
+            limit: En fazla bu kadar satır
+
+        Returns:
+            Sütun adı -> dizi; metin sütunları çözülmüş olarak döner
+        """
+        columns = list(columns) if columns else self.columns
+        filters = ['tick'] if tick_range else []
+        if organism_id is not None:
+            filters.append('organism_id')
+        if event_type is not None:
+            filters.append('event_type')
+        needed = list(dict.fromkeys(list(columns) + filters))
+        low, high = tick_range if tick_range else (None, None)
+
+        parts = {name: [] for name in columns}
+        rows = 0
+        for meta in self.chunks:
+            if limit is not None and rows >= limit:
+                break
+            if low is not None and meta['tick_range'][1] < low:
+                continue
+            if high is not None and meta['tick_range'][0] > high:
+                continue
+            if organism_id is not None and not (meta['organism_range'][0] <= organism_id <= meta['organism_range'][1]):
+                continue
+            event_code = None
+            if event_type is not None:
+                dictionary = meta['dictionaries'].get('event_type', [])
+                if event_type not in dictionary:
+                    continue
+                event_code = dictionary.index(event_type)
+
+            data = self._read_columns(meta, needed)
+            mask = np.ones(meta['rows'], dtype=bool)
+            if low is not None:
+                mask &= data['tick'] >= low
+            if high is not None:
+                mask &= data['tick'] <= high
+            if organism_id is not None:
+                mask &= data['organism_id'] == organism_id
+            if event_code is not None:
+                mask &= data['event_type'] == event_code
+            selected = np.flatnonzero(mask)
+            if limit is not None:
+                selected = selected[:limit - rows]
+            if len(selected) == 0:
+                continue
+            rows += len(selected)
+
+            for name in columns:
+                values = np.asarray(data[name][selected])
+                if name in meta['dictionaries']:
+                    dictionary = np.array(meta['dictionaries'][name] + [''], dtype=object)
+                    values = dictionary[values]  # -1 (eksik) son elemana, '' değerine düşer
+                elif self._is_text(name):
+                    values = np.full(len(values), '', dtype=object)
+                parts[name].append(values)
+
+        result = {}
+        for name in columns:
+            if parts[name]:
+                result[name] = np.concatenate(parts[name])
+            elif self._is_text(name):
+                result[name] = np.empty(0, dtype=object)
+            else:
+                result[name] = np.empty(0, dtype=self._column_dtype(name))
+        return result
+
+    def aggregate(self, by: str, value: Optional[str] = None, how: str = 'count',
+                  **filters) -> List[Tuple[Any, float]]:
+        """Olayları bir sütuna göre grupla
+
+        Args:
+            by: Gruplama sütunu (ör. 'event_type', 'organism_id')
+            value: Toplanacak sayısal sütun (count için gerekmez)
+            how: 'count', 'sum', 'mean', 'min' ya da 'max'
+            **filters: ``query`` süzgeçleri (organism_id, event_type, tick_range)
+
+        Returns:
+            Grup büyüklüğüne göre azalan (anahtar, değer) listesi
+        """
+        if how not in ('count', 'sum', 'mean', 'min', 'max'):
+            raise ValueError(f"Bilinmeyen toplama: {how}")
+        if how != 'count' and value is None:
+            raise ValueError(f"'{how}' için bir değer sütunu gerekli")
+        columns = [by] if how == 'count' else [by, value]
+        data = self.query(columns, **filters)
+        keys, inverse, counts = np.unique(data[by], return_inverse=True, return_counts=True)
+
+        if how == 'count':
+            results = counts.astype(np.float64)
+        else:
+            values = data[value].astype(np.float64)
+            valid = ~np.isnan(values)
+            if not np.issubdtype(data[value].dtype, np.floating):
+                valid &= data[value] != MISSING_INT
+            groups, values = inverse[valid], values[valid]
+            group_counts = np.bincount(groups, minlength=len(keys))
+            if how in ('sum', 'mean'):
+                results = np.bincount(groups, weights=values, minlength=len(keys))
+                if how == 'mean':
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        results = results / group_counts
+            else:
+                fill = np.inf if how == 'min' else -np.inf
+                results = np.full(len(keys), fill)
+                reducer = np.minimum if how == 'min' else np.maximum
+                reducer.at(results, groups, values)
+                results[group_counts == 0] = np.nan
+
+        order = np.argsort(-counts, kind='stable')
+        return [(keys[i].item() if hasattr(keys[i], 'item') else keys[i], float(results[i])) for i in order]
+
+    def get_info(self) -> Dict[str, Any]:
+        """Depo özeti"""
+        if not self.chunks:
+            return {'path': str(self.path), 'chunks': 0, 'rows': 0, 'columns': []}
+        return {
+            'path': str(self.path),
+            'chunks': len(self.chunks),
+            'rows': sum(meta['rows'] for meta in self.chunks),
+            'tick_range': [min(meta['tick_range'][0] for meta in self.chunks),
+                           max(meta['tick_range'][1] for meta in self.chunks)],
+            'backends': sorted({meta['backend'] for meta in self.chunks}),
+            'columns': self.columns
+        }
+
+
+def import_jsonl(source, path=DEFAULT_EVENT_STORE_PATH, backend: str = 'auto',
+                 chunk_rows: int = 65536) -> Dict[str, Any]:
+    """Mevcut JSONL olay günlüğünü (ya da .gz parçasını) sütunlu depoya aktar
+
+    Args:
+        source: JSONL dosyası
+        path: Hedef depo dizini
+        backend: 'parquet', 'npy' ya da 'auto'
+        chunk_rows: Parça başına satır
+
+    Returns:
+        Yazım istatistikleri
+    """
+    source = Path(source)
+    sink = ColumnarEventSink(path, chunk_rows=chunk_rows, chunk_seconds=None, backend=backend)
+    opener = gzip.open if source.suffix == '.gz' else open
+    batch = []
+    with opener(source, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            batch.append(json.loads(line))
+            if len(batch) >= chunk_rows:
+                sink.write(batch)
+                batch = []
+    sink.write(batch)
+    sink.close()
+    return sink.get_statistics()
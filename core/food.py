@@ -6,9 +6,69 @@ import numpy as np
 import random
 from typing import Optional, Dict, Any
 from .utils import logger
+from .food_sampling import FertilityAliasSampler
+
+# Yiyecek türü kodları (FoodStore.type_codes)
+FOOD_TYPE_CODES = {
+    'basic': 0,
+    'premium': 1,
+    'nutritious': 2,
+    'toxic': 3
+}
+
+# Tür başına enerji ve bozulma çarpanları (base_energy / base_decay_rate ile)
+FOOD_ENERGY_MULTIPLIERS = {
+    'basic': 1.0,
+    'premium': 1.5,
+    'nutritious': 1.3,
+    'toxic': 0.5
+}
+
+FOOD_DECAY_MULTIPLIERS = {
+    'basic': 1.0,
+    'premium': 0.5,  # Premium yiyecekler daha yavaş bozulur
+    'nutritious': 0.8,
+    'toxic': 0.0  # Zehirli yiyecekler bozulmaz
+}
+
+class _StoreField:
+    """FoodStore'a bağlı yiyecekte diziden, değilse nesneden okunan alan"""
+    
+    def __init__(self, column: str):
+        self.column = column
+    
+    def __set_name__(self, owner, name):
+        self.private_name = '_' + name
+    
+    def __get__(self, food, owner=None):
+        if food is None:
+            return self
+        store = food._store
+        if store is None:
+            return getattr(food, self.private_name)
+        return getattr(store, self.column)[food._slot]
+    
+    def __set__(self, food, value):
+        store = food._store
+        if store is None:
+            setattr(food, self.private_name, value)
+        else:
+            getattr(store, self.column)[food._slot] = value
 
 class Food:
-    """Yiyecek sınıfı - organizmaların enerji kaynağı"""
+    """Yiyecek sınıfı - organizmaların enerji kaynağı
+    
+    Dünyaya eklenen yiyeceklerin sık güncellenen alanları ``FoodStore``
+    dizilerinde tutulur; nesne bu durumda yalnızca bir görünümdür.
+    """
+    
+    position = _StoreField('positions')
+    energy_value = _StoreField('energies')
+    decay_rate = _StoreField('decay_rates')
+    age = _StoreField('ages')
+    is_moving = _StoreField('moving')
+    movement_speed = _StoreField('speeds')
+    movement_direction = _StoreField('directions')
     
     def __init__(self, position: np.ndarray, energy_value: float = 10.0, 
                  food_type: str = 'basic', decay_rate: float = 0.0):
@@ -19,6 +79,10 @@ class Food:
             food_type: Yiyecek türü ('basic', 'premium', 'toxic')
             decay_rate: Bozulma hızı (0 = bozulmaz)
         """
+        # FoodStore bağlantısı (World.add_food tarafından ayarlanır)
+        self._store = None
+        self._slot = -1
+        
         self.position = np.array(position, dtype=np.float32)
         self.energy_value = energy_value
         self.food_type = food_type
@@ -43,6 +107,23 @@ class Food:
         
         logger.debug(f"🍎 Food oluşturuldu: {position}, type: {food_type}")
     
+    @classmethod
+    def bound_to_store(cls, store: 'FoodStore', slot: int, food_type: str,
+                       size: float, frame: int = 0) -> 'Food':
+        """Dizileri zaten yazılmış bir slot için hafif yiyecek nesnesi oluştur"""
+        food = cls.__new__(cls)
+        food._store = store
+        food._slot = slot
+        food.food_type = food_type
+        food.size = size
+        food.color = food._get_color_by_type()
+        food.stats = {
+            'created_at': frame,
+            'eaten_at': None,
+            'lifetime': 0.0
+        }
+        return food
+    
     def _get_color_by_type(self) -> tuple:
         """Yiyecek türüne göre renk belirle"""
         if self.food_type == 'basic':
@@ -57,7 +138,7 @@ class Food:
             return (0, 255, 0)  # Varsayılan yeşil
     
     def update(self, delta_time: float, frame: int):
-        """Yiyeceği güncelle"""
+        """Yiyeceği güncelle (FoodStore dışındaki tekil yiyecekler için)"""
         self.age += delta_time
         self.stats['lifetime'] = self.age
         
@@ -113,6 +194,7 @@ class Food:
     
     def get_info(self) -> Dict[str, Any]:
         """Yiyecek hakkında bilgi döndür"""
+        self.stats['lifetime'] = float(self.age)
         return {
             'position': self.position.tolist(),
             'energy_value': self.energy_value,
@@ -122,17 +204,157 @@ class Food:
             'stats': self.stats
         }
 
+class FoodStore:
+    """Yiyecek durumunu bitişik dizilerde tutan yapı (structure-of-arrays)
+    
+    Slot indeksleri ``world.foods`` indeksleriyle aynıdır. Bozulma ve
+    hareket tüm yiyecekler için tek vektörel ``update`` çağrısıyla yapılır.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Başlangıç kapasitesi (gerektikçe ikiye katlanır)
+        """
+        self.capacity = 0
+        self.size = 0  # Kullanılan en yüksek slot + 1
+        self._allocate(max(1, capacity))
+    
+    def _allocate(self, capacity: int):
+        """Dizileri yeni kapasiteyle oluştur, mevcut veriyi kopyala"""
+        columns = {
+            'positions': ((capacity, 2), np.float32),
+            'energies': ((capacity,), np.float64),
+            'decay_rates': ((capacity,), np.float64),
+            'ages': ((capacity,), np.float64),
+            'moving': ((capacity,), np.bool_),
+            'speeds': ((capacity,), np.float64),
+            'directions': ((capacity, 2), np.float64),
+            'type_codes': ((capacity,), np.int8),
+            'alive': ((capacity,), np.bool_),
+            'generations': ((capacity,), np.int64)  # Slot yeniden kullanım sayacı
+        }
+        for name, (shape, dtype) in columns.items():
+            new_array = np.zeros(shape, dtype=dtype)
+            if self.capacity > 0:
+                new_array[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, new_array)
+        self.capacity = capacity
+    
+    def attach(self, food: Food, slot: int):
+        """Yiyeceği slot'a yerleştir ve alanlarını diziye bağla"""
+        if slot >= self.capacity:
+            self._allocate(max(slot + 1, self.capacity * 2))
+        
+        self.positions[slot] = food._position
+        self.energies[slot] = food._energy_value
+        self.decay_rates[slot] = food._decay_rate
+        self.ages[slot] = food._age
+        self.moving[slot] = food._is_moving
+        self.speeds[slot] = food._movement_speed
+        self.directions[slot] = food._movement_direction
+        self.type_codes[slot] = FOOD_TYPE_CODES.get(food.food_type, 0)
+        self.alive[slot] = True
+        self.generations[slot] += 1
+        self.size = max(self.size, slot + 1)
+        
+        food._store = self
+        food._slot = slot
+    
+    def attach_batch(self, slots: np.ndarray, batch: Dict[str, np.ndarray]):
+        """Toplu yiyecek dizilerini verilen slot'lara yaz"""
+        if len(slots) == 0:
+            return
+        top = int(slots.max()) + 1
+        if top > self.capacity:
+            self._allocate(max(top, self.capacity * 2))
+        
+        self.positions[slots] = batch['positions']
+        self.energies[slots] = batch['energies']
+        self.decay_rates[slots] = batch['decay_rates']
+        self.ages[slots] = 0.0
+        self.moving[slots] = batch['moving']
+        self.speeds[slots] = batch['speeds']
+        self.directions[slots] = batch['directions']
+        self.type_codes[slots] = batch['type_codes']
+        self.alive[slots] = True
+        self.generations[slots] += 1
+        self.size = max(self.size, top)
+    
+    def release(self, food: Food):
+        """Yiyeceği diziden ayır; son değerler nesneye geri yazılır"""
+        if food._store is not self:
+            return
+        slot = food._slot
+        
+        food._position = self.positions[slot].copy()
+        food._energy_value = float(self.energies[slot])
+        food._decay_rate = float(self.decay_rates[slot])
+        food._age = float(self.ages[slot])
+        food._is_moving = bool(self.moving[slot])
+        food._movement_speed = float(self.speeds[slot])
+        food._movement_direction = self.directions[slot].copy()
+        food._store = None
+        food._slot = -1
+        
+        self.alive[slot] = False
+    
+    def update(self, delta_time: float, detect_expired: bool = True) -> Optional[np.ndarray]:
+        """Tüm yiyecekleri tek geçişte güncelle, bozulanların maskesini döndür
+        
+        Bitişler zamanlama çarkından izleniyorsa ``detect_expired=False``
+        ile maske hesaplanmaz ve None döner.
+        """
+        n = self.size
+        alive = self.alive[:n]
+        energies = self.energies[:n]
+        decay_rates = self.decay_rates[:n]
+        
+        self.ages[:n] += delta_time
+        
+        # Bozulma
+        decaying = alive & (decay_rates > 0)
+        energies[decaying] -= decay_rates[decaying] * delta_time
+        expired = decaying & (energies <= 0) if detect_expired else None
+        
+        # Hareketli yiyecekler
+        movers = np.flatnonzero(alive & self.moving[:n] & (self.speeds[:n] > 0))
+        if movers.size:
+            # Rastgele yön değişimi (%1 şans)
+            turning = movers[np.random.random(movers.size) < 0.01]
+            if turning.size:
+                angles = np.random.uniform(0, 2 * np.pi, turning.size)
+                self.directions[turning, 0] = np.cos(angles)
+                self.directions[turning, 1] = np.sin(angles)
+            
+            self.positions[movers] += (
+                self.directions[movers] * (self.speeds[movers] * delta_time)[:, np.newaxis]
+            ).astype(np.float32)
+        
+        return expired
+    
+    def clear(self):
+        """Tüm slot'ları boşalt"""
+        self.alive[:] = False
+        self.size = 0
+
 class FoodSpawner:
     """Yiyecek üretici sınıfı"""
     
-    def __init__(self, world_size: tuple, spawn_config: Dict[str, Any]):
+    def __init__(self, world_size: tuple, spawn_config: Dict[str, Any],
+                 reference_fps: float = 60.0):
         """
         Args:
             world_size: Dünya boyutu
             spawn_config: Üretim yapılandırması
+            reference_fps: Frame başına ``spawn_rate``'i saniyelik orana çevirmek için
         """
         self.world_size = world_size
         self.spawn_config = spawn_config
+        self.reference_fps = reference_fps
+        
+        # Verimliliğe göre konum örnekleyici (attach_world ile kurulur)
+        self.position_sampler = None
         
         # Üretim istatistikleri
         self.stats = {
@@ -187,8 +409,113 @@ class FoodSpawner:
             logger.error(f"Yiyecek üretilirken hata: {e}")
             return None
     
+    def attach_world(self, world):
+        """Biome verimliliğine göre konum örnekleyiciyi kur"""
+        if not self.spawn_config.get('fertility_weighted', True):
+            self.position_sampler = None
+            return
+        self.position_sampler = FertilityAliasSampler(
+            world, self.spawn_config.get('spawn_zones', [])
+        )
+    
+    def on_world_resized(self, world):
+        """Dünya genişleyince üretim alanını güncelle"""
+        self.world_size = tuple(world.size.tolist())
+        if self.position_sampler is not None:
+            self.position_sampler.on_world_resized(world)
+    
+    def on_biome_changed(self, world, biome_key: str):
+        """Biome verimliliği değişince ilgili blokları güncelle"""
+        if self.position_sampler is not None:
+            self.position_sampler.on_biome_changed(world, biome_key)
+    
+    def get_rate_per_second(self) -> float:
+        """Saniyelik ortalama üretim oranı"""
+        if 'spawn_rate_per_second' in self.spawn_config:
+            return float(self.spawn_config['spawn_rate_per_second'])
+        # Eski frame başına olasılık -> saniyelik oran
+        return float(self.spawn_config.get('spawn_rate', 0.05)) * self.reference_fps
+    
+    def spawn_batch(self, delta_time: float) -> Dict[str, Any]:
+        """Poisson dağılımıyla bu adımdaki tüm yiyecekleri diziler halinde üret
+        
+        Returns:
+            Sütun dizileri: positions, type_codes, type_names, energies,
+            decay_rates, moving, speeds, directions, sizes
+        """
+        count = int(np.random.poisson(self.get_rate_per_second() * delta_time))
+        
+        # Pozisyonlar
+        positions = self._get_spawn_positions(count)
+        
+        # Türler (ağırlıklı seçim)
+        food_types = self.spawn_config.get('food_types', {
+            'basic': 0.7,
+            'premium': 0.2,
+            'nutritious': 0.1
+        })
+        names = list(food_types.keys())
+        weights = np.array(list(food_types.values()), dtype=np.float64)
+        type_index = np.random.choice(len(names), size=count, p=weights / weights.sum())
+        
+        # Tür başına enerji ve bozulma değerleri
+        energy_table = np.array([self._get_energy_value(name) for name in names])
+        decay_table = np.array([self._get_decay_rate(name) for name in names])
+        code_table = np.array([FOOD_TYPE_CODES.get(name, 0) for name in names], dtype=np.int8)
+        
+        # Hareketli yiyecekler
+        moving = np.random.random(count) < self.spawn_config.get('moving_food_probability', 0.0)
+        speeds = np.where(moving, np.random.uniform(10, 30, count), 0.0)
+        angles = np.random.uniform(0, 2 * np.pi, count)
+        directions = np.where(
+            moving[:, np.newaxis],
+            np.column_stack([np.cos(angles), np.sin(angles)]),
+            0.0
+        )
+        
+        # İstatistikleri güncelle
+        self.stats['total_spawned'] += count
+        for name, type_count in zip(names, np.bincount(type_index, minlength=len(names)).tolist()):
+            if type_count:
+                self.stats['spawned_by_type'][name] = \
+                    self.stats['spawned_by_type'].get(name, 0) + type_count
+        
+        return {
+            'positions': positions,
+            'type_codes': code_table[type_index],
+            'type_names': [names[i] for i in type_index.tolist()],
+            'energies': energy_table[type_index],
+            'decay_rates': decay_table[type_index],
+            'moving': moving,
+            'speeds': speeds,
+            'directions': directions,
+            'sizes': np.random.uniform(2.0, 6.0, count)
+        }
+    
+    def _get_spawn_positions(self, count: int) -> np.ndarray:
+        """Toplu üretim pozisyonları"""
+        if self.position_sampler is not None:
+            return self.position_sampler.sample(count)
+        
+        spawn_zones = self.spawn_config.get('spawn_zones', [])
+        if not spawn_zones:
+            return np.random.uniform(
+                low=[0, 0],
+                high=self.world_size,
+                size=(count, 2)
+            )
+        
+        # Her yiyecek için rastgele bölge
+        zone_index = np.random.randint(0, len(spawn_zones), count)
+        lows = np.array([[z['x_min'], z['y_min']] for z in spawn_zones], dtype=np.float64)
+        highs = np.array([[z['x_max'], z['y_max']] for z in spawn_zones], dtype=np.float64)
+        return np.random.uniform(lows[zone_index], highs[zone_index])
+    
     def _get_spawn_position(self) -> np.ndarray:
         """Üretim pozisyonu belirle"""
+        if self.position_sampler is not None:
+            return self.position_sampler.sample(1)[0]
+        
         # Basit rastgele pozisyon
         x = random.uniform(0, self.world_size[0])
         y = random.uniform(0, self.world_size[1])
@@ -225,29 +552,13 @@ class FoodSpawner:
     def _get_energy_value(self, food_type: str) -> float:
         """Yiyecek türüne göre enerji değeri belirle"""
         base_energy = self.spawn_config.get('base_energy', 10.0)
-        
-        energy_multipliers = {
-            'basic': 1.0,
-            'premium': 1.5,
-            'nutritious': 1.3,
-            'toxic': 0.5
-        }
-        
-        multiplier = energy_multipliers.get(food_type, 1.0)
+        multiplier = FOOD_ENERGY_MULTIPLIERS.get(food_type, 1.0)
         return base_energy * multiplier
     
     def _get_decay_rate(self, food_type: str) -> float:
         """Yiyecek türüne göre bozulma hızı belirle"""
         base_decay = self.spawn_config.get('base_decay_rate', 0.0)
-        
-        decay_multipliers = {
-            'basic': 1.0,
-            'premium': 0.5,  # Premium yiyecekler daha yavaş bozulur
-            'nutritious': 0.8,
-            'toxic': 0.0  # Zehirli yiyecekler bozulmaz
-        }
-        
-        multiplier = decay_multipliers.get(food_type, 1.0)
+        multiplier = FOOD_DECAY_MULTIPLIERS.get(food_type, 1.0)
         return base_decay * multiplier
     
     def get_statistics(self) -> Dict[str, Any]:
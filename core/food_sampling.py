@@ -0,0 +1,266 @@
+"""
+Ecosim Food Sampling - Verimliliğe Göre Ağırlıklı Konum Örnekleme
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from .utils import logger
+
+
+def build_alias_table(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vose alias tablosu oluştur
+
+    Args:
+        weights: Negatif olmayan ağırlıklar
+
+    Returns:
+        (prob, alias): i. kova ``prob[i]`` olasılıkla kendisi, aksi halde
+        ``alias[i]`` seçilir
+    """
+    n = len(weights)
+    prob = np.ones(n, dtype=np.float64)
+    alias = np.arange(n, dtype=np.int64)
+    total = float(np.sum(weights))
+    if n == 0 or total <= 0:
+        return prob, alias
+
+    scaled = np.asarray(weights, dtype=np.float64) * (n / total)
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Kalanlar (sayısal hata) tam olasılıkla kendisi
+    for i in small + large:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+def sample_alias(prob: np.ndarray, alias: np.ndarray, count: int) -> np.ndarray:
+    """Alias tablosundan count adet indeks çek (her çekiliş O(1))"""
+    n = len(prob)
+    u = np.random.random(count) * n
+    index = np.minimum(u.astype(np.int64), n - 1)
+    accept = (u - index) < prob[index]
+    return np.where(accept, index, alias[index])
+
+
+class FertilityAliasSampler:
+    """Biome verimliliği ve bölge ağırlıklarına göre yiyecek konumu örnekleyici
+
+    Dünya, biome raster'ı ile aynı boyutta hücrelere bölünür. Her giriş
+    bir dikdörtgendir (tam hücre ya da hücre ile ``spawn_zones``
+    bölgesinin kesişimi) ve ağırlığı ``alan * food_spawn_rate * zone
+    ağırlığı``dır. Hücreler bloklara ayrılır; her bloğun kendi alias
+    tablosu ve bloklar üzerinde bir üst tablo vardır. Çevre değişince
+    yalnızca etkilenen blokların tabloları yeniden kurulur.
+    """
+
+    def __init__(self, world, spawn_zones: Optional[List[Dict[str, Any]]] = None,
+                 block_cells: int = 8):
+        """
+        Args:
+            world: Dünya nesnesi (biome raster'ı için)
+            spawn_zones: x_min/x_max/y_min/y_max ve opsiyonel weight içeren bölgeler
+            block_cells: Bir bloğun kenarındaki hücre sayısı
+        """
+        self.cell_size = float(world.biome_cell_size)
+        self.block_cells = block_cells
+        self.spawn_zones = list(spawn_zones or [])
+
+        self.blocks: Dict[Tuple[int, int], Dict[str, np.ndarray]] = {}
+        self.biome_grid = np.zeros((0, 0), dtype=np.int64)
+        self.world_size = np.zeros(2, dtype=np.float64)
+
+        self.stats = {
+            'full_rebuilds': 0,
+            'blocks_rebuilt': 0
+        }
+
+        self.rebuild(world)
+
+    def _block_count(self) -> Tuple[int, int]:
+        """Blok grid boyutu (x, y)"""
+        cells_y, cells_x = self.biome_grid.shape
+        return (-(-cells_x // self.block_cells), -(-cells_y // self.block_cells))
+
+    def rebuild(self, world):
+        """Tüm blokları baştan kur"""
+        self.world_size = np.array(world.size, dtype=np.float64)
+        self.biome_grid = world.get_biome_index_grid()
+        self.blocks.clear()
+
+        blocks_x, blocks_y = self._block_count()
+        for bx in range(blocks_x):
+            for by in range(blocks_y):
+                self._build_block(world, bx, by)
+
+        self.stats['full_rebuilds'] += 1
+        self._assemble()
+        logger.debug(f"🎲 FertilityAliasSampler kuruldu: {len(self.blocks)} blok")
+
+    def on_world_resized(self, world):
+        """Dünya genişlediğinde yalnızca yeni veya kenardaki blokları kur"""
+        old_blocks_x, old_blocks_y = self._block_count()
+
+        self.world_size = np.array(world.size, dtype=np.float64)
+        self.biome_grid = world.get_biome_index_grid()
+        blocks_x, blocks_y = self._block_count()
+
+        # Eski son satır/sütun blokları kısmi olabilir, onlar da yeniden kurulur
+        edge_bx = max(0, old_blocks_x - 1)
+        edge_by = max(0, old_blocks_y - 1)
+
+        dirty = [
+            (bx, by)
+            for bx in range(blocks_x)
+            for by in range(blocks_y)
+            if bx >= edge_bx or by >= edge_by
+        ]
+        for key in list(self.blocks):
+            if key[0] >= blocks_x or key[1] >= blocks_y:
+                del self.blocks[key]
+
+        self._rebuild_blocks(world, dirty)
+
+    def on_biome_changed(self, world, biome_key: str):
+        """Bir biome'un verimliliği değişince onu içeren blokları yeniden kur"""
+        biome_index = world.biome_keys.index(biome_key)
+        blocks_x, blocks_y = self._block_count()
+        bc = self.block_cells
+        dirty = [
+            (bx, by)
+            for bx in range(blocks_x)
+            for by in range(blocks_y)
+            if np.any(self.biome_grid[by * bc:(by + 1) * bc, bx * bc:(bx + 1) * bc] == biome_index)
+        ]
+        self._rebuild_blocks(world, dirty)
+
+    def set_spawn_zones(self, world, spawn_zones: List[Dict[str, Any]]):
+        """Üretim bölgelerini değiştir (tüm bloklar etkilenir)"""
+        self.spawn_zones = list(spawn_zones or [])
+        self.rebuild(world)
+
+    def _rebuild_blocks(self, world, block_keys: List[Tuple[int, int]]):
+        """Verilen blokları yeniden kur ve tabloları birleştir"""
+        for bx, by in block_keys:
+            self._build_block(world, bx, by)
+        self.stats['blocks_rebuilt'] += len(block_keys)
+        self._assemble()
+
+    def _build_block(self, world, bx: int, by: int):
+        """Tek bloğun giriş dikdörtgenlerini ve alias tablosunu oluştur"""
+        bc = self.block_cells
+        cells_y, cells_x = self.biome_grid.shape
+        cx = np.arange(bx * bc, min((bx + 1) * bc, cells_x))
+        cy = np.arange(by * bc, min((by + 1) * bc, cells_y))
+        gx, gy = np.meshgrid(cx, cy)
+        gx = gx.ravel()
+        gy = gy.ravel()
+
+        rates = world.biome_food_rates[self.biome_grid[gy, gx]]
+
+        x0 = gx * self.cell_size
+        y0 = gy * self.cell_size
+        x1 = np.minimum(x0 + self.cell_size, self.world_size[0])
+        y1 = np.minimum(y0 + self.cell_size, self.world_size[1])
+
+        if self.spawn_zones:
+            # Her (hücre, bölge) kesişimi ayrı giriş
+            rects = []
+            weights = []
+            for zone in self.spawn_zones:
+                zx0 = np.maximum(x0, zone['x_min'])
+                zy0 = np.maximum(y0, zone['y_min'])
+                zx1 = np.minimum(x1, zone['x_max'])
+                zy1 = np.minimum(y1, zone['y_max'])
+                overlap = (zx1 > zx0) & (zy1 > zy0)
+                rects.append(np.column_stack([zx0, zy0, zx1, zy1])[overlap])
+                area = ((zx1 - zx0) * (zy1 - zy0))[overlap]
+                weights.append(area * rates[overlap] * zone.get('weight', 1.0))
+            rects = np.concatenate(rects) if rects else np.zeros((0, 4))
+            weights = np.concatenate(weights) if weights else np.zeros(0)
+        else:
+            rects = np.column_stack([x0, y0, x1, y1])
+            weights = (x1 - x0) * (y1 - y0) * rates
+
+        valid = weights > 0
+        rects = rects[valid]
+        weights = weights[valid]
+
+        if len(weights) == 0:
+            self.blocks.pop((bx, by), None)
+            return
+
+        prob, alias = build_alias_table(weights)
+        self.blocks[(bx, by)] = {
+            'rects': rects.astype(np.float64),
+            'prob': prob,
+            'alias': alias,
+            'total': float(weights.sum())
+        }
+
+    def _assemble(self):
+        """Blok tablolarını düz dizilerde birleştir ve üst tabloyu kur"""
+        keys = list(self.blocks.keys())
+        if not keys:
+            self.rects = np.zeros((0, 4))
+            self.entry_prob = np.zeros(0)
+            self.entry_alias = np.zeros(0, dtype=np.int64)
+            self.block_start = np.zeros(0, dtype=np.int64)
+            self.block_size = np.zeros(0, dtype=np.int64)
+            self.block_prob, self.block_alias = build_alias_table(np.zeros(0))
+            return
+
+        sizes = np.array([len(self.blocks[k]['prob']) for k in keys], dtype=np.int64)
+        starts = np.zeros(len(keys), dtype=np.int64)
+        np.cumsum(sizes[:-1], out=starts[1:])
+
+        self.rects = np.concatenate([self.blocks[k]['rects'] for k in keys])
+        self.entry_prob = np.concatenate([self.blocks[k]['prob'] for k in keys])
+        # Blok içi alias indekslerini global indekse çevir
+        self.entry_alias = np.concatenate([
+            self.blocks[k]['alias'] + start for k, start in zip(keys, starts.tolist())
+        ])
+        self.block_start = starts
+        self.block_size = sizes
+        self.block_prob, self.block_alias = build_alias_table(
+            np.array([self.blocks[k]['total'] for k in keys])
+        )
+
+    def sample(self, count: int) -> np.ndarray:
+        """count adet pozisyon örnekle (çekiliş başına O(1))"""
+        if count <= 0 or len(self.block_size) == 0:
+            return np.zeros((0, 2), dtype=np.float64) if count <= 0 else \
+                np.random.uniform(low=[0, 0], high=self.world_size, size=(count, 2))
+
+        # Önce blok, sonra blok içindeki giriş
+        blocks = sample_alias(self.block_prob, self.block_alias, count)
+        n = self.block_size[blocks]
+        u = np.random.random(count) * n
+        local = np.minimum(u.astype(np.int64), n - 1)
+        entry = self.block_start[blocks] + local
+        accept = (u - local) < self.entry_prob[entry]
+        entry = np.where(accept, entry, self.entry_alias[entry])
+
+        # Dikdörtgen içinde düzgün dağılım
+        rects = self.rects[entry]
+        return np.random.uniform(rects[:, :2], rects[:, 2:])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Örnekleyici istatistiklerini döndür"""
+        return {
+            **self.stats,
+            'block_count': len(self.blocks),
+            'entry_count': len(self.entry_prob)
+        }
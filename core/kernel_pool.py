@@ -0,0 +1,94 @@
+"""
+Ecosim Kernel Pool - Nogil Numba Çekirdeklerini Thread Havuzunda Çalıştırma
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence
+from .utils import get_numba, logger
+
+
+class KernelPool:
+    """Satır tabanlı çekirdekleri sabit boyutlu parçalara bölüp thread'lerde çalıştırır
+
+    Çekirdekler ``nogil=True`` ile derlenir ve
+    ``kernel(order, start, end, partials, chunk, *args)`` imzasını taşır:
+    ``order[start:end]`` satırlarını işler, yalnızca o satırların çıktı
+    hücrelerine ve ``partials[chunk]`` satırına yazar. ``order`` uzamsal
+    olarak sıralı olduğundan her parça komşu hücrelere dokunur.
+
+    Parça sınırları thread sayısından bağımsızdır ve kısmi toplamlar parça
+    sırasıyla indirgenir; sonuç 1 thread ile N thread arasında aynıdır.
+    Numba yoksa (saf Python, GIL) çekirdekler seri çalışır.
+    """
+
+    def __init__(self, threads: Optional[int] = None, chunk_rows: int = 512):
+        """
+        Args:
+            threads: Thread sayısı (None: çekirdek sayısı, 1: seri)
+            chunk_rows: Parça başına satır sayısı
+        """
+        if threads is None:
+            threads = os.cpu_count() or 1
+        self.threads = max(1, int(threads))
+        self.chunk_rows = max(1, int(chunk_rows))
+        self._executor = None
+
+        self.stats = {
+            'dispatches': 0,
+            'parallel_dispatches': 0,
+            'chunks': 0
+        }
+
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Thread havuzunu ilk paralel çağrıda oluştur"""
+        if self._executor is None and self.threads > 1:
+            if get_numba() is None:
+                logger.debug("⚠️  Numba yok, çekirdekler seri çalışacak")
+                self.threads = 1
+                return None
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='ecosim-kernel')
+        return self._executor
+
+    def run(self, kernel: Callable, order: np.ndarray, args: Sequence, partial_width: int = 1) -> np.ndarray:
+        """Çekirdeği order'ın tüm parçalarında çalıştır, kısmi toplamları döndür
+
+        Args:
+            kernel: Parça çekirdeği
+            order: İşlenecek satırların (uzamsal) sırası
+            args: Çekirdeğe iletilecek ek argümanlar
+            partial_width: Parça başına kısmi toplam sayısı
+
+        Returns:
+            Parça sırasıyla toplanmış kısmi toplamlar (partial_width,)
+        """
+        n = len(order)
+        bounds = list(range(0, n, self.chunk_rows)) + [n]
+        chunks = len(bounds) - 1
+        partials = np.zeros((max(chunks, 1), partial_width), dtype=np.float64)
+
+        executor = self._get_executor() if chunks > 1 else None
+        if executor is None:
+            for chunk in range(chunks):
+                kernel(order, bounds[chunk], bounds[chunk + 1], partials, chunk, *args)
+        else:
+            futures = [executor.submit(kernel, order, bounds[chunk], bounds[chunk + 1], partials, chunk, *args)
+                       for chunk in range(chunks)]
+            for future in futures:
+                future.result()
+            self.stats['parallel_dispatches'] += 1
+
+        self.stats['dispatches'] += 1
+        self.stats['chunks'] += chunks
+        return partials.sum(axis=0)
+
+    def close(self):
+        """Thread havuzunu kapat"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_statistics(self):
+        """Havuz istatistiklerini döndür"""
+        return dict(self.stats, threads=self.threads, chunk_rows=self.chunk_rows)
@@ -0,0 +1,90 @@
+"""
+Ecosim LOD - Kamera Mesafesine Göre Güncelleme Sıklığı
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional
+from .utils import logger
+
+
+class UpdateLevelOfDetail:
+    """Organizmaların güncelleme sıklığını ilgi alanına uzaklığa göre belirler
+
+    Görünür alan (veya headless modda ilgi noktaları) yakınındaki
+    organizmalar her tick güncellenir; uzaktakiler ``strides`` içindeki
+    daha seyrek kademelere düşer. Atlanan süre organizmada birikir ve bir
+    sonraki güncellemede tek seferde uygulanır.
+    """
+
+    def __init__(self, lod_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            lod_config: ``simulation.lod`` yapılandırması
+        """
+        lod_config = lod_config or {}
+        self.enabled = lod_config.get('enabled', True)
+        self.near_distance = float(lod_config.get('near_distance', 200.0))
+        self.far_distance = float(lod_config.get('far_distance', 800.0))
+        self.strides = list(lod_config.get('strides', [1, 4, 8]))
+
+        # Headless mod için ilgi noktaları
+        self.interest_points = np.array(
+            lod_config.get('interest_points', []), dtype=np.float64
+        ).reshape(-1, 2)
+        self.interest_radius = float(lod_config.get('interest_radius', 300.0))
+
+        self.stats = {
+            'tier_counts': [0] * len(self.strides)
+        }
+
+        logger.info(f"🔭 UpdateLevelOfDetail: enabled={self.enabled}, strides={self.strides}")
+
+    def set_interest_points(self, points: List[List[float]], radius: Optional[float] = None):
+        """Headless mod için ilgi noktalarını ayarla"""
+        self.interest_points = np.array(points, dtype=np.float64).reshape(-1, 2)
+        if radius is not None:
+            self.interest_radius = float(radius)
+
+    def _distance_to_viewport(self, positions: np.ndarray, camera) -> np.ndarray:
+        """Görünür dikdörtgene olan uzaklık (içerideyse 0)"""
+        top_left, bottom_right = camera.get_visible_area()
+        low = np.minimum(top_left, bottom_right)
+        high = np.maximum(top_left, bottom_right)
+        outside = np.maximum(np.maximum(low - positions, positions - high), 0.0)
+        return np.sqrt(np.sum(outside ** 2, axis=1))
+
+    def _distance_to_interest(self, positions: np.ndarray) -> np.ndarray:
+        """En yakın ilgi noktasının yarıçapına olan uzaklık"""
+        diff = positions[:, np.newaxis, :] - self.interest_points[np.newaxis, :, :]
+        distances = np.sqrt(np.sum(diff ** 2, axis=2)).min(axis=1)
+        return np.maximum(distances - self.interest_radius, 0.0)
+
+    def compute_strides(self, positions: np.ndarray, camera=None) -> np.ndarray:
+        """Her pozisyon için güncelleme adımını (tick cinsinden) döndür"""
+        strides = np.ones(len(positions), dtype=np.int64)
+        if not self.enabled or len(positions) == 0:
+            return strides
+
+        if camera is not None:
+            distances = self._distance_to_viewport(positions, camera)
+        elif len(self.interest_points) > 0:
+            distances = self._distance_to_interest(positions)
+        else:
+            # Referans yoksa herkes tam hızda güncellenir
+            return strides
+
+        tiers = np.zeros(len(positions), dtype=np.int64)
+        tiers[distances > self.near_distance] = 1
+        tiers[distances > self.far_distance] = 2
+        tiers = np.minimum(tiers, len(self.strides) - 1)
+
+        self.stats['tier_counts'] = np.bincount(tiers, minlength=len(self.strides)).tolist()
+        return np.array(self.strides, dtype=np.int64)[tiers]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """LOD istatistiklerini döndür"""
+        return {
+            'enabled': self.enabled,
+            'strides': self.strides,
+            **self.stats
+        }
@@ -123,6 +123,7 @@ class Organism:
         """
         self.organism_id = organism_id or random.randint(1000, 9999)
         self.position = np.array(position, dtype=np.float32)
+        self.previous_position = self.position  # Render interpolasyonu için
         self.velocity = np.array([0.0, 0.0], dtype=np.float32)
         
         # Tür bilgileri
@@ -161,13 +162,19 @@ class Organism:
             'diet_type': self.diet_type
         }
         
-        # Performans için
+        # Performans için (LOD: uzak organizmalar daha seyrek güncellenir)
         self.last_update_time = 0
-        self.update_interval = 1.0 / 60.0  # 60 FPS
+        self.update_interval = 0.0  # saniye, 0 = her tick
+        self.accumulated_time = 0.0  # atlanan tick'lerde biriken süre
         
         # Üreme kontrolü için
         self.last_reproduction_time = 0
         self.reproduction_cooldown = 10.0  # 10 saniye bekleme süresi
+        self.reproduction_ready = True  # Bekleme süresi bitince zamanlama çarkı açar
+        
+        # Dünyadaki durum (yaşlılık ölümü World.scheduler ile zamanlanır)
+        self.alive = True
+        self.lifespan_scheduled = False
         
         logger.debug(f"🦠 {self.species} #{self.organism_id} oluşturuldu: {position}")
     
@@ -176,14 +183,18 @@ class Organism:
         perf_monitor.start_timer(f'organism_update_{self.organism_id}')
         
         try:
+            # Render interpolasyonu için önceki pozisyon
+            self.previous_position = self.position
+            
             # Yaş ve enerji güncelleme
             self.age += delta_time
             # Hem metabolism hem de energy_decay kullan
             energy_decay = getattr(world, 'energy_decay', 0.08)  # Config'den al
             self.energy -= (self.dna.genes['metabolism'] + energy_decay) * delta_time
             
-            # Ölüm kontrolü
-            if self.energy <= 0 or self.age >= self.dna.genes['lifespan']:
+            # Ölüm kontrolü (yaşlılık zamanlanmışsa World.scheduler'a bırakılır)
+            old_age = not self.lifespan_scheduled and self.age >= self.dna.genes['lifespan']
+            if self.energy <= 0 or old_age:
                 cause = 'starvation' if self.energy <= 0 else 'old_age'
                 self.die(world, cause, frame)
                 return False
@@ -214,14 +225,32 @@ class Organism:
     def _update_behavior(self, world, delta_time: float):
         """Davranış durumunu güncelle - TÜR BAZLI"""
         # Yakındaki organizmaları ve yiyecekleri bul
-        nearby_organisms = world.get_nearby_organisms(
-            self.position, 
-            self.dna.genes['vision_range']
-        )
-        nearby_food_indices = world.get_nearby_foods(
-            self.position, 
-            self.dna.genes['vision_range']
-        )
+        # Komşuluk özeti varsa organizma taraması atlanır
+        sense_row = self._sense_row(world)
+        if sense_row >= 0:
+            nearby_organisms = None
+            has_neighbors = world.neighborhood.neighbor_count[sense_row] > 0
+        else:
+            nearby_organisms = world.get_nearby_organisms(
+                self.position, 
+                self.dna.genes['vision_range']
+            )
+            has_neighbors = bool(nearby_organisms)
+        # En yakın yiyecek algılama aşamasında hesaplandıysa onu kullan;
+        # değilse koku alanında çevrede yiyecek yoksa tam taramayı atla
+        scent_field = getattr(world, 'scent_field', None)
+        if sense_row >= 0:
+            nearby_food_indices = world.neighborhood.nearby_foods(
+                world, sense_row, self.position, self.dna.genes['vision_range']
+            )
+        elif scent_field is not None and scent_field.enabled and \
+                not scent_field.has_food_near(self.position, self.dna.genes['vision_range']):
+            nearby_food_indices = []
+        else:
+            nearby_food_indices = world.get_nearby_foods(
+                self.position, 
+                self.dna.genes['vision_range']
+            )
         
         # Davranış durumunu güncelle
         self._update_behavior_state()
@@ -240,7 +269,7 @@ class Organism:
                 self.target_food = nearby_food_indices[0]
             
             # Sosyal etkileşim
-            if nearby_organisms and self.dna.genes['social_attraction'] > 0.3:
+            if has_neighbors and self.dna.genes['social_attraction'] > 0.3:
                 self._social_interaction(nearby_organisms, world)
         
         elif self.behavior_state == 'reproducing':
@@ -263,7 +292,7 @@ class Organism:
                 # Eğer target_food yoksa, yakındaki yiyeceklerden birini seç
                 if nearby_food_indices:
                     self.target_food = nearby_food_indices[0]
-                else:
+                elif not self._follow_food_scent(world):
                     self.behavior_state = 'idle'
                     self.target_food = None
         
@@ -291,7 +320,7 @@ class Organism:
                 self.state = 'wandering'
                 self.target_food = None
         elif self.state == 'fleeing':
-            self._flee_behavior(delta_time)
+            self._flee_behavior(delta_time, world)
             if random.random() < 0.01:
                 self.state = 'wandering'
         elif self.state == 'reproducing':
@@ -349,7 +378,7 @@ class Organism:
             log_organism_event(
                 self.organism_id, 
                 'ate_food', 
-                0,  # frame bilgisi sonra eklenecek
+                0,  # 0: olay günlüğü güncel tick'i yazar
                 energy_gained=food.energy_value,
                 new_energy=self.energy
             )
@@ -360,23 +389,50 @@ class Organism:
             speed = self.dna.genes['speed']
             self.velocity = direction * speed
     
-    def _social_interaction(self, nearby_organisms: List[int], world):
-        """Sosyal etkileşim davranışı"""
-        if not nearby_organisms:
-            return
+    def _sense_row(self, world) -> int:
+        """Komşuluk özetindeki satırı döndür (-1 = bu tick'te özet yok)"""
+        neighborhood = getattr(world, 'neighborhood', None)
+        if neighborhood is None:
+            return -1
+        return neighborhood.row_of(self)
+    
+    def _follow_food_scent(self, world) -> bool:
+        """Yiyecek görünmüyorsa koku gradyanı yönünde ilerle"""
+        scent_field = getattr(world, 'scent_field', None)
+        if scent_field is None or not scent_field.enabled:
+            return False
         
-        # En yakın organizmayı bul
-        closest_org = None
-        min_distance = float('inf')
+        gradient = scent_field.sample_gradient(self.position)
+        magnitude = np.linalg.norm(gradient)
+        if magnitude < 1e-6:
+            return False
         
-        for org_index in nearby_organisms:
-            if org_index < len(world.organisms):
-                org = world.organisms[org_index]
-                if org is not None and org != self:
-                    distance = calculate_distance(self.position, org.position)
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_org = org
+        self.velocity = gradient / magnitude * self.dna.genes['speed']
+        return True
+    
+    def _social_interaction(self, nearby_organisms: Optional[List[int]], world):
+        """Sosyal etkileşim davranışı"""
+        sense_row = self._sense_row(world)
+        
+        if sense_row >= 0:
+            # En yakın organizma sensing aşamasından
+            closest_org = world.neighborhood.nearest_organism(world, sense_row)
+        else:
+            if not nearby_organisms:
+                return
+            
+            # En yakın organizmayı bul
+            closest_org = None
+            min_distance = float('inf')
+            
+            for org_index in nearby_organisms:
+                if org_index < len(world.organisms):
+                    org = world.organisms[org_index]
+                    if org is not None and org != self:
+                        distance = calculate_distance(self.position, org.position)
+                        if distance < min_distance:
+                            min_distance = distance
+                            closest_org = org
         
         if closest_org:
             # Saldırganlık kontrolü
@@ -477,6 +533,19 @@ class Organism:
     
     def _socializing_behavior(self, world, delta_time: float):
         """Sosyalleşme davranışı"""
+        sense_row = self._sense_row(world)
+        if sense_row >= 0:
+            partner = world.neighborhood.nearest_same_species(
+                world, sense_row, self.dna.genes['vision_range'] * 0.5
+            )
+            if partner is None:
+                self.behavior_state = 'idle'
+                return
+            
+            # Sürü davranışı: aynı türün ağırlık merkezine yönel
+            self._move_towards(world.neighborhood.same_centroid[sense_row])
+            return
+        
         # Yakındaki aynı türden organizmaları bul
         nearby_organisms = world.get_nearby_organisms(
             self.position, 
@@ -498,36 +567,58 @@ class Organism:
         
         self.behavior_state = 'idle'
     
-    def _flee_behavior(self, delta_time: float):
+    def _flee_behavior(self, delta_time: float, world=None):
         """Kaçma davranışı"""
-        if self.target_organism:
-            # Hedef organizmadan uzaklaş
-            direction = self.position - self.target_organism.position
-            direction = direction / np.linalg.norm(direction)
+        # En yakın tehdit varsa ondan, yoksa hedef organizmadan kaç
+        threat = None
+        if world is not None:
+            sense_row = self._sense_row(world)
+            if sense_row >= 0:
+                threat = world.neighborhood.nearest_threat_organism(world, sense_row)
+        if threat is None:
+            threat = self.target_organism
+        
+        if threat:
+            # Tehditten uzaklaş
+            direction = self.position - threat.position
+            distance = np.linalg.norm(direction)
+            if distance == 0:
+                return
+            direction = direction / distance
             speed = self.dna.genes['speed'] * 1.5  # Kaçarken daha hızlı
             self.velocity = direction * speed
     
     def _reproduction_behavior(self, world):
         """Üreme davranışı - DENGELİ"""
         if (self.age > 10 and  # 8'den 10'a artırıldı
+            self.reproduction_ready and
             self.energy > self.dna.genes['reproduction_threshold'] and
             random.random() < 0.03):  # 0.05'ten 0.03'e düşürüldü
             
             # Enerji maliyeti
             self.energy *= 0.7  # 0.6'dan 0.7'ye artırıldı
             
-            # Yeni organizma oluştur
-            child_position = self.position + np.random.uniform(-20, 20, 2)
-            child = Organism(position=child_position, parent=self)
+            # Yeni organizma oluştur (türü korunur, DNA mutasyonla aktarılır)
+            bounds_min, bounds_max = world.get_world_bounds()
+            child_position = np.clip(self.position + np.random.uniform(-20, 20, 2), bounds_min, bounds_max)
+            child = Organism(
+                position=child_position,
+                dna=self.dna.mutate(mutation_rate=self.dna.genes['mutation_rate']),
+                species=self.species,
+                species_traits=self.species_traits
+            )
             world.add_organism(child)
+            self.stats['offspring_count'] += 1
             
-            # İstatistikleri güncelle
-            world.stats['total_organisms_created'] += 1
+            # Bekleme süresi: bitişi zamanlama çarkı bildirir
+            self.last_reproduction_time = self.age
+            self.reproduction_ready = False
+            world.scheduler.schedule_in(self.reproduction_cooldown, ('reproduction_ready', self))
             
             log_organism_event(
                 self.organism_id,
                 'reproduced',
-                0,  # frame bilgisi sonra eklenecek
+                0,  # 0: olay günlüğü güncel tick'i yazar
                 offspring_id=child.organism_id,
                 energy_cost=self.energy * 0.3,
                 parent_energy=self.energy
@@ -600,7 +691,7 @@ class Organism:
             log_organism_event(
                 self.organism_id,
                 'reproduced',
-                0,  # frame bilgisi sonra eklenecek
+                0,  # 0: olay günlüğü güncel tick'i yazar
                 offspring_id=offspring.organism_id
             )
             
@@ -630,6 +721,10 @@ class Organism:
                 world.remove_organism(i)
                 break
     
+    def get_render_position(self, alpha: float) -> np.ndarray:
+        """İki simülasyon tick'i arasındaki render pozisyonu (alpha: 0-1)"""
+        return self.previous_position + (self.position - self.previous_position) * alpha
+    
     def get_fitness(self) -> float:
         """Organizmanın uygunluk skorunu hesapla - OPTİMİZE EDİLDİ"""
         # Dengeli uygunluk hesaplama
@@ -0,0 +1,200 @@
+"""
+Ecosim Render Bridge - Ayrı Süreçteki Renderer için Çift Tamponlu Shared Memory
+"""
+
+import multiprocessing
+import numpy as np
+from typing import Dict, Any, Tuple
+
+from .replay import (ORGANISM_FRAME_DTYPE, FOOD_FRAME_DTYPE,
+                     frame_sources, write_frame_rows)
+from .tiled_engine import SharedColumns
+from .utils import logger
+
+# control dizisindeki yuvalar
+FRONT, SEQ, CONSUMED, GENERATION, CLOSED = 0, 1, 2, 3, 4
+CONTROL_SLOTS = 8
+
+# header dizisi: tick, zaman, dünya genişliği, dünya yüksekliği, organizma, yiyecek
+HEADER_SLOTS = 6
+
+
+def control_layout() -> Dict[str, Tuple[Any, Tuple[int, ...]]]:
+    return {'control': (np.int64, (CONTROL_SLOTS,))}
+
+
+def frame_layout(organism_capacity: int, food_capacity: int) -> Dict[str, Tuple[Any, Tuple[int, ...]]]:
+    """Tek bir kare tamponunun yerleşimi (replay kayıt satırlarıyla aynı tipler)"""
+    return {
+        'header': (np.float64, (HEADER_SLOTS,)),
+        'organisms': (ORGANISM_FRAME_DTYPE, (organism_capacity,)),
+        'foods': (FOOD_FRAME_DTYPE, (food_capacity,))
+    }
+
+
+def _render_entry(*args):
+    """Renderer süreci hedefi; pygame yalnızca çocuk süreçte yüklenir"""
+    from visuals.render_process import render_main
+    render_main(*args)
+
+
+class RemoteCamera:
+    """Renderer sürecindeki kameranın simülasyon tarafındaki kopyası
+
+    LOD yalnızca ``get_visible_area`` okur; konum ve zoom boru üzerinden
+    gelen son mesajla güncellenir.
+    """
+
+    def __init__(self, screen_size, world_size):
+        self.screen_size = np.array(screen_size, dtype=np.float32)
+        self.position = np.array([0.0, 0.0], dtype=np.float32)
+        self.zoom_level = 1.0
+
+    def update(self, position, zoom_level: float):
+        self.position = np.array(position, dtype=np.float32)
+        self.zoom_level = float(zoom_level)
+
+    def get_visible_area(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Görünür alanın dünya koordinatları (Camera ile aynı hesap)"""
+        half = self.screen_size / 2 / self.zoom_level
+        return self.position - half, self.position + half
+
+
+class RenderBridge:
+    """Simülasyonu ayrı bir renderer sürecine bağlar; simülasyon çizimi hiç beklemez
+
+    İki kare tamponu ve bir kontrol bloğu shared memory'dedir. Renderer
+    ``FRONT`` tamponunu çizer ve bitirince ``CONSUMED = SEQ`` yazar;
+    simülasyon yalnızca renderer önceki kareyi bitirdiyse arka tampona yazıp
+    ``FRONT``/``SEQ``'i çevirir, aksi halde o tick yayın atlanır. Böylece
+    çizilen tampona asla yazılmaz ve yavaş bir kare yalnızca görüntü
+    kare hızını düşürür. Kamera ve UI girdileri (duraklatma, çıkış) boru
+    üzerinden geri gelir. Nüfus kapasiteyi aşarsa tamponlar büyütülür ve
+    yeni blok adları boruyla gönderilir (``GENERATION``).
+    """
+
+    def __init__(self, config: Dict[str, Any], world_size, organism_capacity: int = 4096,
+                 food_capacity: int = 4096):
+        """
+        Args:
+            config: Simülasyon yapılandırması (visualization ve fps okunur)
+            world_size: Dünya boyutu
+            organism_capacity: Başlangıç organizma kapasitesi
+            food_capacity: Başlangıç yiyecek kapasitesi
+        """
+        visualization = config.get('visualization', {})
+        self.screen_size = tuple(int(v) for v in visualization.get('screen_size', [1200, 800]))
+        self.fps = int(config.get('simulation', {}).get('fps', 60))
+        self.camera = RemoteCamera(self.screen_size, world_size)
+
+        self.control_block = SharedColumns(control_layout())
+        self.control = self.control_block['control']
+        self.buffers = []
+        self._allocate(organism_capacity, food_capacity)
+
+        # spawn: ana süreçteki çekirdek thread'leri ve açık kaynaklar kopyalanmaz
+        context = multiprocessing.get_context('spawn')
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=_render_entry,
+            args=(self.control_block.name, self.buffer_names(), self.capacities,
+                  self.screen_size, tuple(float(v) for v in world_size), self.fps, child),
+            name='ecosim-renderer', daemon=True)
+        self.process.start()
+        child.close()
+
+        self.stats = {
+            'published': 0,
+            'skipped': 0,
+            'resizes': 0,
+            'messages': 0
+        }
+
+        logger.info(f"🖼️  RenderBridge: renderer süreci başlatıldı (pid {self.process.pid})")
+
+    def _allocate(self, organism_capacity: int, food_capacity: int):
+        """Kare tamponlarını (yeniden) oluştur"""
+        for buffer in self.buffers:
+            buffer.close()
+        self.capacities = (int(organism_capacity), int(food_capacity))
+        layout = frame_layout(*self.capacities)
+        self.buffers = [SharedColumns(layout), SharedColumns(layout)]
+
+    def buffer_names(self):
+        return [buffer.name for buffer in self.buffers]
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def poll(self, simulation):
+        """Renderer'dan gelen girdileri uygula (beklemez)"""
+        try:
+            while self.connection.poll():
+                message = self.connection.recv()
+                self.stats['messages'] += 1
+                kind = message[0]
+                if kind == 'camera':
+                    self.camera.update(message[1], message[2])
+                elif kind == 'pause':
+                    simulation.paused = not simulation.paused
+                elif kind == 'quit':
+                    simulation.running = False
+        except (EOFError, OSError):
+            simulation.running = False
+        if not self.alive:
+            simulation.running = False
+
+    def maybe_publish(self, simulation) -> bool:
+        """Renderer önceki kareyi bitirdiyse yeni kareyi arka tampona yaz ve çevir"""
+        control = self.control
+        if control[CONSUMED] != control[SEQ]:
+            self.stats['skipped'] += 1
+            return False
+
+        world = simulation.world
+        organisms, food_slots = frame_sources(world)
+        n_org = len(organisms)
+        n_food = len(food_slots)
+        if n_org > self.capacities[0] or n_food > self.capacities[1]:
+            # Renderer eski blokları kendi eşlemesiyle okumaya devam eder;
+            # GENERATION değişince yeni adlar gelene kadar çizimi atlar
+            self._allocate(max(n_org * 2, self.capacities[0]), max(n_food * 2, self.capacities[1]))
+            control[GENERATION] += 1
+            self.connection.send(('buffers', int(control[GENERATION]), self.buffer_names(), self.capacities))
+            self.stats['resizes'] += 1
+
+        back = 1 - int(control[FRONT])
+        buffer = self.buffers[back]
+        write_frame_rows(world, organisms, food_slots,
+                         buffer['organisms'][:n_org], buffer['foods'][:n_food])
+        buffer['header'][:] = (simulation.frame_count, simulation.current_time,
+                               world.size[0], world.size[1], n_org, n_food)
+
+        control[FRONT] = back
+        control[SEQ] += 1
+        self.stats['published'] += 1
+        return True
+
+    def close(self):
+        """Renderer sürecini durdur ve blokları sil"""
+        self.control[CLOSED] = 1
+        try:
+            self.connection.send(('close',))
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+        for buffer in self.buffers:
+            buffer.close()
+        self.buffers = []
+        self.control = None
+        self.control_block.close()
+        logger.info(f"🖼️  RenderBridge kapatıldı: {self.stats['published']} kare yayımlandı")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Köprü istatistiklerini döndür"""
+        return dict(self.stats, organism_capacity=self.capacities[0], food_capacity=self.capacities[1])
@@ -0,0 +1,309 @@
+"""
+Ecosim Replay - Tick Bazlı Kayıt ve Bellek Eşlemeli Okuma
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .food import FOOD_TYPE_CODES
+from .utils import logger
+
+REPLAY_MAGIC = b'ECOREPLY'
+REPLAY_VERSION = 1
+HEADER_BYTES = 4096  # Kayıtlar sayfa hizalı başlar
+
+# Davranış durumu kodları (bilinmeyen durumlar UNKNOWN_STATE ile yazılır)
+REPLAY_STATES = ['wandering', 'hunting', 'fleeing', 'reproducing', 'resting']
+STATE_CODES = {name: code for code, name in enumerate(REPLAY_STATES)}
+UNKNOWN_STATE = 255
+
+# Renderer'ların okuduğu genler (renk, aura ve genetik etiket)
+REPLAY_GENES = ['aggression', 'energy_efficiency', 'vision_range',
+                'social_attraction', 'reproduction_threshold', 'speed']
+
+# Kare başına organizma kaydı (48 bayt)
+ORGANISM_FRAME_DTYPE = np.dtype([
+    ('id', '<i4'),
+    ('position', '<f4', (2,)),
+    ('energy', '<f4'),
+    ('age', '<f4'),
+    ('size', '<f4'),
+    ('fitness', '<f4'),
+    ('state', 'u1'),
+    ('color', 'u1', (3,)),
+    ('genes', '<f2', (len(REPLAY_GENES),)),
+    ('pad', 'u1', (4,))
+])
+
+# Kare başına yiyecek kaydı (24 bayt)
+FOOD_FRAME_DTYPE = np.dtype([
+    ('position', '<f4', (2,)),
+    ('energy', '<f4'),
+    ('size', '<f4'),
+    ('type', 'u1'),
+    ('moving', 'u1'),
+    ('pad', 'u1', (6,))
+])
+
+# Kare dizini kaydı (<kayıt>.idx dosyasına eklenir)
+FRAME_INDEX_DTYPE = np.dtype([
+    ('tick', '<i8'),
+    ('time', '<f8'),
+    ('offset', '<i8'),
+    ('organisms', '<i4'),
+    ('foods', '<i4'),
+    ('world_size', '<f4', (2,))
+])
+
+
+def frame_sources(world) -> Tuple[List, np.ndarray]:
+    """Kareye yazılacak canlı organizmalar ve canlı yiyecek slot'ları"""
+    organisms = [org for org in world.organisms if org is not None]
+    store = world.food_store
+    return organisms, np.flatnonzero(store.alive[:store.size])
+
+
+def write_frame_rows(world, organisms: List, food_slots: np.ndarray,
+                     org_rows: np.ndarray, food_rows: np.ndarray):
+    """Organizma ve yiyecek satırlarını verilen (mmap/shared memory) dizilere yaz"""
+    if len(organisms):
+        org_rows['id'] = [org.organism_id for org in organisms]
+        org_rows['position'] = [org.position for org in organisms]
+        org_rows['energy'] = [org.energy for org in organisms]
+        org_rows['age'] = [org.age for org in organisms]
+        org_rows['size'] = [org.size for org in organisms]
+        org_rows['fitness'] = [org.get_fitness() for org in organisms]
+        org_rows['state'] = [STATE_CODES.get(org.state, UNKNOWN_STATE) for org in organisms]
+        org_rows['color'] = [org.color for org in organisms]
+        org_rows['genes'] = [[org.dna.genes.get(name, 0.0) for name in REPLAY_GENES]
+                             for org in organisms]
+        org_rows['pad'] = 0
+    if len(food_slots):
+        store = world.food_store
+        foods = world.foods
+        food_rows['position'] = store.positions[food_slots]
+        food_rows['energy'] = store.energies[food_slots]
+        food_rows['size'] = [foods[slot].size for slot in food_slots.tolist()]
+        food_rows['type'] = store.type_codes[food_slots]
+        food_rows['moving'] = store.moving[food_slots]
+        food_rows['pad'] = 0
+
+
+def index_path_for(path) -> Path:
+    """Kayıt dosyasının kare dizini dosyası"""
+    path = Path(path)
+    return path.with_name(path.name + '.idx')
+
+
+class ReplayRecorder:
+    """Simülasyonun her tick'ini bellek eşlemeli ikili dosyaya ekler
+
+    Veri dosyası ``chunk_bytes`` büyüklüğünde parçalarla büyütülür ve
+    mmap üzerinden doğrudan yapılandırılmış dizilere yazılır. Her kare
+    için ``<kayıt>.idx`` dosyasına sabit boyutlu bir dizin kaydı eklenir;
+    kayıt yarıda kesilse bile dizindeki kareler okunabilir.
+    """
+
+    def __init__(self, path, world_size, fixed_dt: float, interval_ticks: int = 1,
+                 chunk_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            path: Kayıt dosyası yolu
+            world_size: Başlangıç dünya boyutu
+            fixed_dt: Simülasyon adımı (saniye)
+            interval_ticks: Kaç tick'te bir kare yazılacağı
+            chunk_bytes: Dosyanın her büyütmede eklenen boyutu
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.interval_ticks = max(1, int(interval_ticks))
+        self.chunk_bytes = max(mmap.ALLOCATIONGRANULARITY, int(chunk_bytes))
+
+        header = {
+            'version': REPLAY_VERSION,
+            'world_size': [float(v) for v in world_size],
+            'fixed_dt': float(fixed_dt),
+            'interval_ticks': self.interval_ticks,
+            'states': REPLAY_STATES,
+            'genes': REPLAY_GENES,
+            'food_types': sorted(FOOD_TYPE_CODES, key=FOOD_TYPE_CODES.get),
+            'organism_dtype': ORGANISM_FRAME_DTYPE.descr,
+            'food_dtype': FOOD_FRAME_DTYPE.descr
+        }
+        header_json = json.dumps(header).encode('utf-8')
+        if len(header_json) + 16 > HEADER_BYTES:
+            raise ValueError("Replay başlığı çok büyük")
+
+        self._file = open(self.path, 'w+b')
+        self._file.write(REPLAY_MAGIC)
+        self._file.write(np.array([REPLAY_VERSION, len(header_json)], dtype='<u4').tobytes())
+        self._file.write(header_json)
+        self._capacity = 0
+        self._map: Optional[mmap.mmap] = None
+        self._grow(HEADER_BYTES + self.chunk_bytes)
+        self.offset = HEADER_BYTES
+
+        self._index_file = open(index_path_for(self.path), 'wb')
+
+        self.stats = {
+            'frames': 0,
+            'organism_records': 0,
+            'food_records': 0,
+            'bytes_written': 0,
+            'grows': 0
+        }
+
+        logger.info(f"🎬 ReplayRecorder: {self.path} (her {self.interval_ticks} tick)")
+
+    def _grow(self, capacity: int):
+        """Dosyayı büyüt ve yeniden eşle"""
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._file.truncate(capacity)
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+
+    def _reserve(self, nbytes: int) -> int:
+        """nbytes için yer ayır, yazma ofsetini döndür"""
+        if self.offset + nbytes > self._capacity:
+            chunks = (self.offset + nbytes - self._capacity) // self.chunk_bytes + 1
+            self._grow(self._capacity + chunks * self.chunk_bytes)
+            self.stats['grows'] += 1
+        offset = self.offset
+        self.offset += nbytes
+        return offset
+
+    def maybe_record(self, simulation):
+        """Aralık dolduysa simülasyonun mevcut karesini yaz"""
+        if simulation.frame_count % self.interval_ticks == 0:
+            self.record(simulation)
+
+    def record(self, simulation):
+        """Simülasyonun mevcut karesini yaz"""
+        world = simulation.world
+        organisms, food_slots = frame_sources(world)
+        n_org = len(organisms)
+        n_food = len(food_slots)
+
+        offset = self._reserve(n_org * ORGANISM_FRAME_DTYPE.itemsize + n_food * FOOD_FRAME_DTYPE.itemsize)
+        org_rows = np.ndarray((n_org,), dtype=ORGANISM_FRAME_DTYPE, buffer=self._map, offset=offset)
+        food_rows = np.ndarray((n_food,), dtype=FOOD_FRAME_DTYPE, buffer=self._map,
+                               offset=offset + org_rows.nbytes)
+        try:
+            write_frame_rows(world, organisms, food_slots, org_rows, food_rows)
+        finally:
+            # mmap yeniden boyutlanabilsin diye görünümleri bırak
+            del org_rows, food_rows
+
+        entry = np.zeros(1, dtype=FRAME_INDEX_DTYPE)
+        entry['tick'] = simulation.frame_count
+        entry['time'] = simulation.current_time
+        entry['offset'] = offset
+        entry['organisms'] = n_org
+        entry['foods'] = n_food
+        entry['world_size'] = world.size
+        self._index_file.write(entry.tobytes())
+
+        self.stats['frames'] += 1
+        self.stats['organism_records'] += n_org
+        self.stats['food_records'] += n_food
+        self.stats['bytes_written'] = self.offset
+
+    def flush(self):
+        """Yazılanları diske aktar"""
+        if self._map is not None:
+            self._map.flush()
+        self._index_file.flush()
+
+    def close(self):
+        """Dosyayı kullanılan boyuta kırp ve kapat"""
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        self._file.truncate(self.offset)
+        self._file.close()
+        self._index_file.close()
+        logger.info(f"🎬 Replay kaydedildi: {self.path} ({self.stats['frames']} kare, "
+                    f"{self.offset / 1e6:.1f} MB)")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Kayıt istatistiklerini döndür"""
+        return dict(self.stats, path=str(self.path), interval_ticks=self.interval_ticks)
+
+
+class ReplayReader:
+    """Replay dosyasını bellek eşlemeyle okur; kareler kopyasız görünümlerdir"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Kayıt dosyası yolu
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            magic = f.read(len(REPLAY_MAGIC))
+            if magic != REPLAY_MAGIC:
+                raise ValueError(f"Replay dosyası değil: {self.path}")
+            version, header_len = np.frombuffer(f.read(8), dtype='<u4').tolist()
+            if version != REPLAY_VERSION:
+                raise ValueError(f"Desteklenmeyen replay sürümü: {version}")
+            self.header = json.loads(f.read(header_len).decode('utf-8'))
+
+        self.states = self.header['states']
+        self.genes = self.header['genes']
+        self.food_types = self.header['food_types']
+        self.frame_seconds = self.header['fixed_dt'] * self.header['interval_ticks']
+        self._data = None
+        self.index = np.zeros(0, dtype=FRAME_INDEX_DTYPE)
+        self.refresh()
+
+    def refresh(self):
+        """Dizini ve eşlemeyi yeniden oku (kayıt sürerken yeni kareler için)"""
+        index_path = index_path_for(self.path)
+        entries = os.path.getsize(index_path) // FRAME_INDEX_DTYPE.itemsize
+        self.index = np.fromfile(index_path, dtype=FRAME_INDEX_DTYPE, count=entries)
+        if os.path.getsize(self.path) > HEADER_BYTES:
+            self._data = np.memmap(self.path, dtype=np.uint8, mode='r')
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def frame(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """i. karenin organizma ve yiyecek kayıtları (salt okunur görünüm)"""
+        entry = self.index[i]
+        offset = int(entry['offset'])
+        n_org = int(entry['organisms'])
+        n_food = int(entry['foods'])
+        org_end = offset + n_org * ORGANISM_FRAME_DTYPE.itemsize
+        food_end = org_end + n_food * FOOD_FRAME_DTYPE.itemsize
+        organisms = self._data[offset:org_end].view(ORGANISM_FRAME_DTYPE)
+        foods = self._data[org_end:food_end].view(FOOD_FRAME_DTYPE)
+        return organisms, foods
+
+    def frame_at_tick(self, tick: int) -> int:
+        """Verilen tick'e kadar yazılmış son karenin indeksi"""
+        i = int(np.searchsorted(self.index['tick'], tick, side='right')) - 1
+        return min(max(i, 0), max(len(self.index) - 1, 0))
+
+    def get_info(self) -> Dict[str, Any]:
+        """Kayıt hakkında özet bilgi"""
+        if len(self.index) == 0:
+            return {'frames': 0, 'path': str(self.path)}
+        return {
+            'path': str(self.path),
+            'frames': len(self.index),
+            'first_tick': int(self.index['tick'][0]),
+            'last_tick': int(self.index['tick'][-1]),
+            'duration': float(self.index['time'][-1] - self.index['time'][0]),
+            'frame_seconds': self.frame_seconds,
+            'max_organisms': int(self.index['organisms'].max()),
+            'max_foods': int(self.index['foods'].max())
+        }
@@ -0,0 +1,376 @@
+"""
+Ecosim Results Catalog - data/stats Sonuç Dosyaları Üzerinde Sütunlu Katalog
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .utils import logger
+
+CATALOG_VERSION = 2
+CACHE_NAME = '.catalog.npz'
+
+# Satırı tanımlayan sütunlar (sorgularda her zaman başta)
+KEY_COLUMNS = ['run', 'file', 'mtime', 'complete']
+
+
+def flatten(data: Any, prefix: str, row: Dict[str, Any]):
+    """İç içe sözlüğü noktalı anahtarlara aç (listeler JSON metni olur)"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            flatten(value, f"{prefix}.{key}" if prefix else str(key), row)
+    elif isinstance(data, (list, tuple)):
+        row[prefix] = json.dumps(data, ensure_ascii=False)
+    elif data is not None:
+        row[prefix] = data
+
+
+def _scalars(data: Dict[str, Any], prefix: str, row: Dict[str, Any]):
+    for key, value in data.items():
+        if isinstance(value, (int, float, str, bool)):
+            row[f"{prefix}.{key}"] = value
+
+
+def _population_metrics(row: Dict[str, Any], final: Optional[float], summary: Optional[Dict[str, float]],
+                        samples: Sequence[float]):
+    """Nüfus özet metrikleri (``.json`` ve ``.jsonl`` için tek tanım)
+
+    Hepsi canlı organizma sayısıdır. ``final_population`` koşunun son
+    tick'indeki nüfus; ``peak_population``/``mean_population`` tüm koşuyu
+    kapsayan ``population_history`` özetinden, özet yoksa eldeki
+    örneklerden hesaplanır. Geçmiş seyrek örneklendiği için son tick
+    tepe değerine ayrıca katılır.
+
+    Args:
+        row: Doldurulacak satır
+        final: Son tick'teki canlı nüfus (None: son örnek kullanılır)
+        summary: population_history özetinin ``population`` alanı
+        samples: Özet yoksa kullanılacak nüfus örnekleri (eskiden yeniye)
+    """
+    if final is None and samples:
+        final = samples[-1]
+    if final is not None:
+        row['final_population'] = final
+    if summary:
+        peak, mean = summary['max'], summary['mean']
+    elif samples:
+        peak, mean = max(samples), float(np.mean(samples))
+    else:
+        return
+    row['peak_population'] = peak if final is None else max(peak, final)
+    row['mean_population'] = mean
+
+
+def read_result_file(path: Path) -> Dict[str, Any]:
+    """Tek sonuç dosyasını düz bir satıra çevir
+
+    ``.json``: ``export_results`` çıktısı. ``.jsonl``: akışlı dışa aktarım;
+    başlıktaki config ve son örnek/özet kullanılır (özet yoksa koşu
+    yarıda kalmıştır, ``complete`` 0 olur).
+    """
+    row: Dict[str, Any] = {}
+    if path.suffix == '.jsonl':
+        header, last, summary = {}, {}, None
+        samples = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Çöken koşunun yarım son satırı
+                kind = record.get('type')
+                if kind == 'header':
+                    header = record
+                elif kind == 'snapshot':
+                    last = record
+                    if 'population' in record:
+                        samples.append(record['population'])
+                elif kind == 'summary':
+                    summary = record
+        flatten(header.get('config', {}), 'config', row)
+        source = summary or last
+        row['frame_count'] = source.get('frame', header.get('frame'))
+        row['total_time'] = source.get('time', header.get('time'))
+        _scalars(source, 'stats', row)
+        for key in ('type', 'frame', 'time', 'wall_time'):
+            row.pop(f"stats.{key}", None)
+        _population_metrics(row, last.get('population'),
+                            (summary or {}).get('history', {}).get('population_history', {}).get('population'),
+                            samples)
+        _scalars((summary or {}).get('world_stats', {}), 'world', row)
+        row['complete'] = int(summary is not None)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        info = data.get('simulation_info', {})
+        flatten(info.get('config', {}), 'config', row)
+        row['frame_count'] = info.get('frame_count')
+        row['total_time'] = info.get('total_time')
+        statistics = data.get('statistics', {})
+        _scalars(statistics, 'stats', row)
+        _population_metrics(row, info.get('population'),
+                            data.get('history', {}).get('population_history', {}).get('summary', {}).get('population'),
+                            [entry['population'] for entry in statistics.get('population_history') or []
+                             if 'population' in entry])
+        _scalars(data.get('world_stats', {}), 'world', row)
+        row['complete'] = 1
+    return row
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (bool, int, float, np.integer, np.floating))
+
+
+class ResultsCatalog:
+    """data/stats altındaki sonuç dosyalarının tek tablodaki sütunlu kataloğu
+
+    Her koşu bir satırdır: config anahtarları noktalı sütunlara açılır
+    (``config.food.spawn_rate``), yanına özet metrikler eklenir. Tablo
+    ``.catalog.npz`` önbelleğinde sütun dizileri olarak tutulur; ``refresh``
+    yalnızca yeni ya da mtime/boyutu değişen dosyaları okur, silinenleri
+    düşer. Aynı adlı ``.json`` varsa akış dosyası (``.jsonl``) atlanır.
+    """
+
+    def __init__(self, directory='data/stats', cache: bool = True):
+        """
+        Args:
+            directory: Sonuç dosyalarının dizini
+            cache: Önbelleği oku/yaz
+        """
+        self.directory = Path(directory)
+        self.cache_path = self.directory / CACHE_NAME if cache else None
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._signatures: Dict[str, Tuple[float, int]] = {}
+        self.columns: Dict[str, np.ndarray] = {}
+
+        self.stats = {
+            'files_read': 0,
+            'files_cached': 0,
+            'files_failed': 0
+        }
+
+        if self.cache_path is not None:
+            self._load_cache()
+        self.refresh()
+
+    # --- Önbellek ---
+
+    def _load_cache(self):
+        if not self.cache_path.exists():
+            return
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as archive:
+                meta = json.loads(archive['meta'].tobytes().decode('utf-8'))
+                if meta.get('version') != CATALOG_VERSION:
+                    return
+                columns = {name: archive[f"col_{i}"] for i, name in enumerate(meta['columns'])}
+        except Exception as e:
+            logger.warning(f"⚠️  Katalog önbelleği okunamadı, yeniden oluşturulacak: {e}")
+            return
+        self._signatures = {name: tuple(signature) for name, signature in meta['files'].items()}
+        runs = columns.get('run', np.empty(0, dtype=str)).tolist()
+        for i, run in enumerate(runs):
+            row = {}
+            for name, column in columns.items():
+                value = column[i]
+                if column.dtype.kind == 'f':
+                    if value == value:
+                        row[name] = float(value)
+                elif value != '':
+                    row[name] = str(value)
+            self._rows[run] = row
+        self.columns = columns
+
+    def _save_cache(self):
+        names = list(self.columns)
+        meta = {'version': CATALOG_VERSION, 'columns': names,
+                'files': {name: list(signature) for name, signature in self._signatures.items()}}
+        arrays = {f"col_{i}": self.columns[name] for i, name in enumerate(names)}
+        arrays['meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp.npz')
+        np.savez(temp_path, **arrays)
+        os.replace(temp_path, self.cache_path)
+
+    # --- Yükleme ---
+
+    def _scan(self) -> Dict[str, Tuple[Path, Tuple[float, int]]]:
+        """Dizindeki sonuç dosyaları: koşu adı -> (yol, (mtime, boyut))"""
+        found = {}
+        if not self.directory.is_dir():
+            return found
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith('simulation_results_') or not entry.is_file():
+                    continue
+                if name.endswith('.json'):
+                    run = name[:-5]
+                elif name.endswith('.jsonl'):
+                    run = name[:-6]
+                    if run in found:
+                        continue
+                else:
+                    continue
+                stat = entry.stat()
+                found[run] = (Path(entry.path), (stat.st_mtime, stat.st_size))
+        return found
+
+    def refresh(self) -> int:
+        """Yeni ve değişen dosyaları oku; değişen satır sayısını döndür"""
+        found = self._scan()
+        changed = 0
+        for run in list(self._rows):
+            if run not in found:
+                del self._rows[run]
+                self._signatures.pop(run, None)
+                changed += 1
+        for run, (path, signature) in found.items():
+            if self._signatures.get(run) == signature and run in self._rows:
+                self.stats['files_cached'] += 1
+                continue
+            try:
+                row = read_result_file(path)
+            except Exception as e:
+                logger.warning(f"⚠️  Sonuç dosyası okunamadı: {path.name}: {e}")
+                self.stats['files_failed'] += 1
+                continue
+            row.update(run=run, file=path.name, mtime=signature[0])
+            self._rows[run] = row
+            self._signatures[run] = signature
+            self.stats['files_read'] += 1
+            changed += 1
+
+        if changed or not self.columns:
+            self._build_columns()
+            if self.cache_path is not None and self.directory.is_dir():
+                self._save_cache()
+        return changed
+
+    def _build_columns(self):
+        """Satırlardan sütun dizilerini oluştur (sayısal: float64/NaN, diğer: metin/'')"""
+        runs = sorted(self._rows, key=lambda run: (self._rows[run].get('mtime', 0.0), run))
+        rows = [self._rows[run] for run in runs]
+        names = list(KEY_COLUMNS)
+        seen = set(names)
+        for row in rows:
+            for name in row:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+        names = names[:len(KEY_COLUMNS)] + sorted(names[len(KEY_COLUMNS):])
+
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            present = [value for value in values if value is not None]
+            if present and all(_is_number(value) for value in present):
+                columns[name] = np.array([np.nan if value is None else float(value) for value in values],
+                                         dtype=np.float64)
+            else:
+                columns[name] = np.array(['' if value is None else str(value) for value in values], dtype=str)
+        self.columns = columns
+
+    # --- Sorgu ---
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            raise KeyError(f"Bilinmeyen sütun: {name}")
+        return self.columns[name]
+
+    def find_columns(self, pattern: str) -> List[str]:
+        """Adında ``pattern`` geçen sütunlar"""
+        return [name for name in self.columns if pattern in name]
+
+    def mask(self, where: Optional[Sequence[Tuple[str, str, Any]]] = None) -> np.ndarray:
+        """(sütun, işlem, değer) koşullarına uyan satırlar; işlemler: = != < <= > >="""
+        mask = np.ones(len(self), dtype=bool)
+        for name, op, value in where or []:
+            column = self.column(name)
+            if column.dtype.kind == 'f':
+                value = float(value)
+            else:
+                value = str(value)
+            if op == '=':
+                mask &= column == value
+            elif op == '!=':
+                mask &= column != value
+            elif op == '<':
+                mask &= column < value
+            elif op == '<=':
+                mask &= column <= value
+            elif op == '>':
+                mask &= column > value
+            elif op == '>=':
+                mask &= column >= value
+            else:
+                raise ValueError(f"Bilinmeyen karşılaştırma: {op}")
+        return mask
+
+    def select(self, columns: Optional[Sequence[str]] = None,
+               where: Optional[Sequence[Tuple[str, str, Any]]] = None,
+               sort: Optional[str] = None, descending: bool = False,
+               limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Süzülmüş ve sıralanmış sütunlar
+
+        Args:
+            columns: İstenen sütunlar (None: hepsi)
+            where: (sütun, işlem, değer) koşulları
+            sort: Sıralama sütunu
+            descending: Azalan sıra
+            limit: En fazla satır
+        """
+        indices = np.flatnonzero(self.mask(where))
+        if sort is not None:
+            order = np.argsort(self.column(sort)[indices], kind='stable')
+            if descending:
+                order = order[::-1]
+            indices = indices[order]
+        if limit is not None:
+            indices = indices[:limit]
+        names = list(columns) if columns else list(self.columns)
+        return {name: self.column(name)[indices] for name in names}
+
+    def group(self, by: str, metric: str, where: Optional[Sequence[Tuple[str, str, Any]]] = None) -> List[Dict[str, Any]]:
+        """``by`` değerlerine göre ``metric`` sütununun koşu sayısı, ortalaması, en küçüğü ve en büyüğü"""
+        mask = self.mask(where)
+        keys = self.column(by)[mask]
+        values = self.column(metric)[mask]
+        if values.dtype.kind != 'f':
+            raise ValueError(f"Sayısal olmayan metrik: {metric}")
+        result = []
+        for key in np.unique(keys):
+            group = values[keys == key]
+            group = group[~np.isnan(group)]
+            result.append({
+                by: key.item() if hasattr(key, 'item') else key,
+                'runs': int(np.count_nonzero(keys == key)),
+                'mean': float(group.mean()) if len(group) else float('nan'),
+                'min': float(group.min()) if len(group) else float('nan'),
+                'max': float(group.max()) if len(group) else float('nan')
+            })
+        return result
+
+    def varying_config(self) -> List[str]:
+        """Koşular arasında değeri değişen config sütunları (eksik değerler sayılmaz)"""
+        varying = []
+        for name, column in self.columns.items():
+            if not name.startswith('config.'):
+                continue
+            present = column[~np.isnan(column)] if column.dtype.kind == 'f' else column[column != '']
+            if len(np.unique(present)) > 1:
+                varying.append(name)
+        return varying
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Katalog istatistiklerini döndür"""
+        return dict(self.stats, runs=len(self), columns=len(self.columns))
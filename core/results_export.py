@@ -0,0 +1,149 @@
+"""
+Ecosim Results Export - Koşu Boyunca Akışlı İstatistik Dışa Aktarımı
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from .timeseries import TimeSeries
+from .utils import logger
+
+
+def _json_default(value):
+    """NumPy tiplerini JSON'a çevir"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def scalar_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """İstatistiklerin skaler kısmı (zaman serileri ve iç içe yapılar hariç)"""
+    return {key: value for key, value in stats.items()
+            if isinstance(value, (int, float, str, bool, np.generic))}
+
+
+def capture_snapshot(simulation) -> Dict[str, Any]:
+    """Tek satırlık, sabit boyutlu istatistik örneği"""
+    world = simulation.world
+    organisms = [org for org in world.organisms if org is not None]
+    store = world.food_store
+    return {
+        'type': 'snapshot',
+        'frame': simulation.frame_count,
+        'time': simulation.current_time,
+        'wall_time': time.time(),
+        'population': len(organisms),
+        'food_count': int(np.count_nonzero(store.alive[:store.size])),
+        'species': len({org.species for org in organisms}),
+        **scalar_stats(simulation.stats),
+        'total_food_eaten': world.stats.get('total_food_eaten', 0)
+    }
+
+
+def build_summary(simulation) -> Dict[str, Any]:
+    """Koşunun kısa son özeti (config ve geçmiş satırları olmadan)"""
+    return {
+        'type': 'summary',
+        'frame': simulation.frame_count,
+        'time': simulation.current_time,
+        'wall_time': time.time(),
+        **scalar_stats(simulation.stats),
+        'history': {key: value.summary() for key, value in simulation.stats.items()
+                    if isinstance(value, TimeSeries)},
+        'world_stats': simulation.world.get_statistics()
+    }
+
+
+class StreamingExporter:
+    """İstatistik örneklerini koşu boyunca bir JSONL dosyasına ekler
+
+    İlk satır config'i içeren başlık, ardından her ``interval_seconds``
+    simülasyon saniyesinde bir örnek, en sonda kısa bir özet yazılır. Her
+    satır yazıldığı anda flush edilir (istenirse fsync); koşu çökerse o ana
+    kadarki örnekler dosyada kalır ve aralık başına maliyet sabittir.
+    """
+
+    def __init__(self, export_config: Optional[Dict[str, Any]] = None, fixed_dt: float = 1.0 / 60.0):
+        """
+        Args:
+            export_config: Dışa aktarım ayarları (directory, name, interval_seconds, fsync)
+            fixed_dt: Simülasyon adımı (aralığı tick'e çevirmek için)
+        """
+        export_config = export_config or {}
+        self.directory = Path(export_config.get('directory', 'data/stats'))
+        self.stem = export_config.get('name') or f"simulation_results_{int(time.time())}"
+        self.path = self.directory / f"{self.stem}.jsonl"
+        self.interval_seconds = float(export_config.get('interval_seconds', 10.0))
+        self.interval_ticks = max(1, int(round(self.interval_seconds / fixed_dt)))
+        self.fsync = bool(export_config.get('fsync', False))
+
+        self._file = None
+        self.finished = False
+
+        self.stats = {
+            'snapshots': 0,
+            'bytes_written': 0
+        }
+
+    def _write(self, record: Dict[str, Any]):
+        line = (json.dumps(record, ensure_ascii=False, default=_json_default) + '\n').encode('utf-8')
+        self._file.write(line)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.stats['bytes_written'] += len(line)
+
+    def _open(self, simulation):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._write({
+            'type': 'header',
+            'started_at': time.time(),
+            'frame': simulation.frame_count,
+            'time': simulation.current_time,
+            'fixed_dt': simulation.fixed_dt,
+            'config': simulation.config
+        })
+        logger.info(f"📊 Akışlı dışa aktarım: {self.path} (her {self.interval_seconds:g} sn)")
+
+    def maybe_write(self, simulation):
+        """Aralık dolduysa örnek yaz (başlık ilk tick'te yazılır)"""
+        if self._file is None and not self.finished:
+            self._open(simulation)
+        if simulation.frame_count % self.interval_ticks == 0:
+            self.write_snapshot(simulation)
+
+    def write_snapshot(self, simulation):
+        """Anlık istatistik örneğini dosyaya ekle"""
+        if self.finished:
+            return
+        if self._file is None:
+            self._open(simulation)
+        self._write(capture_snapshot(simulation))
+        self.stats['snapshots'] += 1
+
+    def finish(self, simulation):
+        """Son örneği ve özeti yaz, dosyayı kapat (tekrar çağrılırsa bir şey yapmaz)"""
+        if self.finished:
+            return
+        if simulation.frame_count % self.interval_ticks != 0 or self._file is None:
+            self.write_snapshot(simulation)
+        self._write(build_summary(simulation))
+        self.close()
+
+    def close(self):
+        self.finished = True
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Dışa aktarım istatistiklerini döndür"""
+        return dict(self.stats, path=str(self.path), finished=self.finished)
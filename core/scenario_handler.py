@@ -228,6 +228,13 @@ class ScenarioHandler:
             direction = event_config.get('direction', 'right')
             amount = event_config.get('amount', 500)
             simulation.world.expand_world(direction, amount)
+            simulation.food_spawner.on_world_resized(simulation.world)
+        
+        elif modification_type == 'biome_fertility':
+            biome_key = event_config.get('biome', 'forest')
+            fertility = event_config.get('fertility', 0.5)
+            simulation.world.set_biome_fertility(biome_key, fertility)
+            simulation.food_spawner.on_biome_changed(simulation.world, biome_key)
     
     def _change_parameters_event(self, event_config: Dict, simulation):
         """Parametre değişikliği olayı"""
@@ -0,0 +1,210 @@
+"""
+Ecosim Scent Field - Kaba Grid Üzerinde Yiyecek Koku/Yoğunluk Alanı
+"""
+
+import numpy as np
+from typing import Dict, Any, Optional
+from .utils import logger
+
+# scipy opsiyonel ve ilk bulanıklaştırmada yüklenir: yoksa basit kutu bulanıklaştırma kullanılır
+_ndimage = None
+
+
+def _get_ndimage():
+    """scipy.ndimage modülünü döndür (yoksa None)"""
+    global _ndimage
+    if _ndimage is None:
+        try:
+            from scipy import ndimage
+            _ndimage = ndimage
+        except ImportError:
+            _ndimage = False
+    return _ndimage or None
+
+
+class FoodScentField:
+    """Hücre başına yiyecek enerjisi ve ondan türetilen bulanık koku alanı
+
+    ``density`` ve ``counts`` yiyecek eklenince, yenince ve bozuldukça
+    artımlı güncellenir. ``scent`` belirli aralıklarla ``density``'nin
+    bulanıklaştırılmasıyla yenilenir; organizmalar yiyecek göremediğinde
+    bu alanın gradyanını O(1) örnekleyerek yiyecekçe zengin bölgelere
+    yönelir.
+    """
+
+    def __init__(self, world_size, scent_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            world_size: Dünya boyutu
+            scent_config: ``food.scent`` yapılandırması
+        """
+        scent_config = scent_config or {}
+        self.enabled = scent_config.get('enabled', True)
+        self.cell_size = float(scent_config.get('cell_size', 50.0))
+        self.blur_sigma = float(scent_config.get('blur_sigma', 2.0))
+        self.blur_interval = int(scent_config.get('blur_interval', 10))
+
+        self.shape = (0, 0)
+        self.density = np.zeros((0, 0), dtype=np.float32)
+        self.counts = np.zeros((0, 0), dtype=np.int32)
+        self.scent = np.zeros((0, 0), dtype=np.float32)
+        self.resize(world_size)
+
+        # Yiyecek slot'u -> yatırıldığı düz hücre indeksi
+        self.food_cells = np.full(1024, -1, dtype=np.int64)
+
+        self.ticks_since_blur = 0
+        self.stats = {
+            'blurs': 0
+        }
+
+        logger.info(f"👃 FoodScentField oluşturuldu: {self.shape[1]}x{self.shape[0]} hücre")
+
+    def resize(self, world_size):
+        """Grid'i dünya boyutuna göre büyüt (mevcut değerler korunur)"""
+        cells_x = int(np.ceil(float(world_size[0]) / self.cell_size))
+        cells_y = int(np.ceil(float(world_size[1]) / self.cell_size))
+        old_h, old_w = self.shape
+        new_shape = (max(cells_y, old_h), max(cells_x, old_w))
+
+        # Düz hücre indeksleri satır genişliğine bağlı: eski indeksleri çevir
+        if old_w and new_shape[1] != old_w and hasattr(self, 'food_cells'):
+            tracked = self.food_cells >= 0
+            rows, cols = np.divmod(self.food_cells[tracked], old_w)
+            self.food_cells[tracked] = rows * new_shape[1] + cols
+
+        for name, dtype in (('density', np.float32), ('counts', np.int32), ('scent', np.float32)):
+            grown = np.zeros(new_shape, dtype=dtype)
+            grown[:old_h, :old_w] = getattr(self, name)
+            setattr(self, name, grown)
+        self.shape = new_shape
+
+    def _cells_of(self, positions: np.ndarray) -> np.ndarray:
+        """Pozisyonların düz hücre indeksleri"""
+        cells = (np.asarray(positions, dtype=np.float64) // self.cell_size).astype(np.int64)
+        cx = np.clip(cells[..., 0], 0, self.shape[1] - 1)
+        cy = np.clip(cells[..., 1], 0, self.shape[0] - 1)
+        return cy * self.shape[1] + cx
+
+    def deposit(self, slots: np.ndarray, store):
+        """Yeni eklenen yiyecekleri alana işle"""
+        if not self.enabled or len(slots) == 0:
+            return
+        slots = np.asarray(slots, dtype=np.int64)
+        if slots.max() >= len(self.food_cells):
+            grown = np.full(max(int(slots.max()) + 1, len(self.food_cells) * 2), -1, dtype=np.int64)
+            grown[:len(self.food_cells)] = self.food_cells
+            self.food_cells = grown
+
+        cells = self._cells_of(store.positions[slots])
+        self.food_cells[slots] = cells
+        size = self.density.size
+        self.density.ravel()[:] += np.bincount(cells, weights=store.energies[slots], minlength=size).astype(np.float32)
+        self.counts.ravel()[:] += np.bincount(cells, minlength=size).astype(np.int32)
+
+    def withdraw(self, slot: int, store):
+        """Yenen veya bozulan yiyeceği alandan çıkar"""
+        if not self.enabled or slot >= len(self.food_cells):
+            return
+        cell = self.food_cells[slot]
+        if cell < 0:
+            return
+        self.density.ravel()[cell] -= store.energies[slot]
+        self.counts.ravel()[cell] -= 1
+        self.food_cells[slot] = -1
+
+    def track_store(self, store, delta_time: float):
+        """FoodStore.update sonrası bozulma ve hareketi alana yansıt"""
+        if not self.enabled:
+            return
+        n = min(store.size, len(self.food_cells))
+        alive = store.alive[:n]
+        cells = self.food_cells[:n]
+        size = self.density.size
+        density = self.density.ravel()
+
+        # Bozulma: store.update ile aynı miktar
+        decaying = np.flatnonzero(alive & (store.decay_rates[:n] > 0) & (cells >= 0))
+        if decaying.size:
+            density -= np.bincount(
+                cells[decaying],
+                weights=store.decay_rates[decaying] * delta_time,
+                minlength=size
+            ).astype(np.float32)
+
+        # Hücre değiştiren hareketli yiyecekler
+        movers = np.flatnonzero(alive & store.moving[:n] & (cells >= 0))
+        if movers.size:
+            new_cells = self._cells_of(store.positions[movers])
+            changed = new_cells != cells[movers]
+            if np.any(changed):
+                moved = movers[changed]
+                energies = store.energies[moved]
+                np.subtract.at(density, cells[moved], energies)
+                np.add.at(density, new_cells[changed], energies)
+                np.subtract.at(self.counts.ravel(), cells[moved], 1)
+                np.add.at(self.counts.ravel(), new_cells[changed], 1)
+                self.food_cells[moved] = new_cells[changed]
+
+        # Periyodik bulanıklaştırma
+        self.ticks_since_blur += 1
+        if self.ticks_since_blur >= self.blur_interval:
+            self.refresh_scent()
+
+    def refresh_scent(self):
+        """Yoğunluk alanını bulanıklaştırarak koku alanını yenile"""
+        source = np.maximum(self.density, 0.0)
+        ndimage = _get_ndimage()
+        if ndimage is not None:
+            self.scent = ndimage.gaussian_filter(source, sigma=self.blur_sigma, mode='nearest')
+        else:
+            # 3x3 kutu bulanıklaştırma (sigma kadar tekrar)
+            blurred = source
+            for _ in range(max(1, int(round(self.blur_sigma)))):
+                padded = np.pad(blurred, 1, mode='edge')
+                blurred = sum(
+                    padded[1 + dy:1 + dy + self.shape[0], 1 + dx:1 + dx + self.shape[1]]
+                    for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                ) / 9.0
+            self.scent = blurred.astype(np.float32)
+        self.ticks_since_blur = 0
+        self.stats['blurs'] += 1
+
+    def sample_gradient(self, position: np.ndarray) -> np.ndarray:
+        """Pozisyondaki koku gradyanı (dünya yönünde, O(1))"""
+        h, w = self.shape
+        cx = min(max(int(position[0] // self.cell_size), 0), w - 1)
+        cy = min(max(int(position[1] // self.cell_size), 0), h - 1)
+        scent = self.scent
+        gx = scent[cy, min(cx + 1, w - 1)] - scent[cy, max(cx - 1, 0)]
+        gy = scent[min(cy + 1, h - 1), cx] - scent[max(cy - 1, 0), cx]
+        return np.array([gx, gy], dtype=np.float64)
+
+    def has_food_near(self, position: np.ndarray, radius: float) -> bool:
+        """Yarıçapı kapsayan hücrelerde yiyecek var mı (tarama öncesi hızlı kontrol)"""
+        h, w = self.shape
+        x0 = max(int((position[0] - radius) // self.cell_size), 0)
+        x1 = min(int((position[0] + radius) // self.cell_size), w - 1)
+        y0 = max(int((position[1] - radius) // self.cell_size), 0)
+        y1 = min(int((position[1] + radius) // self.cell_size), h - 1)
+        if x1 < x0 or y1 < y0:
+            return False
+        return bool(self.counts[y0:y1 + 1, x0:x1 + 1].any())
+
+    def clear(self):
+        """Alanı sıfırla"""
+        self.density[:] = 0.0
+        self.counts[:] = 0
+        self.scent[:] = 0.0
+        self.food_cells[:] = -1
+        self.ticks_since_blur = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Alan istatistiklerini döndür"""
+        return {
+            **self.stats,
+            'enabled': self.enabled,
+            'cells': int(self.density.size),
+            'total_energy': float(self.density.sum()),
+            'food_count': int(self.counts.sum())
+        }
@@ -0,0 +1,334 @@
+"""
+Ecosim Sensing - Tick Başına Komşuluk Özetleri
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+from .utils import lazy_jit, logger
+from .kernel_pool import KernelPool
+
+
+@lazy_jit(nopython=True, nogil=True, cache=True)
+def _aggregate_neighborhoods(order, start, end, partials, chunk,
+                             positions, radii, species, threat,
+                             cell_x, cell_y, cell_start, cell_items,
+                             grid_w, grid_h, cell_size,
+                             nearest_any, nearest_any_dist,
+                             nearest_same, nearest_same_dist,
+                             same_centroid, neighbor_count, same_count,
+                             nearest_threat, nearest_threat_dist):
+    """order[start:end] satırları için komşuluk özetlerini hesapla
+
+    Yalnızca bu satırların çıktılarına ve partials[chunk] satırına yazar
+    (partials[chunk, 0]: komşu çifti sayısı).
+    """
+    for k in range(start, end):
+        i = order[k]
+        px = positions[i, 0]
+        py = positions[i, 1]
+        radius_sq = radii[i] * radii[i]
+        reach = int(radii[i] // cell_size) + 1
+
+        best_any = np.inf
+        best_same = np.inf
+        best_threat = np.inf
+        sum_x = 0.0
+        sum_y = 0.0
+        count = 0
+        count_same = 0
+
+        x_lo = max(0, cell_x[i] - reach)
+        x_hi = min(grid_w, cell_x[i] + reach + 1)
+        y_lo = max(0, cell_y[i] - reach)
+        y_hi = min(grid_h, cell_y[i] + reach + 1)
+
+        for cx in range(x_lo, x_hi):
+            for cy in range(y_lo, y_hi):
+                cell = cx * grid_h + cy
+                for m in range(cell_start[cell], cell_start[cell + 1]):
+                    j = cell_items[m]
+                    if j == i:
+                        continue
+                    dx = positions[j, 0] - px
+                    dy = positions[j, 1] - py
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq > radius_sq:
+                        continue
+
+                    count += 1
+                    if dist_sq < best_any:
+                        best_any = dist_sq
+                        nearest_any[i] = j
+
+                    if species[j] == species[i]:
+                        count_same += 1
+                        sum_x += positions[j, 0]
+                        sum_y += positions[j, 1]
+                        if dist_sq < best_same:
+                            best_same = dist_sq
+                            nearest_same[i] = j
+                    elif threat[j] and dist_sq < best_threat:
+                        best_threat = dist_sq
+                        nearest_threat[i] = j
+
+        neighbor_count[i] = count
+        same_count[i] = count_same
+        partials[chunk, 0] += count
+        nearest_any_dist[i] = np.sqrt(best_any)
+        nearest_same_dist[i] = np.sqrt(best_same)
+        nearest_threat_dist[i] = np.sqrt(best_threat)
+        if count_same > 0:
+            same_centroid[i, 0] = sum_x / count_same
+            same_centroid[i, 1] = sum_y / count_same
+        else:
+            same_centroid[i, 0] = px
+            same_centroid[i, 1] = py
+
+
+@lazy_jit(nopython=True, nogil=True, cache=True)
+def _nearest_foods(order, start, end, partials, chunk,
+                   positions, radii, cell_x, cell_y,
+                   food_pos, food_slots, food_start, food_items,
+                   grid_w, grid_h, cell_size,
+                   nearest_food, nearest_food_dist):
+    """order[start:end] satırları için görüş alanındaki en yakın yiyeceği bul
+
+    partials[chunk, 0]: görüşünde yiyecek olan organizma sayısı.
+    """
+    for k in range(start, end):
+        i = order[k]
+        px = positions[i, 0]
+        py = positions[i, 1]
+        reach = int(radii[i] // cell_size) + 1
+        best = radii[i] * radii[i]
+        best_j = -1
+
+        for cx in range(max(0, cell_x[i] - reach), min(grid_w, cell_x[i] + reach + 1)):
+            for cy in range(max(0, cell_y[i] - reach), min(grid_h, cell_y[i] + reach + 1)):
+                cell = cx * grid_h + cy
+                for m in range(food_start[cell], food_start[cell + 1]):
+                    j = food_items[m]
+                    dx = food_pos[j, 0] - px
+                    dy = food_pos[j, 1] - py
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < best or (dist_sq == best and best_j < 0):
+                        best = dist_sq
+                        best_j = j
+
+        if best_j >= 0:
+            nearest_food[i] = food_slots[best_j]
+            nearest_food_dist[i] = np.sqrt(best)
+            partials[chunk, 0] += 1
+
+
+def _counting_sort(keys: np.ndarray, cell_count: int):
+    """Hücre anahtarlarına göre (başlangıç dizisi, sıralı satırlar)"""
+    items = np.argsort(keys, kind='stable').astype(np.int64)
+    start = np.zeros(cell_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=cell_count), out=start[1:])
+    return start, items
+
+
+class NeighborhoodSensor:
+    """Her tick'te organizma komşuluk özetlerini hesaplayan algılama aşaması
+
+    Sosyal, kaçma ve sürü davranışları komşu listesini tek tek dolaşmak
+    yerine buradaki dizileri okur; yiyecek arama da görüş alanındaki en
+    yakın yiyeceği buradan alır. Satır indeksleri ``organism.sense_row``
+    ile eşlenir; sonuçlardaki organizma indeksleri ``world.organisms``,
+    yiyecek indeksleri ``world.foods`` slot indeksleridir (-1 = yok).
+
+    Çekirdekler ``KernelPool`` ile hücre sırasına göre dizilmiş satır
+    parçalarında thread'lere dağıtılır; her parça yalnızca kendi
+    satırlarına yazdığından sonuç thread sayısından bağımsızdır.
+    """
+
+    def __init__(self, cell_size: float = 100.0, threads: Optional[int] = 1):
+        """
+        Args:
+            cell_size: Komşu araması için grid hücre boyutu
+            threads: Çekirdek thread sayısı (None: çekirdek sayısı, 1: seri)
+        """
+        self.cell_size = float(cell_size)
+        self.tick = 0
+        self.species_codes: Dict[str, int] = {}
+        self.pool = KernelPool(threads)
+        self.stats = {
+            'neighbor_pairs': 0,
+            'organisms_near_food': 0
+        }
+
+        self.slots = np.zeros(0, dtype=np.int64)
+        self.positions = np.zeros((0, 2), dtype=np.float64)
+        self._reset_outputs(0)
+
+        logger.debug(f"👁️ NeighborhoodSensor oluşturuldu: cell_size={cell_size}")
+
+    def _reset_outputs(self, n: int):
+        """Çıktı dizilerini n satır için hazırla"""
+        self.nearest_any = np.full(n, -1, dtype=np.int64)
+        self.nearest_any_dist = np.full(n, np.inf)
+        self.nearest_same = np.full(n, -1, dtype=np.int64)
+        self.nearest_same_dist = np.full(n, np.inf)
+        self.same_centroid = np.zeros((n, 2), dtype=np.float64)
+        self.neighbor_count = np.zeros(n, dtype=np.int64)
+        self.same_count = np.zeros(n, dtype=np.int64)
+        self.nearest_threat = np.full(n, -1, dtype=np.int64)
+        self.nearest_threat_dist = np.full(n, np.inf)
+        self.nearest_food = np.full(n, -1, dtype=np.int64)
+        self.nearest_food_dist = np.full(n, np.inf)
+        self.nearest_food_generation = np.zeros(n, dtype=np.int64)
+
+    def set_threads(self, threads: Optional[int]):
+        """Çekirdek thread sayısını değiştir"""
+        self.pool.close()
+        self.pool = KernelPool(threads)
+
+    def _species_code(self, species: str) -> int:
+        """Tür adını sayısal koda çevir"""
+        code = self.species_codes.get(species)
+        if code is None:
+            code = len(self.species_codes)
+            self.species_codes[species] = code
+        return code
+
+    def sense(self, world):
+        """Dünyadaki tüm canlı organizmalar için komşuluk özetlerini hesapla"""
+        self.tick += 1
+
+        slots = []
+        for i, org in enumerate(world.organisms):
+            if org is not None:
+                slots.append(i)
+
+        n = len(slots)
+        self.slots = np.array(slots, dtype=np.int64)
+        self._reset_outputs(n)
+        if n == 0:
+            self.positions = np.zeros((0, 2), dtype=np.float64)
+            return
+
+        positions = np.empty((n, 2), dtype=np.float64)
+        radii = np.empty(n, dtype=np.float64)
+        species = np.empty(n, dtype=np.int64)
+        threat = np.zeros(n, dtype=np.bool_)
+
+        for row, slot in enumerate(slots):
+            org = world.organisms[slot]
+            positions[row] = org.position
+            radii[row] = org.dna.genes['vision_range']
+            species[row] = self._species_code(org.species)
+            threat[row] = org.diet_type == 'carnivore'
+            org.sense_row = row
+            org.sense_tick = self.tick
+
+        # Canlı yiyecekler (FoodStore slot'ları)
+        store = getattr(world, 'food_store', None)
+        if store is not None:
+            food_slots = np.flatnonzero(store.alive[:store.size])
+            food_pos = store.positions[food_slots].astype(np.float64)
+        else:
+            food_slots = np.zeros(0, dtype=np.int64)
+            food_pos = np.zeros((0, 2), dtype=np.float64)
+
+        # Organizma ve yiyecekleri kapsayan ortak grid, counting sort ile yoğun hücre listeleri
+        origin = positions.min(axis=0)
+        if len(food_pos):
+            origin = np.minimum(origin, food_pos.min(axis=0))
+        cells = ((positions - origin) // self.cell_size).astype(np.int64)
+        food_cells = ((food_pos - origin) // self.cell_size).astype(np.int64)
+        extent = cells.max(axis=0)
+        if len(food_cells):
+            extent = np.maximum(extent, food_cells.max(axis=0))
+        grid_w = int(extent[0]) + 1
+        grid_h = int(extent[1]) + 1
+        cell_count = grid_w * grid_h
+        cell_start, cell_items = _counting_sort(cells[:, 0] * grid_h + cells[:, 1], cell_count)
+        cell_x = cells[:, 0].copy()
+        cell_y = cells[:, 1].copy()
+
+        # cell_items hücre sırasındaki satırlardır: parçalar uzamsal olarak bitişik
+        pairs = self.pool.run(_aggregate_neighborhoods, cell_items, (
+            positions, radii, species, threat,
+            cell_x, cell_y, cell_start, cell_items,
+            grid_w, grid_h, self.cell_size,
+            self.nearest_any, self.nearest_any_dist,
+            self.nearest_same, self.nearest_same_dist,
+            self.same_centroid, self.neighbor_count, self.same_count,
+            self.nearest_threat, self.nearest_threat_dist
+        ))
+        self.stats['neighbor_pairs'] = int(pairs[0])
+
+        near_food = 0
+        if len(food_slots):
+            food_start, food_items = _counting_sort(food_cells[:, 0] * grid_h + food_cells[:, 1], cell_count)
+            near_food = self.pool.run(_nearest_foods, cell_items, (
+                positions, radii, cell_x, cell_y,
+                food_pos, food_slots.astype(np.int64), food_start, food_items,
+                grid_w, grid_h, self.cell_size,
+                self.nearest_food, self.nearest_food_dist
+            ))[0]
+            found = self.nearest_food >= 0
+            self.nearest_food_generation[found] = store.generations[self.nearest_food[found]]
+        self.stats['organisms_near_food'] = int(near_food)
+
+        self.positions = positions
+
+    def row_of(self, organism) -> int:
+        """Organizmanın bu tick'teki satırını döndür (-1 = algılanmadı)"""
+        if getattr(organism, 'sense_tick', -1) != self.tick:
+            return -1
+        return organism.sense_row
+
+    def _organism_at(self, world, row: int):
+        """Satır indeksindeki organizmayı döndür (ölmüşse None)"""
+        if row < 0:
+            return None
+        slot = self.slots[row]
+        if slot < len(world.organisms):
+            organism = world.organisms[slot]
+            # Slot bu tick içinde yeni doğana verilmiş olabilir
+            if organism is not None and self.row_of(organism) == row:
+                return organism
+        return None
+
+    def nearest_organism(self, world, row: int):
+        """En yakın organizma"""
+        return self._organism_at(world, self.nearest_any[row])
+
+    def nearest_same_species(self, world, row: int, max_distance: float = np.inf):
+        """En yakın aynı türden organizma (max_distance içinde)"""
+        if self.nearest_same_dist[row] > max_distance:
+            return None
+        return self._organism_at(world, self.nearest_same[row])
+
+    def nearest_threat_organism(self, world, row: int):
+        """En yakın tehdit (başka türden etçil)"""
+        return self._organism_at(world, self.nearest_threat[row])
+
+    def nearby_foods(self, world, row: int, position: np.ndarray, radius: float) -> List[int]:
+        """Görüş alanındaki en yakın yiyecek (liste olarak, yoksa boş)
+
+        Algılanan yiyecek bu tick'te başka bir organizma tarafından
+        yendiyse ``world.get_nearby_foods`` ile canlı tarama yapılır.
+        """
+        slot = self.nearest_food[row]
+        if slot < 0:
+            return []
+        if slot < len(world.foods) and world.foods[slot] is not None and \
+                world.food_store.generations[slot] == self.nearest_food_generation[row]:
+            return [int(slot)]
+        return world.get_nearby_foods(position, radius)
+
+    def get_aggregates(self, row: int) -> Optional[Dict[str, float]]:
+        """Tek satırın özetini sözlük olarak döndür"""
+        if row < 0 or row >= len(self.slots):
+            return None
+        return {
+            'neighbor_count': int(self.neighbor_count[row]),
+            'same_species_count': int(self.same_count[row]),
+            'nearest_distance': float(self.nearest_any_dist[row]),
+            'nearest_same_distance': float(self.nearest_same_dist[row]),
+            'nearest_threat_distance': float(self.nearest_threat_dist[row]),
+            'same_species_centroid': self.same_centroid[row].tolist()
+        }
@@ -2,7 +2,6 @@
 Ecosim Simulation - Ana Simülasyon Motoru
 """
 
-import pygame
 import numpy as np
 import time
 import json
@@ -12,15 +11,21 @@ from pathlib import Path
 from .world import World
 from .organism import Organism, DNA
 from .food import Food, FoodSpawner
-from .camera import Camera
 from .species_manager import SpeciesManager
+from .lod import UpdateLevelOfDetail
+from .timeseries import TimeSeries
 from .utils import (
     generate_random_positions,
     save_simulation_data,
     perf_monitor,
+    configure_event_log,
+    get_event_log,
     logger
 )
-from visuals import OrganismRenderer, FoodRenderer, UIRenderer, CameraOverlay, PerformanceMonitor
+
+# pygame ve görselleştirme modülleri yalnızca görsel modda yüklenir;
+# headless çalıştırmalar pygame kurulu olmadan da çalışır
+pygame = None
 
 class Simulation:
     """Ana simülasyon motoru"""
@@ -32,12 +37,19 @@ class Simulation:
             headless: Görsel olmadan çalışma modu
         """
         self.config = config
+        
+        # Ayrı süreç renderer: bu süreç pygame açmaz, kareler shared memory ile gider
+        use_render_process = not headless and config.get('visualization', {}).get('render_process', False)
+        if use_render_process:
+            headless = True
         self.headless = headless
+        self.render_bridge = None
         
         # Simülasyon durumu
         self.running = False
         self.paused = False
-        self.frame_count = 0
+        self.frame_count = 0  # Simülasyon tick sayısı
+        self.render_count = 0  # Çizilen frame sayısı
         self.start_time = time.time()
         self.current_time = 0.0
         
@@ -46,6 +58,13 @@ class Simulation:
         self.frame_time = 1.0 / self.target_fps
         self.last_frame_time = 0.0
         
+        # Sabit zaman adımı (render'dan bağımsız)
+        self.fixed_dt = config.get('simulation', {}).get('fixed_dt', self.frame_time)
+        self.max_catch_up_ticks = config.get('simulation', {}).get('max_catch_up_ticks', 5)
+        self.accumulator = 0.0
+        self.render_alpha = 0.0  # İki tick arası render interpolasyonu
+        self.stats_interval_ticks = max(1, int(round(1.0 / self.fixed_dt)))  # Her simülasyon saniyesi
+        
         # Performans modu ayarları
         self.performance_mode = config.get('simulation', {}).get('performance_mode', 'medium')
         self.debug_mode = config.get('simulation', {}).get('debug_mode', False)
@@ -53,22 +72,45 @@ class Simulation:
         # Performans moduna göre ayarlar
         self._apply_performance_settings()
         
+        # Kamera mesafesine göre güncelleme sıklığı
+        self.update_lod = UpdateLevelOfDetail(config.get('simulation', {}).get('lod', {}))
+        
         # Dünya ve sistemler
         world_size = config.get('simulation', {}).get('world_size', [2000, 2000])
         max_organisms = config.get('simulation', {}).get('max_organisms', 2000)
-        self.world = World(size=world_size)
+        # Koku alanı ayarları diğer yiyecek ayarları gibi üst düzey food.scent'ten okunur;
+        # varsayılan config'deki simulation.food.scent yalnızca eksik anahtarları doldurur
+        scent_config = {**(config.get('simulation', {}).get('food', {}).get('scent') or {}),
+                        **(config.get('food', {}).get('scent') or {})}
+        self.world = World(size=world_size, scent_config=scent_config)
         self.world.max_organisms = max_organisms
+        self.world.scheduler.tick_seconds = self.fixed_dt
+        
+        # Algılama çekirdekleri için thread sayısı (varsayılan: tüm çekirdekler)
+        self.world.neighborhood.set_threads(config.get('simulation', {}).get('kernel_threads'))
         
         # Tür yöneticisi
         self.species_manager = SpeciesManager()
+        self.species_manager.apply_overrides(config.get('species', {}))
         self.world.species_manager = self.species_manager
         
+        # Organizma enerji tüketimi (verilmişse)
+        organism_config = config.get('organism', {})
+        if 'energy_decay' in organism_config:
+            self.world.energy_decay = organism_config['energy_decay']
+        
         # Yiyecek sistemi
         food_config = config.get('food', {})
-        self.food_spawner = FoodSpawner(world_size, food_config)
+        self.food_spawner = FoodSpawner(world_size, food_config, reference_fps=self.target_fps)
+        self.food_spawner.attach_world(self.world)
         
         # Kamera sistemi (sadece görsel modda)
         if not headless:
+            global pygame
+            import pygame
+            from .camera import Camera
+            from visuals import OrganismRenderer, FoodRenderer, UIRenderer, CameraOverlay, PerformanceMonitor
+            
             screen_size = config.get('visualization', {}).get('screen_size', [1200, 800])
             self.camera = Camera(screen_size, world_size)
             self._init_pygame(screen_size)
@@ -88,6 +130,11 @@ class Simulation:
             self.camera_overlay = None
             self.performance_monitor = None
         
+        if use_render_process:
+            from .render_bridge import RenderBridge
+            self.render_bridge = RenderBridge(config, world_size, organism_capacity=max_organisms)
+            self.camera = self.render_bridge.camera  # LOD için uzak kameranın görünür alanı
+        
         # İstatistikler
         self.stats = {
             'total_organisms_created': 0,
@@ -96,8 +143,7 @@ class Simulation:
             'total_food_eaten': 0,
             'generation_count': 0,
             'average_fitness': 0.0,
-            'population_history': [],
-            'fitness_history': []
+            **self._create_history()
         }
         
         # Debug modda performans logları
@@ -105,6 +151,37 @@ class Simulation:
             self.performance_log = []
             logger.info("🔍 Debug modu aktif - performans logları kaydediliyor")
         
+        # Organizma olay günlüğü (tamponlu; ayar verilmezse varsayılanlar)
+        event_log_config = config.get('simulation', {}).get('event_log')
+        if event_log_config is not None:
+            configure_event_log(event_log_config)
+        
+        # Periyodik checkpoint (aralık simülasyon saniyesi cinsinden)
+        checkpoint_config = config.get('simulation', {}).get('checkpoint')
+        self.checkpointer = None
+        if checkpoint_config and checkpoint_config.get('enabled', True):
+            from .checkpoint import CheckpointWriter
+            self.checkpointer = CheckpointWriter(checkpoint_config, self.fixed_dt)
+        
+        # Tick bazlı replay kaydı (main.py --record ile de açılır)
+        self.recorder = None
+        record_config = config.get('simulation', {}).get('record')
+        if record_config and record_config.get('enabled', True):
+            self.start_recording(record_config.get('path', 'data/replays/replay.ecr'),
+                                 interval_ticks=record_config.get('interval_ticks', 1))
+        
+        # Yerel telemetri sunucusu (main.py --telemetry ile de açılır)
+        self.telemetry = None
+        telemetry_config = config.get('simulation', {}).get('telemetry')
+        if telemetry_config and telemetry_config.get('enabled', True):
+            self.start_telemetry(telemetry_config)
+        
+        # Koşu boyunca akışlı istatistik dışa aktarımı (main.py --export ile de açılır)
+        self.exporter = None
+        export_config = config.get('simulation', {}).get('export')
+        if export_config and export_config.get('enabled', True):
+            self.start_export(export_config)
+        
         # Başlangıç organizmalarını oluştur
         self._initialize_organisms()
         
@@ -127,7 +204,7 @@ class Simulation:
             'time': self.current_time,
             'fps': self.performance_monitor.metrics.get('fps', 0),
             'frame_time': self.performance_monitor.metrics.get('frame_time', 0),
-            'population': len(self.world.organisms),
+            'population': self.world.organism_count,
             'visible_organisms': self.performance_monitor.metrics.get('visible_organisms', 0),
             'gpu_stats': gpu_stats
         }
@@ -135,7 +212,7 @@ class Simulation:
         self.performance_log.append(log_entry)
         
         # Her 100 frame'de bir özet log
-        if self.frame_count % 100 == 0:
+        if self.render_count % 100 == 0:
             logger.info(f"📊 Frame {self.frame_count}: FPS={log_entry['fps']:.1f}, "
                        f"Pop={log_entry['population']}, GPU={gpu_stats['gpu_calculations']}")
     
@@ -144,7 +221,6 @@ class Simulation:
         if self.performance_mode == 'low':
             # Düşük performans modu
             self.max_organisms = 200
-            self.update_throttle = 3  # Her 3 frame'de bir güncelle
             self.render_throttle = 2  # Her 2 frame'de bir çiz
             self.show_details = False
             self.show_energy_bars = False
@@ -154,7 +230,6 @@ class Simulation:
         elif self.performance_mode == 'medium':
             # Orta performans modu
             self.max_organisms = 500
-            self.update_throttle = 2  # Her 2 frame'de bir güncelle
             self.render_throttle = 1  # Her frame çiz
             self.show_details = True
             self.show_energy_bars = True
@@ -164,7 +239,6 @@ class Simulation:
         else:  # high
             # Yüksek performans modu
             self.max_organisms = 1000
-            self.update_throttle = 1  # Her frame güncelle
             self.render_throttle = 1  # Her frame çiz
             self.show_details = True
             self.show_energy_bars = True
@@ -186,6 +260,7 @@ class Simulation:
         """Başlangıç organizmalarını oluştur - TÜR BAZLI"""
         organism_config = self.config.get('organism', {})
         initial_count = organism_config.get('initial_count', 100)
+        mutation_rate = organism_config.get('mutation_rate')
         
         # Rastgele pozisyonlar oluştur
         positions = generate_random_positions(initial_count, self.world.size)
@@ -201,43 +276,69 @@ class Simulation:
                 organism = Organism(position=positions[i])
                 self.world.add_organism(organism)
                 self.stats['total_organisms_created'] += 1
+            
+            # Başlangıç mutasyon oranı (verilmişse)
+            if mutation_rate is not None:
+                organism.dna.genes['mutation_rate'] = mutation_rate
         
         logger.info(f"🦠 {initial_count} başlangıç organizması oluşturuldu (tür bazlı)")
     
     def run(self, scenario_handler=None):
-        """Ana simülasyon döngüsü"""
+        """Ana simülasyon döngüsü
+        
+        Simülasyon sabit ``fixed_dt`` adımlarıyla ilerler; her render
+        frame'inde biriken gerçek süre kadar (en fazla
+        ``max_catch_up_ticks``) tick çalıştırılır. Headless modda her
+        döngüde bir tick çalışır, duvar saati kullanılmaz.
+        """
         self.running = True
+        self.last_frame_time = time.perf_counter()
         
         try:
             while self.running:
+                if self.headless and self.render_bridge is None:
+                    if not self.paused:
+                        self._step(self.fixed_dt, scenario_handler)
+                    continue
+                
                 # Zaman yönetimi
-                current_time = time.time()
-                delta_time = min(current_time - self.last_frame_time, self.frame_time)
-                self.last_frame_time = current_time
-                self.current_time += delta_time
+                now = time.perf_counter()
+                frame_delta = now - self.last_frame_time
+                self.last_frame_time = now
                 
-                # Olayları işle
-                if not self.headless:
+                # Olayları işle (ayrı süreç renderer'da girdiler borudan gelir)
+                if self.render_bridge is not None:
+                    self.render_bridge.poll(self)
+                else:
                     self._handle_events()
                 
-                # Simülasyonu güncelle
+                # Biriken süre kadar sabit adım çalıştır
                 if not self.paused:
-                    self._update(delta_time, scenario_handler)
+                    self.accumulator += frame_delta
+                    ticks = 0
+                    while self.accumulator >= self.fixed_dt and ticks < self.max_catch_up_ticks:
+                        self._step(self.fixed_dt, scenario_handler)
+                        self.accumulator -= self.fixed_dt
+                        ticks += 1
+                    
+                    # Yetişilemeyen süreyi at (spiral of death önlemi)
+                    if self.accumulator >= self.fixed_dt:
+                        perf_monitor.increment_counter('dropped_ticks', int(self.accumulator // self.fixed_dt))
+                        self.accumulator %= self.fixed_dt
+                    
+                    self.render_alpha = self.accumulator / self.fixed_dt
                 
                 # Görselleştirme
-                if not self.headless:
-                    self._render()
+                if self.render_bridge is not None:
+                    # Renderer meşgulse kare atlanır; simülasyon çizimi beklemez
+                    self.render_bridge.maybe_publish(self)
+                    time.sleep(max(0.0, self.frame_time - (time.perf_counter() - now)))
+                    continue
+                self._render()
+                self.render_count += 1
                 
                 # FPS kontrolü
-                if not self.headless:
-                    self.clock.tick(self.target_fps)
-                
-                # Frame sayacını artır
-                self.frame_count += 1
-                
-                # İstatistikleri güncelle
-                if self.frame_count % 60 == 0:  # Her saniye
-                    self._update_statistics()
+                self.clock.tick(self.target_fps)
                 
         except KeyboardInterrupt:
             logger.info("Simülasyon kullanıcı tarafından durduruldu")
@@ -246,16 +347,115 @@ class Simulation:
         finally:
             self.cleanup()
     
+    def run_fast_forward(self, ticks: int, scenario_handler=None,
+                         export: bool = True) -> Dict[str, float]:
+        """Headless hızlı ileri sarma
+        
+        ``ticks`` adet ``fixed_dt`` adımını duvar saatine bağlı kalmadan,
+        işlemcinin izin verdiği hızda çalıştırır. ``export=False`` ile
+        sonuç dosyası yazılmaz (parametre taramaları için).
+        
+        Returns:
+            Tamamlanan tick sayısı, geçen süre ve saniyedeki tick sayısı
+        """
+        self.running = True
+        completed = 0
+        start = time.perf_counter()
+        
+        try:
+            while self.running and completed < ticks:
+                self._step(self.fixed_dt, scenario_handler)
+                completed += 1
+        except KeyboardInterrupt:
+            logger.info("Simülasyon kullanıcı tarafından durduruldu")
+        finally:
+            elapsed = time.perf_counter() - start
+            if export:
+                self.cleanup()
+        
+        result = {
+            'ticks': completed,
+            'simulated_seconds': completed * self.fixed_dt,
+            'elapsed': elapsed,
+            'ticks_per_second': completed / elapsed if elapsed > 0 else 0.0
+        }
+        logger.info(f"⏩ Hızlı ileri sarma: {completed} tick, {elapsed:.2f} sn, {result['ticks_per_second']:.1f} tick/sn")
+        return result
+    
+    def _step(self, delta_time: float, scenario_handler=None):
+        """Tek sabit simülasyon adımı"""
+        self.current_time += delta_time
+        get_event_log().tick = self.frame_count
+        self._update(delta_time, scenario_handler)
+        
+        # Tick sayacını artır
+        self.frame_count += 1
+        
+        # İstatistikleri güncelle
+        if self.frame_count % self.stats_interval_ticks == 0:  # Her simülasyon saniyesi
+            self._update_statistics()
+        
+        # Periyodik checkpoint (yakalama burada, yazım arka planda)
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self, scenario_handler)
+        
+        if self.recorder is not None:
+            self.recorder.maybe_record(self)
+        
+        if self.telemetry is not None:
+            self.telemetry.maybe_publish(self)
+        
+        if self.exporter is not None:
+            self.exporter.maybe_write(self)
+    
+    def start_recording(self, path, interval_ticks: int = 1):
+        """Her tick'in replay kaydını başlat
+        
+        Args:
+            path: Kayıt dosyası yolu
+            interval_ticks: Kaç tick'te bir kare yazılacağı
+        """
+        from .replay import ReplayRecorder
+        if self.recorder is not None:
+            self.recorder.close()
+        self.recorder = ReplayRecorder(path, self.world.size, self.fixed_dt, interval_ticks)
+        return self.recorder
+    
+    def start_telemetry(self, telemetry_config: Optional[Dict[str, Any]] = None):
+        """Canlı istatistikleri yayımlayan HTTP sunucusunu arka planda başlat
+        
+        Args:
+            telemetry_config: Sunucu ayarları (host, port, interval_seconds, history)
+        """
+        from .telemetry import TelemetryServer
+        if self.telemetry is not None:
+            self.telemetry.close()
+        self.telemetry = TelemetryServer(telemetry_config, self.fixed_dt).start()
+        return self.telemetry
+    
+    def start_export(self, export_config: Optional[Dict[str, Any]] = None):
+        """İstatistik örneklerini koşu boyunca JSONL'e eklemeye başla
+        
+        Args:
+            export_config: Dışa aktarım ayarları (directory, name, interval_seconds, fsync)
+        """
+        from .results_export import StreamingExporter
+        if self.exporter is not None:
+            self.exporter.close()
+        self.exporter = StreamingExporter(export_config, self.fixed_dt)
+        return self.exporter
+    
     def _render(self):
         """Gelişmiş görselleştirme (throttling ile)"""
         if self.headless:
             return
         
         # Render throttling: Sadece belirli frame'lerde çiz
-        if self.frame_count % self.render_throttle != 0:
+        if self.render_count % self.render_throttle != 0:
             return
             
         self.performance_monitor.start_frame()
+        self.organism_renderer.interpolation_alpha = self.render_alpha
         perf_monitor.start_timer('rendering')
         
         try:
@@ -313,7 +513,7 @@ class Simulation:
             self.performance_monitor.update_metrics(
                 visible_organisms=visible_organism_count,
                 visible_foods=visible_food_count,
-                total_organisms=len(self.world.organisms),
+                total_organisms=self.world.organism_count,
                 total_foods=len(self.world.foods)
             )
             
@@ -443,11 +643,10 @@ class Simulation:
             if scenario_handler:
                 scenario_handler.step(self, delta_time, self.frame_count)
             
-            # Yiyecek üretimi
-            new_food = self.food_spawner.spawn_food(self.frame_count)
-            if new_food:
-                self.world.add_food(new_food)
-                self.stats['total_food_spawned'] += 1
+            # Yiyecek üretimi (Poisson, saniyelik orana göre toplu)
+            food_batch = self.food_spawner.spawn_batch(delta_time)
+            spawned = self.world.add_food_batch(food_batch, self.frame_count)
+            self.stats['total_food_spawned'] += len(spawned)
             
             # Organizmaları güncelle
             self._update_organisms(delta_time)
@@ -455,6 +654,10 @@ class Simulation:
             # Yiyecekleri güncelle
             self._update_foods(delta_time)
             
+            # Zamanlanmış bitişler (yalnızca bu tick'in kovası)
+            expirations = self.world.process_scheduled_events(self.frame_count)
+            self.stats['total_organisms_died'] += expirations['old_age']
+            
             # Dünya temizliği
             self.world.cleanup_unused_chunks()
             
@@ -464,39 +667,64 @@ class Simulation:
             logger.error(f"Simülasyon güncellenirken hata: {e}")
     
     def _update_organisms(self, delta_time: float):
-        """Tüm organizmaları güncelle (throttling ile)"""
+        """Tüm organizmaları güncelle (LOD ile)"""
         perf_monitor.start_timer('organisms_update')
         
-        # Throttling: Sadece belirli frame'lerde güncelle
-        if self.frame_count % self.update_throttle == 0:
-            # Organizmaları ters sırayla güncelle (silme işlemleri için)
-            for i in range(len(self.world.organisms) - 1, -1, -1):
-                organism = self.world.organisms[i]
-                if organism is not None:
-                    # Organizmayı güncelle
-                    if not organism.update(self.world, delta_time, self.frame_count):
-                        # Organizma öldü
-                        self.stats['total_organisms_died'] += 1
-                    
-                    # Dünya pozisyonunu güncelle
-                    self.world.update_organism_position(i, organism.position)
+        # Komşuluk özetlerini tek geçişte hesapla
+        sensor = self.world.neighborhood
+        sensor.sense(self.world)
+        
+        # LOD: görünür alana uzaklığa göre güncelleme aralıkları
+        strides = self.update_lod.compute_strides(sensor.positions, self.camera)
+        for slot, stride in zip(sensor.slots.tolist(), strides.tolist()):
+            self.world.organisms[slot].update_interval = \
+                0.0 if stride <= 1 else (stride - 0.5) * self.fixed_dt
+        
+        skipped = 0
+        
+        # Organizmaları ters sırayla güncelle (silme işlemleri için)
+        for i in range(len(self.world.organisms) - 1, -1, -1):
+            organism = self.world.organisms[i]
+            if organism is not None:
+                # Atlanan süreyi biriktir, aralık dolunca tek seferde uygula
+                organism.accumulated_time += delta_time
+                if organism.accumulated_time < organism.update_interval:
+                    organism.previous_position = organism.position
+                    skipped += 1
+                    continue
+                step_time = organism.accumulated_time
+                organism.accumulated_time = 0.0
+                organism.last_update_time = self.current_time
+                
+                # Organizmayı güncelle
+                if not organism.update(self.world, step_time, self.frame_count):
+                    # Organizma öldü
+                    self.stats['total_organisms_died'] += 1
+                
+                # Dünya pozisyonunu güncelle
+                self.world.update_organism_position(i, organism.position)
+        
+        perf_monitor.increment_counter('lod_skipped_updates', skipped)
         
         perf_monitor.end_timer('organisms_update')
     
     def _update_foods(self, delta_time: float):
-        """Tüm yiyecekleri güncelle"""
+        """Tüm yiyecekleri güncelle (vektörel)"""
         perf_monitor.start_timer('foods_update')
         
-        # Yiyecekleri ters sırayla güncelle
-        for i in range(len(self.world.foods) - 1, -1, -1):
-            food = self.world.foods[i]
-            if food is not None:
-                if not food.update(delta_time, self.frame_count):
-                    # Yiyecek bozuldu
-                    self.world.remove_food(i)
+        # Bozulma ve hareket tek geçişte; bozulanlar zamanlama çarkından kaldırılır
+        self.world.food_store.update(delta_time, detect_expired=False)
+        self.world.scent_field.track_store(self.world.food_store, delta_time)
         
         perf_monitor.end_timer('foods_update')
     
+    def _create_history(self) -> Dict[str, TimeSeries]:
+        """Nüfus ve uygunluk geçmişi (son 1000 sn tam hız, tüm koşu seyreltilmiş)"""
+        return {
+            'population_history': TimeSeries(('frame', 'population', 'time'), capacity=1000),
+            'fitness_history': TimeSeries(('frame', 'average_fitness', 'time'), capacity=1000)
+        }
+    
     def _update_statistics(self):
         """İstatistikleri güncelle"""
         # World stats'ını simulation stats'a kopyala
@@ -506,30 +734,23 @@ class Simulation:
         world_stats = self.world.get_statistics()
         self.stats['total_organisms_created'] = world_stats.get('total_organisms', 0)
         
-        # Popülasyon sayısı
-        current_population = len(self.world.organisms)
-        self.stats['population_history'].append({
-            'frame': self.frame_count,
-            'population': current_population,
-            'time': self.current_time
-        })
+        # Popülasyon sayısı (yalnızca canlı organizmalar; boş slot'lar sayılmaz)
+        current_population = self.world.organism_count
+        self.stats['population_history'].append(
+            frame=self.frame_count,
+            population=current_population,
+            time=self.current_time
+        )
         
         # Ortalama uygunluk
         if current_population > 0:
             total_fitness = sum(org.get_fitness() for org in self.world.organisms if org is not None)
             self.stats['average_fitness'] = total_fitness / current_population
-            self.stats['fitness_history'].append({
-                'frame': self.frame_count,
-                'average_fitness': self.stats['average_fitness'],
-                'time': self.current_time
-            })
-        
-        # Geçmiş verileri sınırla (performans için)
-        max_history = 1000
-        if len(self.stats['population_history']) > max_history:
-            self.stats['population_history'] = self.stats['population_history'][-max_history:]
-        if len(self.stats['fitness_history']) > max_history:
-            self.stats['fitness_history'] = self.stats['fitness_history'][-max_history:]
+            self.stats['fitness_history'].append(
+                frame=self.frame_count,
+                average_fitness=self.stats['average_fitness'],
+                time=self.current_time
+            )
     
     def _draw_organism(self, organism):
         """Organizmayı çiz"""
@@ -590,7 +811,7 @@ class Simulation:
             'fps': self.performance_monitor.metrics['fps'],
             'frame_count': self.frame_count,
             'current_time': self.current_time,
-            'population': len(self.world.organisms),
+            'population': self.world.organism_count,
             'food_count': len(self.world.foods),
             'average_fitness': self.stats['average_fitness'],
             'total_created': self.stats['total_organisms_created'],
@@ -625,7 +846,12 @@ class Simulation:
         
         # Dünyayı temizle
         self.world.organisms.clear()
+        self.world.free_organism_slots.clear()
         self.world.foods.clear()
+        self.world.food_store.clear()
+        self.world.free_food_slots.clear()
+        self.world.scent_field.clear()
+        self.world.scheduler.clear()
         self.world.spatial_hash.clear()
         self.world.chunks.clear()
         self.world.active_chunks.clear()
@@ -638,8 +864,7 @@ class Simulation:
             'total_food_eaten': 0,
             'generation_count': 0,
             'average_fitness': 0.0,
-            'population_history': [],
-            'fitness_history': []
+            **self._create_history()
         }
         
         # Kamerayı sıfırla
@@ -659,23 +884,59 @@ class Simulation:
                 'simulation_info': {
                     'frame_count': self.frame_count,
                     'total_time': self.current_time,
+                    'population': self.world.organism_count,
                     'config': self.config
                 },
-                'statistics': self.stats,
+                'statistics': {key: value.records() if isinstance(value, TimeSeries) else value
+                               for key, value in self.stats.items()},
+                'history': {key: {'stride': value.history_stride,
+                                  'records': value.records(value.history()),
+                                  'summary': value.summary()}
+                            for key, value in self.stats.items() if isinstance(value, TimeSeries)},
                 'world_stats': self.world.get_statistics(),
                 'performance_stats': perf_monitor.get_stats()
             }
             
-            # Dosyaya kaydet
-            timestamp = int(time.time())
-            filename = f"simulation_results_{timestamp}"
-            save_simulation_data(export_data, filename)
+            # Akış açıksa özeti ekle; tam sonuç aynı adla, girintisiz kaydedilir
+            if self.exporter is not None:
+                filename = self.exporter.stem
+                self.exporter.finish(self)
+            else:
+                timestamp = int(time.time())
+                filename = f"simulation_results_{timestamp}"
+            save_simulation_data(export_data, filename, indent=None)
             
             logger.info(f"📊 Simülasyon sonuçları dışa aktarıldı: {filename}")
             
         except Exception as e:
             logger.error(f"Sonuçlar dışa aktarılırken hata: {e}")
     
+    def save_checkpoint(self, path, scenario_handler=None):
+        """Simülasyon durumunu sıkıştırılmış .npz checkpoint'ine kaydet
+        
+        Args:
+            path: Checkpoint dosya yolu
+            scenario_handler: Durumu birlikte kaydedilecek senaryo işleyicisi
+        
+        Returns:
+            Yazılan dosyanın yolu
+        """
+        from .checkpoint import save_checkpoint
+        return save_checkpoint(self, path, scenario_handler)
+    
+    def load_checkpoint(self, path, scenario_handler=None) -> Dict[str, Any]:
+        """Checkpoint'ten durumu geri yükle (aynı yapılandırmayla oluşturulmuş simülasyona)
+        
+        Args:
+            path: Checkpoint dosya yolu
+            scenario_handler: Durumu geri yüklenecek senaryo işleyicisi
+        
+        Returns:
+            Checkpoint meta verisi
+        """
+        from .checkpoint import load_checkpoint
+        return load_checkpoint(self, path, scenario_handler)
+    
     def cleanup(self):
         """Simülasyonu temizle"""
         logger.info("🧹 Simülasyon temizleniyor...")
@@ -683,8 +944,20 @@ class Simulation:
         if not self.headless:
             pygame.quit()
         
-        # Son istatistikleri kaydet
+        # Son istatistikleri kaydet, bekleyen olayları yaz
         self.export_results()
+        get_event_log().flush()
+        self.world.neighborhood.pool.close()
+        if self.checkpointer is not None:
+            self.checkpointer.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.exporter is not None:
+            self.exporter.close()
+        if self.render_bridge is not None:
+            self.render_bridge.close()
         
         logger.info("✅ Simülasyon temizlendi")
     
@@ -143,6 +143,14 @@ class SpeciesManager:
         
         return random.choice(suitable_species)
     
+    def apply_overrides(self, overrides: Dict[str, Dict[str, Any]]):
+        """Tür ayarlarını config'deki değerlerle geçersiz kıl (ör. spawn_weight)"""
+        for species_name, values in (overrides or {}).items():
+            if species_name not in self.species_config:
+                logger.warning(f"Bilinmeyen tür için ayar atlandı: {species_name}")
+                continue
+            self.species_config[species_name].update(values)
+    
     def get_species_traits(self, species_name: str) -> Dict[str, Any]:
         """Tür özelliklerini döndür"""
         if species_name in self.species_config:
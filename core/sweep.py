@@ -0,0 +1,369 @@
+"""
+Ecosim Sweep - Paralel Parametre Taraması ve Tekrar Çalıştırıcı
+"""
+
+import copy
+import csv
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import yaml
+
+from .utils import logger
+
+# Her çalıştırma için kaydedilen özet metrikler
+SUMMARY_METRICS = [
+    'final_population',
+    'peak_population',
+    'mean_population',
+    'species_alive',
+    'total_organisms_died',
+    'total_food_eaten',
+    'average_fitness',
+    'extinct',
+    'ticks_per_second'
+]
+
+
+def load_sweep_spec(path: str) -> Dict[str, Any]:
+    """YAML tarama tanımını yükle"""
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = yaml.safe_load(f) or {}
+    spec.setdefault('name', Path(path).stem)
+    return spec
+
+
+def set_config_value(config: Dict[str, Any], dotted_key: str, value: Any):
+    """``food.spawn_rate`` gibi noktalı anahtarla config değeri ata"""
+    keys = dotted_key.split('.')
+    node = config
+    for key in keys[:-1]:
+        node = node.setdefault(key, {})
+    node[keys[-1]] = value
+
+
+def expand_points(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Tarama noktalarını üret
+
+    ``mode: grid`` için her parametre bir değer listesidir ve tüm
+    kombinasyonlar denenir. ``mode: random`` için her parametre
+    ``{min, max, log}`` aralığı veya ``{values: [...]}`` seçeneği olur;
+    ``samples`` kadar nokta çekilir.
+    """
+    parameters = spec.get('parameters', {})
+    mode = spec.get('mode', 'grid')
+    keys = list(parameters.keys())
+
+    if mode == 'grid':
+        values = [v if isinstance(v, list) else [v] for v in parameters.values()]
+        return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+    if mode == 'random':
+        rng = np.random.default_rng(spec.get('seed', 0))
+        points = []
+        for _ in range(int(spec.get('samples', 10))):
+            point = {}
+            for key, domain in parameters.items():
+                if isinstance(domain, list):
+                    domain = {'values': domain}
+                if 'values' in domain:
+                    point[key] = domain['values'][int(rng.integers(len(domain['values'])))]
+                elif domain.get('log', False):
+                    low, high = math.log(domain['min']), math.log(domain['max'])
+                    point[key] = float(math.exp(rng.uniform(low, high)))
+                else:
+                    point[key] = float(rng.uniform(domain['min'], domain['max']))
+            points.append(point)
+        return points
+
+    raise ValueError(f"Bilinmeyen tarama modu: {mode}")
+
+
+def derive_seed(base_seed: int, point_id: int, replicate: int) -> int:
+    """Nokta ve tekrar için bağımsız, tekrarlanabilir tohum"""
+    return int(np.random.SeedSequence([base_seed, point_id, replicate]).generate_state(1)[0])
+
+
+def summarize_run(simulation) -> Dict[str, Any]:
+    """Bitmiş bir simülasyonun özet metrikleri"""
+    alive = [org for org in simulation.world.organisms if org is not None]
+    # Tüm koşu üzerinden (zaman serisi en küçük/en büyük/ortalamayı sürekli tutar)
+    population = simulation.stats['population_history'].summary().get('population')
+    if population is None:
+        population = {'max': len(alive), 'mean': len(alive)}
+
+    return {
+        'final_population': len(alive),
+        'peak_population': int(population['max']),
+        'mean_population': float(population['mean']),
+        'species_alive': len({org.species for org in alive}),
+        'total_organisms_died': simulation.stats['total_organisms_died'],
+        'total_food_eaten': simulation.world.stats.get('total_food_eaten', 0),
+        'average_fitness': float(simulation.stats['average_fitness']),
+        'extinct': int(len(alive) == 0)
+    }
+
+
+def build_task_config(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Temel config'e görevin parametrelerini uygula"""
+    config = copy.deepcopy(task['base_config'])
+    for key, value in task['parameters'].items():
+        set_config_value(config, key, value)
+    if task.get('dt') is not None:
+        set_config_value(config, 'simulation.fixed_dt', task['dt'])
+    # Süreçler zaten çekirdek başına; algılama çekirdekleri thread açmaz
+    config.setdefault('simulation', {}).setdefault('kernel_threads', 1)
+    # İşçiler aynı olay günlüğü dosyasını paylaşıp birbirinin döndürmesini bozmasın;
+    # ProcessPoolExecutor işçilerinde atexit de çalışmadığı için günlük kapatılır
+    config['simulation']['event_log'] = {**(config['simulation'].get('event_log') or {}), 'enabled': False}
+    return config
+
+
+def _task_row(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Sonuç satırının kimlik ve parametre sütunları"""
+    return {
+        'point_id': task['point_id'],
+        'replicate': task['replicate'],
+        'seed': task['seed'],
+        **task['parameters']
+    }
+
+
+def run_replicate(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Tek bir headless tekrarı çalıştır (işçi sürecinde)"""
+    # Engine işçide import edilir; ana süreç hafif kalır
+    from .engine import Engine
+
+    row = _task_row(task)
+
+    try:
+        config = build_task_config(task)
+        with Engine(config, seed=task['seed'], scenario=task.get('scenario')) as engine:
+            start = time.perf_counter()
+            engine.step(task['ticks'])
+            elapsed = time.perf_counter() - start
+            row.update(summarize_run(engine.simulation))
+        row['ticks_per_second'] = task['ticks'] / elapsed if elapsed > 0 else 0.0
+        row['error'] = ''
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+
+    return row
+
+
+def run_batch(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Görev grubunu tek süreçte BatchWorldEngine dünyaları olarak çalıştır
+
+    Grubun tüm dünyaları ilk görevin tohumuyla kurulan ortak üreteci
+    kullanır; satırlardaki ``seed`` bu grup tohumudur.
+    """
+    from .batch_worlds import BatchWorldEngine
+
+    seed = tasks[0]['seed']
+    rows = []
+    for task in tasks:
+        row = _task_row(task)
+        row['seed'] = seed
+        rows.append(row)
+
+    try:
+        engine = BatchWorldEngine([build_task_config(task) for task in tasks], seed=seed)
+        start = time.perf_counter()
+        engine.step(tasks[0]['ticks'])
+        elapsed = time.perf_counter() - start
+
+        for row, summary in zip(rows, engine.get_world_summaries()):
+            row.update(summary)
+            row['ticks_per_second'] = tasks[0]['ticks'] / elapsed if elapsed > 0 else 0.0
+            row['error'] = ''
+    except Exception as e:
+        for row in rows:
+            row['error'] = f"{type(e).__name__}: {e}"
+
+    return rows
+
+
+def run_task_group(tasks: List[Dict[str, Any]], engine: str) -> List[Dict[str, Any]]:
+    """İşçi giriş noktası: görev grubunu seçilen motorla çalıştır"""
+    if engine == 'batch':
+        return run_batch(tasks)
+    return [run_replicate(task) for task in tasks]
+
+
+def _t_critical(df: int) -> float:
+    """%95 iki yönlü t kritik değeri (scipy yoksa normal yaklaşımı)"""
+    try:
+        from scipy import stats
+        return float(stats.t.ppf(0.975, df))
+    except ImportError:
+        return 1.96
+
+
+def aggregate_rows(rows: List[Dict[str, Any]], parameter_keys: List[str]) -> List[Dict[str, Any]]:
+    """Nokta başına metrik ortalaması, standart sapması ve %95 güven aralığı"""
+    by_point: Dict[int, List[Dict[str, Any]]] = {}
+    for row in rows:
+        if not row.get('error'):
+            by_point.setdefault(row['point_id'], []).append(row)
+
+    summary = []
+    for point_id in sorted(by_point):
+        point_rows = by_point[point_id]
+        entry = {'point_id': point_id, 'replicates': len(point_rows)}
+        entry.update({key: point_rows[0][key] for key in parameter_keys})
+
+        n = len(point_rows)
+        t_value = _t_critical(n - 1) if n > 1 else 0.0
+        for metric in SUMMARY_METRICS:
+            values = np.array([r[metric] for r in point_rows], dtype=np.float64)
+            mean = float(values.mean())
+            std = float(values.std(ddof=1)) if n > 1 else 0.0
+            half_width = t_value * std / math.sqrt(n) if n > 1 else 0.0
+            entry[f'{metric}_mean'] = mean
+            entry[f'{metric}_std'] = std
+            entry[f'{metric}_ci_low'] = mean - half_width
+            entry[f'{metric}_ci_high'] = mean + half_width
+        summary.append(entry)
+
+    return summary
+
+
+class ParameterSweep:
+    """Config anahtarları üzerinde ızgara/rastgele tarama, süreç havuzunda tekrarlar
+
+    Her (nokta, tekrar) çifti kendi tohumuyla ayrı bir işçide headless
+    çalışır. Tamamlanan çalıştırmalar ``<name>_runs.csv`` tablosuna
+    anında yazılır; sonunda nokta başına özet ``<name>_summary.csv``
+    dosyasına kaydedilir.
+
+    ``engine: batch`` ile görevler ``batch_size``'lık gruplar halinde
+    her işçide tek bir ``BatchWorldEngine`` içinde çalışır.
+    """
+
+    def __init__(self, spec: Dict[str, Any], output_dir: str = "data/sweeps",
+                 workers: Optional[int] = None):
+        """
+        Args:
+            spec: Tarama tanımı (bkz. ``load_sweep_spec``)
+            output_dir: Sonuç tablolarının dizini
+            workers: İşçi süreç sayısı (None = tüm çekirdekler)
+        """
+        self.spec = spec
+        self.name = spec.get('name', 'sweep')
+        self.output_dir = Path(output_dir)
+        self.workers = workers or spec.get('workers') or os.cpu_count()
+
+        self.ticks = int(spec.get('ticks', 3600))
+        self.dt = spec.get('dt')
+        self.replicates = int(spec.get('replicates', 3))
+        self.base_seed = int(spec.get('seed', 0))
+        self.scenario = spec.get('scenario') if spec.get('use_scenario', False) else None
+        self.engine = spec.get('engine', 'simulation')
+        self.batch_size = int(spec.get('batch_size', 64))
+        self.base_config = self._load_base_config()
+
+        self.points = expand_points(spec)
+        self.parameter_keys = list(spec.get('parameters', {}).keys())
+        self.rows: List[Dict[str, Any]] = []
+
+        self.stats = {
+            'runs_completed': 0,
+            'runs_failed': 0,
+            'elapsed': 0.0
+        }
+
+    def _load_base_config(self) -> Dict[str, Any]:
+        """Temel config: ``base_config`` dosyası veya senaryo config'i"""
+        path = self.spec.get('base_config')
+        if path is None:
+            path = f"scenarios/{self.spec.get('scenario', 'default')}/config.yaml"
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+
+    def _tasks(self) -> List[Dict[str, Any]]:
+        """Tüm (nokta, tekrar) görevleri"""
+        tasks = []
+        for point_id, parameters in enumerate(self.points):
+            for replicate in range(self.replicates):
+                tasks.append({
+                    'point_id': point_id,
+                    'replicate': replicate,
+                    'seed': derive_seed(self.base_seed, point_id, replicate),
+                    'parameters': parameters,
+                    'base_config': self.base_config,
+                    'ticks': self.ticks,
+                    'dt': self.dt,
+                    'scenario': self.scenario
+                })
+        return tasks
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Taramayı çalıştır ve nokta başına özeti döndür"""
+        tasks = self._tasks()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        runs_path = self.output_dir / f"{self.name}_runs.csv"
+        columns = ['point_id', 'replicate', 'seed'] + self.parameter_keys + SUMMARY_METRICS + ['error']
+
+        logger.info(f"🧪 Tarama '{self.name}': {len(self.points)} nokta x {self.replicates} tekrar, "
+                    f"{self.workers} işçi")
+        start = time.perf_counter()
+
+        with open(runs_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
+
+            group_size = self.batch_size if self.engine == 'batch' else 1
+            groups = [tasks[i:i + group_size] for i in range(0, len(tasks), group_size)]
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(run_task_group, group, self.engine) for group in groups]
+                for future in as_completed(futures):
+                    for row in future.result():
+                        writer.writerow(row)
+                        self.rows.append(row)
+
+                        if row['error']:
+                            self.stats['runs_failed'] += 1
+                            logger.warning(f"Çalıştırma başarısız (nokta {row['point_id']}, "
+                                           f"tekrar {row['replicate']}): {row['error']}")
+                        else:
+                            self.stats['runs_completed'] += 1
+                    f.flush()
+                    logger.info(f"🧪 {len(self.rows)}/{len(tasks)} çalıştırma tamamlandı")
+
+        self.stats['elapsed'] = time.perf_counter() - start
+        summary = aggregate_rows(self.rows, self.parameter_keys)
+        self._write_summary(summary)
+        logger.info(f"✅ Tarama tamamlandı: {self.stats['runs_completed']} başarılı, "
+                    f"{self.stats['runs_failed']} başarısız, {self.stats['elapsed']:.1f} sn")
+        return summary
+
+    def _write_summary(self, summary: List[Dict[str, Any]]):
+        """Nokta başına özet tablosunu yaz"""
+        summary_path = self.output_dir / f"{self.name}_summary.csv"
+        columns = ['point_id', 'replicates'] + self.parameter_keys + [
+            f'{metric}_{suffix}'
+            for metric in SUMMARY_METRICS
+            for suffix in ('mean', 'std', 'ci_low', 'ci_high')
+        ]
+        with open(summary_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(summary)
+        logger.info(f"📊 Tarama özeti kaydedildi: {summary_path}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Tarama istatistiklerini döndür"""
+        return {
+            **self.stats,
+            'points': len(self.points),
+            'replicates': self.replicates,
+            'workers': self.workers,
+            'engine': self.engine
+        }
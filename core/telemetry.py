@@ -0,0 +1,376 @@
+"""
+Ecosim Telemetry - Canlı İstatistikler için Yerel Asyncio HTTP Sunucusu
+"""
+
+import asyncio
+import collections
+import io
+import json
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from .utils import perf_monitor, logger
+
+# Sunucunun yanıt verdiği uç noktalar
+ENDPOINTS = {
+    '/stats': 'Son simülasyon istatistikleri (JSON)',
+    '/perf': 'Performans sayaçları ve tick hızı (JSON)',
+    '/timeseries': 'Zaman serisi örnekleri (JSON, ?since=<seq>)',
+    '/stream': 'Yeni zaman serisi örnekleri (Server-Sent Events)',
+    '/snapshot': 'Sıkıştırılmış nüfus anlık görüntüsü (.npz)'
+}
+
+# /stats yanıtından çıkarılan, zaman serisiyle zaten sunulan listeler
+_HISTORY_KEYS = ('population_history', 'fitness_history')
+
+SNAPSHOT_TIMEOUT = 5.0  # sn; tick döngüsü durmuşsa /snapshot 503 döner
+
+
+def _json_default(value):
+    """NumPy tiplerini JSON'a çevir"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _encode(payload) -> bytes:
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+
+def capture_population(simulation) -> Dict[str, np.ndarray]:
+    """Organizma ve yiyecek sütunlarının kopyası (tick thread'inde çağrılır)"""
+    organisms = [org for org in simulation.world.organisms if org is not None]
+    species_names: List[str] = []
+    species_codes: Dict[str, int] = {}
+    codes = []
+    for org in organisms:
+        code = species_codes.get(org.species)
+        if code is None:
+            code = species_codes[org.species] = len(species_names)
+            species_names.append(org.species)
+        codes.append(code)
+
+    store = simulation.world.food_store
+    food_slots = np.flatnonzero(store.alive[:store.size])
+    return {
+        'tick': np.int64(simulation.frame_count),
+        'time': np.float64(simulation.current_time),
+        'ids': np.array([org.organism_id for org in organisms], dtype=np.int64),
+        'positions': np.array([org.position for org in organisms], dtype=np.float32).reshape(-1, 2),
+        'energies': np.array([org.energy for org in organisms], dtype=np.float32),
+        'ages': np.array([org.age for org in organisms], dtype=np.float32),
+        'species': np.array(codes, dtype=np.int16),
+        'species_names': np.array(species_names, dtype=str),
+        'food_positions': store.positions[food_slots].copy(),
+        'food_energies': store.energies[food_slots].astype(np.float32),
+        'food_types': store.type_codes[food_slots].copy()
+    }
+
+
+class TelemetryServer:
+    """Arka plan thread'inde asyncio ile çalışan salt okunur HTTP sunucusu
+
+    Sunucu simülasyon nesnelerine hiç dokunmaz: tick döngüsü
+    ``maybe_publish`` ile aralıklarla istatistik ve zaman serisi örneğini
+    kilit altında yayımlar, sunucu yalnızca bu kopyaları okur. Anlık görüntü
+    istendiğinde tick döngüsü bir sonraki adımda sütunları kopyalar;
+    sıkıştırma sunucu thread'inde yapılır, tick döngüsü beklemez.
+    """
+
+    def __init__(self, telemetry_config: Optional[Dict[str, Any]] = None, fixed_dt: float = 1.0 / 60.0):
+        """
+        Args:
+            telemetry_config: Sunucu ayarları (host, port, interval_seconds, history)
+            fixed_dt: Simülasyon adımı (yayın aralığını tick'e çevirmek için)
+        """
+        telemetry_config = telemetry_config or {}
+        self.host = telemetry_config.get('host', '127.0.0.1')
+        self.port = int(telemetry_config.get('port', 8765))
+        self.interval_seconds = float(telemetry_config.get('interval_seconds', 1.0))
+        self.interval_ticks = max(1, int(round(self.interval_seconds / fixed_dt)))
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {}
+        self._perf: Dict[str, Any] = {}
+        self._series = collections.deque(maxlen=int(telemetry_config.get('history', 3600)))
+        self._seq = 0
+        self._last_publish = None
+
+        # Anlık görüntü istekleri (sunucu thread'i ekler, tick thread'i karşılar)
+        self._snapshot_waiters: List[asyncio.Future] = []
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._new_sample: Optional[asyncio.Event] = None
+        self._started = threading.Event()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name='ecosim-telemetry', daemon=True)
+
+        self.stats = {
+            'publishes': 0,
+            'requests': 0,
+            'snapshots': 0,
+            'stream_clients': 0,
+            'errors': 0
+        }
+
+    # --- Sunucu thread'i ---
+
+    def start(self):
+        """Sunucu thread'ini başlat ve dinlemeye hazır olana kadar bekle"""
+        self._thread.start()
+        self._started.wait()
+        if self._server is None:
+            raise OSError(f"Telemetri sunucusu başlatılamadı: {self.host}:{self.port}")
+        logger.info(f"📡 Telemetri: http://{self.host}:{self.port}/ (her {self.interval_seconds:g} sn)")
+        return self
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        asyncio.set_event_loop(loop)
+        self._new_sample = asyncio.Event()
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port))
+            # port 0 ise işletim sisteminin verdiği port
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            logger.error(f"📡 Telemetri sunucusu açılamadı: {e}")
+            self._started.set()
+            loop.close()
+            return
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            # _shutdown sonrası hâlâ açık kalan bağlantılar
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Tek bir HTTP/1.1 isteğini yanıtla (Connection: close)"""
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            parts = request_line.decode('latin-1').split()
+            if len(parts) < 2 or parts[0] not in ('GET', 'HEAD'):
+                await self._respond(writer, 405, b'{"error": "method not allowed"}')
+                return
+            url = urlsplit(parts[1])
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            self.stats['requests'] += 1
+
+            if url.path == '/stream':
+                await self._stream(writer)
+            elif url.path == '/snapshot':
+                await self._snapshot(writer)
+            elif url.path in ('/', '/stats', '/perf', '/timeseries'):
+                await self._respond(writer, 200, _encode(self._json_endpoint(url.path, query)))
+            else:
+                await self._respond(writer, 404, b'{"error": "not found"}')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"📡 Telemetri isteği başarısız: {e}")
+        finally:
+            writer.close()
+
+    def _json_endpoint(self, path: str, query: Dict[str, str]):
+        with self._lock:
+            if path == '/stats':
+                return self._stats
+            if path == '/perf':
+                return dict(self._perf, server=dict(self.stats))
+            if path == '/timeseries':
+                since = int(query.get('since', -1))
+                return [sample for sample in self._series if sample['seq'] > since]
+        return {'endpoints': ENDPOINTS}
+
+    async def _respond(self, writer, status: int, body: bytes,
+                       content_type: str = 'application/json', extra_headers: str = ''):
+        reason = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed',
+                  503: 'Service Unavailable'}.get(status, '')
+        writer.write((f"HTTP/1.1 {status} {reason}\r\n"
+                      f"Content-Type: {content_type}\r\n"
+                      f"Content-Length: {len(body)}\r\n"
+                      f"Access-Control-Allow-Origin: *\r\n"
+                      f"{extra_headers}"
+                      f"Connection: close\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+    async def _stream(self, writer):
+        """Yeni örnekleri Server-Sent Events olarak gönder"""
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\n"
+                     b"Access-Control-Allow-Origin: *\r\n"
+                     b"Connection: close\r\n\r\n")
+        await writer.drain()
+        self.stats['stream_clients'] += 1
+        try:
+            last_seq = self._seq
+            while not self._closing:
+                event = self._new_sample
+                await event.wait()
+                with self._lock:
+                    samples = [sample for sample in self._series if sample['seq'] > last_seq]
+                for sample in samples:
+                    writer.write(b"data: " + _encode(sample) + b"\n\n")
+                    last_seq = sample['seq']
+                await writer.drain()
+        finally:
+            self.stats['stream_clients'] -= 1
+
+    async def _snapshot(self, writer):
+        """Bir sonraki tick'te yakalanan nüfusu sıkıştırıp gönder"""
+        future = self._loop.create_future()
+        with self._lock:
+            self._snapshot_waiters.append(future)
+        try:
+            arrays = await asyncio.wait_for(future, SNAPSHOT_TIMEOUT)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if future in self._snapshot_waiters:
+                    self._snapshot_waiters.remove(future)
+            arrays = None
+        if arrays is None:
+            await self._respond(writer, 503, b'{"error": "simulation is not ticking"}')
+            return
+        body = await self._loop.run_in_executor(None, self._compress, arrays)
+        self.stats['snapshots'] += 1
+        await self._respond(writer, 200, body, 'application/octet-stream',
+                            f"Content-Disposition: attachment; filename=snapshot_{int(arrays['tick'])}.npz\r\n")
+
+    @staticmethod
+    def _compress(arrays: Dict[str, np.ndarray]) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    async def _shutdown(self):
+        """Yeni bağlantıları kes, bekleyen istekleri ve akışları bitir"""
+        self._closing = True
+        self._server.close()
+        with self._lock:
+            waiters, self._snapshot_waiters = self._snapshot_waiters, []
+        for future in waiters:
+            self._resolve(future, None)
+        self._notify()
+        handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if handlers:
+            await asyncio.wait(handlers, timeout=1.0)
+
+    def _notify(self):
+        """Akış istemcilerini uyandır (sunucu thread'inde çalışır)"""
+        event = self._new_sample
+        self._new_sample = asyncio.Event()
+        event.set()
+
+    # --- Tick thread'i ---
+
+    def maybe_publish(self, simulation):
+        """Aralık dolduysa yayımla; bekleyen anlık görüntü isteklerini karşıla"""
+        if self._snapshot_waiters:
+            self._serve_snapshots(simulation)
+        if simulation.frame_count % self.interval_ticks == 0:
+            self.publish(simulation)
+
+    def _serve_snapshots(self, simulation):
+        with self._lock:
+            waiters, self._snapshot_waiters = self._snapshot_waiters, []
+        arrays = capture_population(simulation)
+        for future in waiters:
+            self._loop.call_soon_threadsafe(self._resolve, future, arrays)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, arrays):
+        if not future.done():
+            future.set_result(arrays)
+
+    def publish(self, simulation):
+        """İstatistik, performans ve zaman serisi örneğini yayımla"""
+        now = time.perf_counter()
+        tick = simulation.frame_count
+        ticks_per_second = 0.0
+        if self._last_publish is not None:
+            last_time, last_tick = self._last_publish
+            if now > last_time:
+                ticks_per_second = (tick - last_tick) / (now - last_time)
+        self._last_publish = (now, tick)
+
+        organisms = [org for org in simulation.world.organisms if org is not None]
+        species_counts = collections.Counter(org.species for org in organisms)
+        store = simulation.world.food_store
+        food_count = int(np.count_nonzero(store.alive[:store.size]))
+
+        stats = {key: value for key, value in simulation.stats.items() if key not in _HISTORY_KEYS}
+        stats.update({
+            'tick': tick,
+            'current_time': simulation.current_time,
+            'population': len(organisms),
+            'food_count': food_count,
+            'species_counts': dict(species_counts),
+            'world_stats': simulation.world.get_statistics()
+        })
+
+        perf = {
+            'tick': tick,
+            'ticks_per_second': ticks_per_second,
+            'counters': perf_monitor.get_stats()['counters'],
+            'kernel_pool': simulation.world.neighborhood.pool.get_statistics(),
+            'lod': simulation.update_lod.get_statistics()
+        }
+        for name in ('checkpointer', 'recorder'):
+            component = getattr(simulation, name, None)
+            if component is not None:
+                perf[name] = component.get_statistics()
+
+        sample = {
+            'tick': tick,
+            'time': simulation.current_time,
+            'population': len(organisms),
+            'food_count': food_count,
+            'average_fitness': simulation.stats.get('average_fitness', 0.0),
+            'births': simulation.stats.get('total_organisms_created', 0),
+            'deaths': simulation.stats.get('total_organisms_died', 0),
+            'ticks_per_second': ticks_per_second,
+            'species': dict(species_counts)
+        }
+
+        with self._lock:
+            self._seq += 1
+            sample['seq'] = self._seq
+            self._stats = stats
+            self._perf = perf
+            self._series.append(sample)
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._notify)
+        self.stats['publishes'] += 1
+
+    def close(self):
+        """Sunucuyu durdur"""
+        if self._loop is not None and self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5.0)
+            except Exception as e:
+                logger.warning(f"📡 Telemetri kapatılırken hata: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5.0)
+        logger.info(f"📡 Telemetri kapatıldı ({self.stats['requests']} istek)")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Sunucu istatistiklerini döndür"""
+        return dict(self.stats, host=self.host, port=self.port, interval_ticks=self.interval_ticks)
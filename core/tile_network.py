@@ -0,0 +1,545 @@
+"""
+Ecosim Tile Network - TCP Üzerinden Dağıtık Karo İşçileri
+"""
+
+import json
+import time
+import socket
+import struct
+import selectors
+import multiprocessing
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from .utils import logger
+from .timeseries import TimeSeries
+from .batch_worlds import GENE_NAMES
+from .tiled_engine import (TileEngine, TILE_STAT_NAMES, DEFAULT_HALO_WIDTH,
+                           split_config, tile_capacities, tile_layout)
+
+# Mesaj türleri
+MSG_HELLO = 1      # düğüm -> koordinatör: dinleme portu
+MSG_ASSIGN = 2     # koordinatör -> düğüm: karo ataması (JSON)
+MSG_READY = 3      # düğüm -> koordinatör: karo hazır
+MSG_STEP = 4       # koordinatör -> düğüm: tick sayısı
+MSG_DONE = 5       # düğüm -> koordinatör: sayaçlar
+MSG_STOP = 6       # koordinatör -> düğüm: kapan
+MSG_ERROR = 7      # düğüm -> koordinatör: hata metni
+MSG_PEER = 8       # düğüm -> düğüm: bağlanan karonun indeksi
+MSG_HALO = 9       # düğüm -> düğüm: sınır bandındaki yiyecek pozisyonları
+MSG_MIGRATE = 10   # düğüm -> düğüm: karo değiştiren organizmalar
+
+# Çerçeve başlığı: tür (u8), tick (u32), yük uzunluğu (u64), little-endian
+HEADER = struct.Struct('<BIQ')
+
+# Göç kaydı: organizma sütunlarının paketlenmiş hali (org_world her zaman 0, gönderilmez)
+MIGRANT_DTYPE = np.dtype([
+    ('genes', '<f8', (len(GENE_NAMES),)),
+    ('species', '<i4'),
+    ('pos', '<f8', (2,)),
+    ('vel', '<f8', (2,)),
+    ('energy', '<f8'),
+    ('age', '<f8'),
+    ('last_reproduction', '<f8'),
+    ('food_eaten', '<u4'),
+    ('offspring', '<u4')
+])
+MIGRANT_FIELDS = {
+    'org_genes': 'genes',
+    'org_species': 'species',
+    'org_pos': 'pos',
+    'org_vel': 'vel',
+    'org_energy': 'energy',
+    'org_age': 'age',
+    'org_last_reproduction': 'last_reproduction',
+    'org_food_eaten': 'food_eaten',
+    'org_offspring': 'offspring'
+}
+
+# DONE yükü: tick, organizma sayısı, yiyecek sayısı + TILE_STAT_NAMES
+DONE_FIELDS = ['tick', 'organism_count', 'food_count'] + TILE_STAT_NAMES
+
+
+# --- Tel formatı -------------------------------------------------------------
+
+def send_message(sock: socket.socket, kind: int, tick: int = 0, payload: bytes = b''):
+    """Tek çerçeve gönder (engelleyen soket)"""
+    sock.sendall(HEADER.pack(kind, tick, len(payload)))
+    if payload:
+        sock.sendall(payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("bağlantı kapandı")
+        received += count
+    return bytes(buffer)
+
+
+def recv_message(sock: socket.socket, expected: Optional[int] = None) -> Tuple[int, int, bytes]:
+    """Tek çerçeve al: (tür, tick, yük); MSG_ERROR gelirse RuntimeError"""
+    kind, tick, length = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    payload = _recv_exact(sock, length) if length else b''
+    if kind == MSG_ERROR:
+        raise RuntimeError(payload.decode('utf-8', errors='replace'))
+    if expected is not None and kind != expected:
+        raise ConnectionError(f"beklenmeyen mesaj türü {kind} (beklenen {expected})")
+    return kind, tick, payload
+
+
+def encode_positions(positions: np.ndarray) -> bytes:
+    return np.ascontiguousarray(positions, dtype='<f8').tobytes()
+
+
+def decode_positions(payload: bytes) -> np.ndarray:
+    return np.frombuffer(payload, dtype='<f8').reshape(-1, 2).astype(np.float64)
+
+
+def encode_migrants(rows: Dict[str, np.ndarray]) -> bytes:
+    """Organizma sütun satırlarını paketlenmiş kayıtlara çevir"""
+    records = np.empty(len(rows['org_pos']), dtype=MIGRANT_DTYPE)
+    for column, field in MIGRANT_FIELDS.items():
+        records[field] = rows[column]
+    return records.tobytes()
+
+
+def decode_migrants(payload: bytes) -> Dict[str, np.ndarray]:
+    """Paketlenmiş kayıtları organizma sütunlarına çevir"""
+    records = np.frombuffer(payload, dtype=MIGRANT_DTYPE)
+    rows = {column: records[field].astype(np.int64 if records[field].dtype.kind in 'iu' else np.float64)
+            for column, field in MIGRANT_FIELDS.items()}
+    rows['org_world'] = np.zeros(len(records), dtype=np.int64)
+    return rows
+
+
+class PeerLinks:
+    """Komşu karolara açık TCP bağlantıları ve kilitlenmesiz toplu mesaj değişimi
+
+    ``exchange`` her komşuya bir çerçeve gönderir ve her komşudan bir
+    çerçeve alır; gönderme ve alma aynı selector döngüsünde yapılır, böylece
+    iki taraf da büyük mesajları aynı anda gönderirken tıkanmaz. Bir sonraki
+    aşamadan erken gelen veri komşunun tamponunda bekletilir.
+    """
+
+    def __init__(self, sockets: Dict[int, socket.socket], timeout: float = 60.0):
+        """
+        Args:
+            sockets: Komşu karo indeksi -> bağlı soket
+            timeout: Tek değişimde beklenecek en uzun süre (saniye)
+        """
+        self.peers = sorted(sockets)
+        self.sockets = sockets
+        self.timeout = timeout
+        self.buffers = {peer: bytearray() for peer in self.peers}
+        self.selector = selectors.DefaultSelector()
+        for peer, sock in sockets.items():
+            sock.setblocking(False)
+            self.selector.register(sock, selectors.EVENT_READ, peer)
+
+        self.stats = {
+            'bytes_sent': 0,
+            'bytes_received': 0,
+            'exchanges': 0
+        }
+
+    def _take_frame(self, peer: int) -> Optional[Tuple[int, int, bytes]]:
+        """Tampondaki ilk tam çerçeveyi çıkar"""
+        buffer = self.buffers[peer]
+        if len(buffer) < HEADER.size:
+            return None
+        kind, tick, length = HEADER.unpack_from(buffer)
+        end = HEADER.size + length
+        if len(buffer) < end:
+            return None
+        payload = bytes(buffer[HEADER.size:end])
+        del buffer[:end]
+        return kind, tick, payload
+
+    def exchange(self, kind: int, tick: int, outgoing: Dict[int, bytes]) -> Dict[int, bytes]:
+        """Her komşuya outgoing[peer] gönder, her komşudan aynı tür ve tick'te bir yük al"""
+        pending = {}
+        for peer in self.peers:
+            payload = outgoing.get(peer, b'')
+            pending[peer] = memoryview(HEADER.pack(kind, tick, len(payload)) + payload)
+            self.selector.modify(self.sockets[peer], selectors.EVENT_READ | selectors.EVENT_WRITE, peer)
+
+        received = {}
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for peer in self.peers:
+                if peer in received:
+                    continue
+                frame = self._take_frame(peer)
+                if frame is None:
+                    continue
+                if frame[0] != kind or frame[1] != tick:
+                    raise ConnectionError(f"karo {peer}: beklenmeyen çerçeve {frame[:2]}, beklenen {(kind, tick)}")
+                received[peer] = frame[2]
+            if len(received) == len(self.peers) and not pending:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"komşu mesajı zaman aşımı (tür {kind}, tick {tick})")
+            for key, events in self.selector.select(remaining):
+                peer = key.data
+                sock = self.sockets[peer]
+                if events & selectors.EVENT_WRITE and peer in pending:
+                    sent = sock.send(pending[peer])
+                    self.stats['bytes_sent'] += sent
+                    pending[peer] = pending[peer][sent:]
+                    if len(pending[peer]) == 0:
+                        del pending[peer]
+                        self.selector.modify(sock, selectors.EVENT_READ, peer)
+                if events & selectors.EVENT_READ:
+                    chunk = sock.recv(1 << 20)
+                    if not chunk:
+                        raise ConnectionError(f"karo {peer} bağlantısı kapandı")
+                    self.stats['bytes_received'] += len(chunk)
+                    self.buffers[peer] += chunk
+
+        self.stats['exchanges'] += 1
+        return received
+
+    def close(self):
+        self.selector.close()
+        for sock in self.sockets.values():
+            sock.close()
+
+
+# --- Düğüm ----------------------------------------------------------------------
+
+class NetworkTileEngine(TileEngine):
+    """Komşularıyla TCP üzerinden halo ve göç mesajlaşan karo motoru
+
+    Sütunlar düğümün kendi belleğindedir. Tick başına iki toplu değişim
+    vardır: yiyecek üretiminden sonra her komşuya onun halo bandına düşen
+    yiyecek pozisyonları, hareket ve ölümden sonra ona geçen organizmalar
+    gönderilir. Değişimler komşular arasında tick kilidi sağlar; küresel
+    bariyer koordinatörün ``STEP`` komutlarıdır.
+    """
+
+    def __init__(self, config: Dict[str, Any], tiles: Tuple[int, int], tile_index: int,
+                 links: PeerLinks, capacities: Tuple[int, int], seed=None,
+                 halo_width: float = DEFAULT_HALO_WIDTH, cell_size: float = 100.0):
+        """
+        Args:
+            config: Bu karoya ölçeklenmiş simülasyon config'i
+            tiles: Karo ızgarası (x, y)
+            tile_index: Bu karonun indeksi
+            links: Komşu bağlantıları (halo kaynaklarının tamamı)
+            capacities: (organizma, yiyecek) kapasitesi
+            seed: Rastgele sayı üreteci tohumu
+            halo_width: Sınır bandı genişliği
+            cell_size: Uzamsal indeks hücre boyutu
+        """
+        self.links = links
+        self._halo_inbox: List[np.ndarray] = []
+        layout = tile_layout(capacities[0], capacities[1], 0)
+        buffers: List[Any] = [None] * (tiles[0] * tiles[1])
+        buffers[tile_index] = {key: np.zeros(shape, dtype=dtype) for key, (dtype, shape) in layout.items()}
+        super().__init__(config, tiles, tile_index, buffers, seed=seed,
+                         halo_width=halo_width, cell_size=cell_size)
+
+        missing = set(self.halo_sources) - set(links.peers)
+        if missing:
+            raise ValueError(f"Eksik komşu bağlantıları: {sorted(missing)}")
+
+    def _halo_foods(self) -> List[np.ndarray]:
+        return self._halo_inbox
+
+    def tick_network(self):
+        """Bir tick: yiyecek -> halo değişimi -> davranış -> göç değişimi"""
+        self._spawn_food()
+        self._decay_food()
+
+        outgoing = {}
+        for peer in self.links.peers:
+            low, high = self.halo_bounds(peer)
+            inside = np.all((self.food_pos >= low) & (self.food_pos < high), axis=1)
+            outgoing[peer] = encode_positions(self.food_pos[inside])
+        incoming = self.links.exchange(MSG_HALO, self.tick, outgoing)
+        self._halo_inbox = [decode_positions(incoming[peer]) for peer in self.links.peers]
+
+        target = self._forage()
+        self._move(target)
+        self._metabolize()
+        self._reproduce(target)
+        self._remove_dead()
+        self._remove_eaten()
+
+        rows, owners = self._take_leavers(destinations=np.array(self.links.peers, dtype=np.int64))
+        outgoing = {
+            peer: encode_migrants({name: values[owners == peer] for name, values in rows.items()})
+            for peer in self.links.peers
+        }
+        incoming = self.links.exchange(MSG_MIGRATE, self.tick, outgoing)
+        for peer in self.links.peers:
+            if incoming[peer]:
+                added = self._append(self._ORGANISM_COLUMNS, decode_migrants(incoming[peer]))
+                self.migration_stats['immigrants'] += added
+
+        self.tick += 1
+        self.current_time += self.dt
+        self._publish_stats()
+
+    def done_payload(self) -> bytes:
+        """Koordinatöre gönderilen sayaç vektörü"""
+        values = [self.tick, len(self.org_world), len(self.food_world)] + list(self.buffer['stats'])
+        return np.array(values, dtype='<i8').tobytes()
+
+
+def _connect_peers(server: socket.socket, tile_index: int, peers: Dict[int, Tuple[str, int]],
+                   timeout: float) -> Dict[int, socket.socket]:
+    """Büyük indeksli komşulara bağlan, küçük indekslilerden gelenleri kabul et"""
+    sockets = {}
+    for peer in sorted(peers):
+        if peer > tile_index:
+            sock = socket.create_connection(tuple(peers[peer]), timeout=timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            send_message(sock, MSG_PEER, payload=struct.pack('<I', tile_index))
+            sockets[peer] = sock
+
+    server.settimeout(timeout)
+    expected = sum(1 for peer in peers if peer < tile_index)
+    while expected:
+        sock, _ = server.accept()
+        sock.settimeout(timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        _, _, payload = recv_message(sock, MSG_PEER)
+        sockets[struct.unpack('<I', payload)[0]] = sock
+        expected -= 1
+    return sockets
+
+
+def run_tile_node(coordinator_host: str, coordinator_port: int, listen_host: str = '127.0.0.1',
+                  timeout: float = 60.0):
+    """Karo düğümü: koordinatöre bağlan, atanan karoyu komut geldikçe ilerlet
+
+    Args:
+        coordinator_host: Koordinatör adresi
+        coordinator_port: Koordinatör portu
+        listen_host: Komşu bağlantıları için dinlenecek arayüz
+        timeout: Bağlantı ve mesaj zaman aşımı (saniye)
+    """
+    server = socket.create_server((listen_host, 0))
+    coordinator = socket.create_connection((coordinator_host, coordinator_port), timeout=timeout)
+    coordinator.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    links = None
+    try:
+        send_message(coordinator, MSG_HELLO, payload=struct.pack('<H', server.getsockname()[1]))
+        _, _, payload = recv_message(coordinator, MSG_ASSIGN)
+        assignment = json.loads(payload)
+        tile_index = assignment['tile_index']
+        peers = {int(index): address for index, address in assignment['peers'].items()}
+
+        links = PeerLinks(_connect_peers(server, tile_index, peers, timeout), timeout=timeout)
+        seed = np.random.SeedSequence(assignment['entropy'], spawn_key=(tile_index,))
+        engine = NetworkTileEngine(assignment['config'], tuple(assignment['tiles']), tile_index, links,
+                                   tuple(assignment['capacities']), seed=seed,
+                                   halo_width=assignment['halo_width'], cell_size=assignment['cell_size'])
+        send_message(coordinator, MSG_READY, payload=engine.done_payload())
+
+        # Komutlar arasında koordinatör süresiz bekleyebilir
+        coordinator.settimeout(None)
+        while True:
+            kind, ticks, _ = recv_message(coordinator)
+            if kind == MSG_STOP:
+                break
+            if kind == MSG_STEP:
+                for _ in range(ticks):
+                    engine.tick_network()
+                send_message(coordinator, MSG_DONE, engine.tick, engine.done_payload())
+    except Exception as e:
+        try:
+            send_message(coordinator, MSG_ERROR, payload=str(e).encode('utf-8'))
+        except OSError:
+            pass
+        logger.error(f"❌ Karo düğümü hatası: {e}")
+    finally:
+        if links is not None:
+            links.close()
+        coordinator.close()
+        server.close()
+
+
+# --- Koordinatör ----------------------------------------------------------------
+
+class DistributedWorldEngine:
+    """Karo düğümlerini TCP ile yöneten koordinatör
+
+    Koordinatör bir port dinler; düğümler (aynı makinede başlatılan süreçler
+    veya başka makinelerde ``tile_node.py``) bağlanıp HELLO ile kendi
+    dinleme portlarını bildirir. Bağlanma sırasına göre karo atanır, her
+    düğüme komşularının adresleri gönderilir ve düğümler birbirine doğrudan
+    bağlanır. Halo ve göç trafiği düğümler arasında akar; koordinatör
+    yalnızca ``STEP`` bariyerini ve sayaç toplamayı yürütür.
+
+    Aynı tohumla ``TiledWorldEngine`` ile aynı sonucu üretir.
+    """
+
+    def __init__(self, config: Dict[str, Any], tiles: Tuple[int, int] = (2, 2),
+                 seed: Optional[int] = None, host: str = '127.0.0.1', port: int = 0,
+                 local_nodes: bool = True, halo_width: float = DEFAULT_HALO_WIDTH,
+                 cell_size: float = 100.0, capacity_factor: float = 4.0, timeout: float = 60.0):
+        """
+        Args:
+            config: Simülasyon config'i (senaryo config.yaml yapısında)
+            tiles: Karo ızgarası (x, y); karo başına bir düğüm
+            seed: Rastgele sayı üreteci tohumu
+            host: Koordinatörün dinleyeceği arayüz
+            port: Koordinatör portu (0: boş port)
+            local_nodes: Düğümleri bu makinede süreç olarak başlat
+            halo_width: Sınır bandı genişliği
+            cell_size: Uzamsal indeks hücre boyutu
+            capacity_factor: Karo kapasitesi / adil pay oranı
+            timeout: Düğüm bağlantısı ve yanıt zaman aşımı (saniye)
+        """
+        self.tiles = (int(tiles[0]), int(tiles[1]))
+        self.tile_count = self.tiles[0] * self.tiles[1]
+        simulation_config = config.get('simulation', {})
+        self.dt = float(simulation_config.get('fixed_dt', 1.0 / simulation_config.get('fps', 60)))
+        self.stats_interval_ticks = max(1, int(round(1.0 / self.dt)))
+        self.tick = 0
+        self.current_time = 0.0
+        self.nodes: List[socket.socket] = []
+        self.processes = []
+        self.node_stats = np.zeros((self.tile_count, len(DONE_FIELDS)), dtype=np.int64)
+
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()
+        self.server.settimeout(timeout)
+
+        try:
+            if local_nodes:
+                connect_host = '127.0.0.1' if host in ('', '0.0.0.0') else host
+                context = multiprocessing.get_context()
+                for _ in range(self.tile_count):
+                    process = context.Process(target=run_tile_node,
+                                              args=(connect_host, self.address[1], connect_host, timeout),
+                                              daemon=True)
+                    process.start()
+                    self.processes.append(process)
+            else:
+                logger.info(f"🌐 {self.tile_count} karo düğümü bekleniyor: {self.address[0]}:{self.address[1]}")
+
+            # Düğümleri kabul et, bağlanma sırasına göre karo ata
+            addresses = []
+            for _ in range(self.tile_count):
+                sock, (peer_host, _) = self.server.accept()
+                sock.settimeout(timeout)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                _, _, payload = recv_message(sock, MSG_HELLO)
+                addresses.append((peer_host, struct.unpack('<H', payload)[0]))
+                self.nodes.append(sock)
+
+            entropy = np.random.SeedSequence(seed).entropy
+            tile_configs = split_config(config, self.tile_count)
+            organism_capacity, food_capacity, _ = tile_capacities(config, self.tile_count, capacity_factor)
+            for index, sock in enumerate(self.nodes):
+                assignment = {
+                    'tile_index': index,
+                    'tiles': list(self.tiles),
+                    'config': tile_configs[index],
+                    'entropy': entropy,
+                    'capacities': [organism_capacity, food_capacity],
+                    'halo_width': halo_width,
+                    'cell_size': cell_size,
+                    'peers': {str(peer): addresses[peer] for peer in range(self.tile_count) if peer != index}
+                }
+                send_message(sock, MSG_ASSIGN, payload=json.dumps(assignment).encode('utf-8'))
+            self._collect(MSG_READY)
+        except Exception:
+            self.close()
+            raise
+
+        self.stats = {
+            'population_history': TimeSeries(('frame', 'population', 'time')),
+            'step_seconds': 0.0
+        }
+        self._record_population()
+        logger.info(f"🌐 DistributedWorldEngine: {self.tiles[0]}x{self.tiles[1]} karo düğümü, "
+                    f"{int(self.get_populations().sum())} organizma")
+
+    def _collect(self, expected: int):
+        """Tüm düğümlerden yanıt al ve sayaçları güncelle"""
+        errors = []
+        for index, sock in enumerate(self.nodes):
+            try:
+                _, _, payload = recv_message(sock, expected)
+                self.node_stats[index] = np.frombuffer(payload, dtype='<i8')
+            except (RuntimeError, ConnectionError, OSError) as e:
+                errors.append(f"karo {index}: {e}")
+        if errors:
+            raise RuntimeError(f"Karo düğümü hatası: {'; '.join(errors)}")
+
+    def step(self, n: int = 1):
+        """Tüm karoları n tick ilerlet (saniyelik nüfus kaydı için parçalı)"""
+        start = time.perf_counter()
+        remaining = n
+        while remaining > 0:
+            chunk = min(remaining, self.stats_interval_ticks - self.tick % self.stats_interval_ticks)
+            for sock in self.nodes:
+                send_message(sock, MSG_STEP, chunk)
+            # Uzun adımlarda düğümler zaman aşımını aşabilir
+            for sock in self.nodes:
+                sock.settimeout(None)
+            self._collect(MSG_DONE)
+            self.tick += chunk
+            self.current_time += chunk * self.dt
+            remaining -= chunk
+            if self.tick % self.stats_interval_ticks == 0:
+                self._record_population()
+        self.stats['step_seconds'] += time.perf_counter() - start
+
+    def _record_population(self):
+        """Toplam nüfusu geçmişe ekle"""
+        self.stats['population_history'].append(
+            frame=self.tick,
+            population=int(self.get_populations().sum()),
+            time=self.current_time
+        )
+
+    def get_populations(self) -> np.ndarray:
+        """Karo başına canlı organizma sayısı"""
+        return self.node_stats[:, DONE_FIELDS.index('organism_count')].copy()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Düğüm sayaçlarının toplamı ve karo başına nüfus"""
+        totals = self.node_stats.sum(axis=0)
+        statistics = {
+            'tiles': self.tile_count,
+            'tick': self.tick,
+            'current_time': self.current_time,
+            'organism_count': int(totals[DONE_FIELDS.index('organism_count')]),
+            'food_count': int(totals[DONE_FIELDS.index('food_count')]),
+            'tile_populations': self.get_populations().tolist(),
+            'ticks_per_second': self.tick / self.stats['step_seconds'] if self.stats['step_seconds'] else 0.0
+        }
+        statistics.update({name: int(totals[DONE_FIELDS.index(name)]) for name in TILE_STAT_NAMES})
+        return statistics
+
+    def close(self):
+        """Düğümleri durdur ve bağlantıları kapat"""
+        for sock in self.nodes:
+            try:
+                send_message(sock, MSG_STOP)
+            except OSError:
+                pass
+            sock.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.server.close()
+        self.nodes, self.processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
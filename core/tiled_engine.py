@@ -0,0 +1,562 @@
+"""
+Ecosim Tiled Engine - Karolara Bölünmüş Dünya, Karo Başına Bir İşçi Süreç
+"""
+
+import copy
+import time
+import multiprocessing
+import numpy as np
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Dict, Any, List, Optional, Tuple
+from .utils import logger
+from .timeseries import TimeSeries
+from .batch_worlds import BatchWorldEngine, GENE_NAMES
+
+# Organizma ve yiyecek sütunlarının tipleri ve satır başına ek boyutları
+ORGANISM_COLUMN_SPECS = {
+    'org_world': (np.int64, ()),
+    'org_genes': (np.float64, (len(GENE_NAMES),)),
+    'org_species': (np.int64, ()),
+    'org_pos': (np.float64, (2,)),
+    'org_vel': (np.float64, (2,)),
+    'org_energy': (np.float64, ()),
+    'org_age': (np.float64, ()),
+    'org_last_reproduction': (np.float64, ()),
+    'org_food_eaten': (np.int64, ()),
+    'org_offspring': (np.int64, ())
+}
+FOOD_COLUMN_SPECS = {
+    'food_world': (np.int64, ()),
+    'food_pos': (np.float64, (2,)),
+    'food_energy': (np.float64, ()),
+    'food_decay': (np.float64, ())
+}
+
+# counts dizisindeki yuvalar
+ORGANISM_COUNT, FOOD_COUNT, OUTBOX_COUNT = 0, 1, 2
+
+# Karo başına paylaşılan istatistik sayaçları (stats dizisi sırası)
+TILE_STAT_NAMES = ['births', 'deaths', 'food_eaten', 'food_spawned', 'immigrants', 'dropped']
+
+# Varsayılan halo genişliği: en geniş tür görüşü (180) + yeme mesafesi payı
+DEFAULT_HALO_WIDTH = 200.0
+
+
+class SharedColumns:
+    """Tek bir shared memory bloğu üzerinde adlandırılmış NumPy dizileri
+
+    Oluşturan süreç ``name`` vermeden çağırır; diğer süreçler aynı
+    ``layout`` ve blok adıyla bağlanır. Diziler kopyasız görünümlerdir.
+    """
+
+    def __init__(self, layout: Dict[str, Tuple[Any, Tuple[int, ...]]], name: Optional[str] = None):
+        """
+        Args:
+            layout: Dizi adı -> (dtype, shape)
+            name: Bağlanılacak mevcut bloğun adı (None ise yeni blok oluşturulur)
+        """
+        offsets = {}
+        size = 0
+        for key, (dtype, shape) in layout.items():
+            offsets[key] = size
+            nbytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+            size += (nbytes + 63) // 64 * 64
+
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=max(size, 64))
+        self.arrays = {
+            key: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offsets[key])
+            for key, (dtype, shape) in layout.items()
+        }
+        if self.owner:
+            for array in self.arrays.values():
+                array.fill(0)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def close(self):
+        """Görünümleri bırak ve bloğu kapat (oluşturan süreçte bloğu sil)"""
+        self.arrays = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def tile_layout(organism_capacity: int, food_capacity: int,
+                outbox_capacity: int) -> Dict[str, Tuple[Any, Tuple[int, ...]]]:
+    """Bir karonun shared memory yerleşimi: sayaçlar, sütunlar ve göç kutusu"""
+    layout = {
+        'counts': (np.int64, (4,)),
+        'stats': (np.int64, (len(TILE_STAT_NAMES),))
+    }
+    for name, (dtype, extra) in ORGANISM_COLUMN_SPECS.items():
+        layout[name] = (dtype, (organism_capacity,) + extra)
+        layout['out_' + name] = (dtype, (outbox_capacity,) + extra)
+    for name, (dtype, extra) in FOOD_COLUMN_SPECS.items():
+        layout[name] = (dtype, (food_capacity,) + extra)
+    return layout
+
+
+class TileEngine(BatchWorldEngine):
+    """Dünyanın tek bir karosunu ilerleten, sütunları shared memory'de tutan motor
+
+    Tüm pozisyonlar dünya koordinatındadır; karo yalnızca sahipliği
+    belirler. Bir tick üç aşamadır ve aşamalar bariyerle ayrılır:
+
+    1. Yiyecek üretimi ve bozulması (yalnızca kendi sütunları)
+    2. Yiyecek arama (kendi yiyecekleri + komşu karoların halo bölgesindeki
+       yiyecekleri, salt okunur), hareket, metabolizma, üreme, ölüm ve
+       karodan çıkan organizmaların göç kutusuna yazılması
+    3. Yenen yiyeceklerin silinmesi ve diğer karoların göç kutularından
+       bu karoya düşen organizmaların alınması
+
+    Halo yiyecekleri hedeflenebilir ama yenemez; organizma sınırı geçip
+    yiyeceğin karosuna girdiğinde onu yer. Böylece hiçbir süreç başka
+    karonun sütunlarına yazmaz ve sonuç işçi zamanlamasından bağımsızdır.
+    """
+
+    def __init__(self, config: Dict[str, Any], tiles: Tuple[int, int], tile_index: int,
+                 buffers: List[SharedColumns], seed=None, halo_width: float = DEFAULT_HALO_WIDTH,
+                 cell_size: float = 100.0):
+        """
+        Args:
+            config: Bu karoya ölçeklenmiş simülasyon config'i (world_size tüm dünya)
+            tiles: Karo ızgarası (x, y)
+            tile_index: Bu karonun indeksi (satır öncelikli)
+            buffers: Tüm karoların shared memory blokları (karo indeksine göre)
+            seed: Rastgele sayı üreteci tohumu (int veya SeedSequence)
+            halo_width: Komşu karolardan görülen sınır bandı genişliği
+            cell_size: Uzamsal indeks hücre boyutu
+        """
+        self.tiles = tiles
+        self.tile_index = tile_index
+        self.tile_x, self.tile_y = tile_index % tiles[0], tile_index // tiles[0]
+        self.buffers = buffers
+        self.buffer = buffers[tile_index]
+        self.counts = self.buffer['counts']
+        self.halo_width = float(halo_width)
+        self.migration_stats = {'immigrants': 0, 'dropped': 0}
+        self._eaten = None
+
+        world_size = np.asarray(config.get('simulation', {}).get('world_size', [2000, 2000]), dtype=np.float64)
+        self.tile_size = world_size / np.asarray(tiles, dtype=np.float64)
+        self.tile_origin = self.tile_size * [self.tile_x, self.tile_y]
+
+        # Halo kaynağı: genişletilmiş karo dikdörtgeniyle kesişen diğer karolar
+        low, high = self.halo_bounds(tile_index)
+        self.halo_sources = []
+        for index in range(tiles[0] * tiles[1]):
+            origin = self.tile_size * [index % tiles[0], index // tiles[0]]
+            if index != tile_index and np.all(origin < high) and np.all(origin + self.tile_size > low):
+                self.halo_sources.append(index)
+
+        super().__init__([config], seed=seed, cell_size=cell_size)
+
+        # Karo yalnızca kendi hücrelerini indeksler
+        self.cells_x = int(np.ceil((self.tile_size[0] + 2 * self.halo_width) / self.cell_size)) + 1
+        self.cells_y = int(np.ceil((self.tile_size[1] + 2 * self.halo_width) / self.cell_size)) + 1
+        self._grid_origin = low
+
+    def halo_bounds(self, tile_index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Karonun halo bandıyla genişletilmiş dikdörtgeni (alt, üst)"""
+        origin = self.tile_size * [tile_index % self.tiles[0], tile_index // self.tiles[0]]
+        return origin - self.halo_width, origin + self.tile_size + self.halo_width
+
+    # --- Shared memory sütunları ----------------------------------------
+
+    _COUNT_SLOTS = {'org_world': ORGANISM_COUNT, 'food_world': FOOD_COUNT}
+
+    def _bind(self, columns, count: int):
+        """Sütun özniteliklerini shared dizilerin ilk count satırına bağla"""
+        for name in columns:
+            setattr(self, name, self.buffer[name][:count])
+        self.counts[self._COUNT_SLOTS[columns[0]]] = count
+
+    def _init_food_columns(self):
+        self._bind(self._FOOD_COLUMNS, 0)
+
+    def _init_organisms(self, configs: List[Dict[str, Any]]):
+        super()._init_organisms(configs)
+        founders = {name: getattr(self, name) for name in self._ORGANISM_COLUMNS}
+        self._bind(self._ORGANISM_COLUMNS, 0)
+        self._append(self._ORGANISM_COLUMNS, founders)
+
+    def _random_positions(self, worlds: np.ndarray) -> np.ndarray:
+        """Karo içinde düzgün dağılımlı pozisyon"""
+        return self.tile_origin + self.rng.random((len(worlds), 2)) * self.tile_size
+
+    def _keep(self, columns, mask: np.ndarray):
+        count = int(np.count_nonzero(mask))
+        for name in columns:
+            self.buffer[name][:count] = getattr(self, name)[mask]
+        self._bind(columns, count)
+
+    def _append(self, columns, values: Dict[str, np.ndarray]) -> int:
+        """Kapasite kadar satır ekle, eklenen satır sayısını döndür"""
+        start = len(getattr(self, columns[0]))
+        capacity = len(self.buffer[columns[0]])
+        added = min(len(values[columns[0]]), capacity - start)
+        for name in columns:
+            self.buffer[name][start:start + added] = values[name][:added]
+        self._bind(columns, start + added)
+        self.migration_stats['dropped'] += len(values[columns[0]]) - added
+        return added
+
+    # --- Tick aşamaları --------------------------------------------------
+
+    def tick_phases(self, barrier):
+        """Bir tick'i diğer karolarla bariyer senkronizasyonunda çalıştır"""
+        self._spawn_food()
+        self._decay_food()
+        barrier.wait()
+
+        target = self._forage()
+        self._move(target)
+        self._metabolize()
+        self._reproduce(target)
+        self._remove_dead()
+        self._emigrate()
+        barrier.wait()
+
+        self._remove_eaten()
+        self._immigrate()
+
+        self.tick += 1
+        self.current_time += self.dt
+        self._publish_stats()
+
+    def _halo_foods(self) -> List[np.ndarray]:
+        """Halo kaynaklarının bu karonun bandına düşen yiyecek pozisyonları (karo sırasıyla)"""
+        low, high = self.halo_bounds(self.tile_index)
+        parts = []
+        for index in self.halo_sources:
+            source = self.buffers[index]
+            positions = source['food_pos'][:source['counts'][FOOD_COUNT]]
+            parts.append(positions[np.all((positions >= low) & (positions < high), axis=1)])
+        return parts
+
+    def _visible_foods(self):
+        """Kendi yiyecekleri + halo yiyecekleri
+
+        Pozisyonlar karo grid'inin orijinine göre kaydırılır; yalnızca ilk
+        ``len(self.food_world)`` satır yenebilir.
+        """
+        positions = np.concatenate([self.food_pos] + self._halo_foods()) - self._grid_origin
+        return positions, np.zeros(len(positions), dtype=np.int64), len(self.food_world)
+
+    def _forage(self) -> np.ndarray:
+        # Grid karo + halo bölgesini kapsar: arama kaydırılmış koordinatlarda yapılır
+        org_pos = self.org_pos
+        self.org_pos = org_pos - self._grid_origin
+        try:
+            target = super()._forage()
+        finally:
+            self.org_pos = org_pos
+        self._target_positions = self._target_positions + self._grid_origin
+        return target
+
+    def _consume_food(self, eaten: np.ndarray, target: np.ndarray):
+        """Yenen yiyecekler 3. aşamada silinir (komşular 2. aşamada okuyor)"""
+        self._eaten = eaten
+
+    def _remove_eaten(self):
+        """Ertelenmiş yenen yiyecekleri sil"""
+        if self._eaten is not None:
+            keep = np.ones(len(self.food_world), dtype=np.bool_)
+            keep[self._eaten] = False
+            self._keep(self._FOOD_COLUMNS, keep)
+            self._eaten = None
+
+    def _owner_tiles(self, positions: np.ndarray) -> np.ndarray:
+        """Pozisyonların sahibi olan karo indeksleri"""
+        cell = (positions // self.tile_size).astype(np.int64)
+        cell[:, 0] = np.clip(cell[:, 0], 0, self.tiles[0] - 1)
+        cell[:, 1] = np.clip(cell[:, 1], 0, self.tiles[1] - 1)
+        return cell[:, 1] * self.tiles[0] + cell[:, 0]
+
+    def _take_leavers(self, limit: Optional[int] = None,
+                      destinations: Optional[np.ndarray] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Karodan çıkan (en fazla limit) organizmayı sütunlardan çıkar
+
+        Args:
+            limit: En fazla çıkarılacak satır
+            destinations: Yalnızca bu karolara gidenler (None ise hepsi)
+
+        Returns:
+            (sütun adı -> satırlar, hedef karo indeksleri)
+        """
+        owners = self._owner_tiles(self.org_pos)
+        leaving = owners != self.tile_index
+        if destinations is not None:
+            leaving &= np.isin(owners, destinations)
+        leaving = np.flatnonzero(leaving)[:limit]
+        rows = {name: getattr(self, name)[leaving] for name in self._ORGANISM_COLUMNS}
+        if leaving.size:
+            keep = np.ones(len(self.org_world), dtype=np.bool_)
+            keep[leaving] = False
+            self._keep(self._ORGANISM_COLUMNS, keep)
+        return rows, owners[leaving]
+
+    def _emigrate(self):
+        """Karodan çıkan organizmaları göç kutusuna taşı
+
+        Kutu doluysa kalanlar bir sonraki tick'e kadar bu karoda bekler.
+        """
+        rows, owners = self._take_leavers(len(self.buffer['out_org_world']))
+        for name in self._ORGANISM_COLUMNS:
+            self.buffer['out_' + name][:len(owners)] = rows[name]
+        self.counts[OUTBOX_COUNT] = len(owners)
+
+    def _immigrate(self):
+        """Diğer karoların göç kutularından bu karoya düşenleri al (karo sırasıyla)"""
+        for index, source in enumerate(self.buffers):
+            if index == self.tile_index:
+                continue
+            count = source['counts'][OUTBOX_COUNT]
+            if count == 0:
+                continue
+            arriving = self._owner_tiles(source['out_org_pos'][:count]) == self.tile_index
+            if not np.any(arriving):
+                continue
+            added = self._append(self._ORGANISM_COLUMNS, {
+                name: source['out_' + name][:count][arriving] for name in self._ORGANISM_COLUMNS
+            })
+            self.migration_stats['immigrants'] += added
+
+    def _publish_stats(self):
+        """Sayaçları koordinatörün okuyacağı shared diziye yaz"""
+        counters = dict(self.migration_stats)
+        counters.update({name: int(self.stats[name].sum()) for name in TILE_STAT_NAMES[:4]})
+        self.buffer['stats'][:] = [counters[name] for name in TILE_STAT_NAMES]
+
+    def _record_population(self):
+        """Nüfus geçmişi koordinatörde tutulur"""
+
+
+def _tile_worker(config, tiles, tile_index, layouts, names, seed, halo_width, cell_size,
+                 barrier, connection):
+    """Karo işçi süreci: komut borusundan gelen tick isteklerini çalıştırır"""
+    buffers = [SharedColumns(layout, name=name) for layout, name in zip(layouts, names)]
+    engine = None
+    try:
+        engine = TileEngine(config, tiles, tile_index, buffers, seed=seed,
+                            halo_width=halo_width, cell_size=cell_size)
+        engine._publish_stats()
+        connection.send(('ready', None))
+        while True:
+            command, argument = connection.recv()
+            if command == 'stop':
+                break
+            if command == 'step':
+                for _ in range(argument):
+                    engine.tick_phases(barrier)
+                connection.send(('done', engine.tick))
+    except BrokenBarrierError:
+        connection.send(('error', f"karo {tile_index}: bariyer bozuldu"))
+    except Exception as e:
+        barrier.abort()
+        connection.send(('error', f"karo {tile_index}: {e}"))
+    finally:
+        engine = None
+        for buffer in buffers:
+            buffer.close()
+        connection.close()
+
+
+def split_config(config: Dict[str, Any], tile_count: int) -> List[Dict[str, Any]]:
+    """Config'i karolara böl: kurucu sayısı, yiyecek üretimi ve nüfus sınırı alan payına göre"""
+    simulation_config = config.get('simulation', {})
+    organism_config = config.get('organism', {})
+    food_config = config.get('food', {})
+
+    initial_count = int(organism_config.get('initial_count', 100))
+    if 'spawn_rate_per_second' in food_config:
+        food_rate = food_config['spawn_rate_per_second']
+    else:
+        food_rate = food_config.get('spawn_rate', 0.05) * simulation_config.get('fps', 60)
+    max_organisms = int(simulation_config.get('max_organisms', 2000))
+
+    tile_configs = []
+    for index in range(tile_count):
+        tile_config = copy.deepcopy(config)
+        tile_config.setdefault('organism', {})['initial_count'] = \
+            initial_count // tile_count + (1 if index < initial_count % tile_count else 0)
+        tile_config.setdefault('food', {})['spawn_rate_per_second'] = food_rate / tile_count
+        tile_config.setdefault('simulation', {})['max_organisms'] = -(-max_organisms // tile_count)
+        tile_configs.append(tile_config)
+    return tile_configs
+
+
+def tile_capacities(config: Dict[str, Any], tile_count: int,
+                    capacity_factor: float = 4.0) -> Tuple[int, int, int]:
+    """Karo başına (organizma, yiyecek, göç kutusu) kapasiteleri"""
+    max_organisms = int(config.get('simulation', {}).get('max_organisms', 2000))
+    initial_count = int(config.get('organism', {}).get('initial_count', 100))
+    organism_capacity = int(max(max_organisms, initial_count) * capacity_factor / tile_count) + 256
+    return organism_capacity, organism_capacity * 2, organism_capacity // 4 + 64
+
+
+class TiledWorldEngine:
+    """Tek büyük dünyayı karolara bölüp her karoyu ayrı süreçte ilerleten koordinatör
+
+    Organizma ve yiyecek sütunları karo başına ``multiprocessing.shared_memory``
+    bloklarındadır. İşçiler her tick'i bariyerle senkron çalıştırır; sınır
+    bandındaki yiyecekler (halo) doğrudan komşunun bloğundan okunur, karo
+    değiştiren organizmalar göç kutusu üzerinden taşınır. Koordinatör
+    yalnızca komut gönderir ve işçiler boştayken blokları okuyarak
+    istatistikleri toplar.
+
+    Davranış modeli ``BatchWorldEngine`` ile aynıdır; nüfus sınırı ve
+    yiyecek üretimi karolara alan payıyla dağıtılır.
+    """
+
+    def __init__(self, config: Dict[str, Any], tiles: Tuple[int, int] = (2, 2),
+                 seed: Optional[int] = None, halo_width: float = DEFAULT_HALO_WIDTH,
+                 cell_size: float = 100.0, capacity_factor: float = 4.0):
+        """
+        Args:
+            config: Simülasyon config'i (senaryo config.yaml yapısında)
+            tiles: Karo ızgarası (x, y); karo başına bir işçi süreç
+            seed: Rastgele sayı üreteci tohumu (karo tohumları bundan türetilir)
+            halo_width: Komşu karolardan görülen sınır bandı genişliği
+            cell_size: Uzamsal indeks hücre boyutu
+            capacity_factor: Karo kapasitesi / karo başına adil pay oranı
+        """
+        self.tiles = (int(tiles[0]), int(tiles[1]))
+        self.tile_count = self.tiles[0] * self.tiles[1]
+        simulation_config = config.get('simulation', {})
+        self.dt = float(simulation_config.get('fixed_dt', 1.0 / simulation_config.get('fps', 60)))
+        self.stats_interval_ticks = max(1, int(round(1.0 / self.dt)))
+        self.tick = 0
+        self.current_time = 0.0
+
+        tile_configs = split_config(config, self.tile_count)
+        organism_capacity, food_capacity, outbox_capacity = \
+            tile_capacities(config, self.tile_count, capacity_factor)
+
+        layout = tile_layout(organism_capacity, food_capacity, outbox_capacity)
+        self.buffers = [SharedColumns(layout) for _ in range(self.tile_count)]
+
+        seeds = np.random.SeedSequence(seed).spawn(self.tile_count)
+        context = multiprocessing.get_context()
+        self.barrier = context.Barrier(self.tile_count)
+        self.connections = []
+        self.workers = []
+        names = [buffer.name for buffer in self.buffers]
+        for index in range(self.tile_count):
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_tile_worker,
+                args=(tile_configs[index], self.tiles, index, [layout] * self.tile_count, names,
+                      seeds[index], halo_width, cell_size, self.barrier, child),
+                daemon=True
+            )
+            worker.start()
+            child.close()
+            self.connections.append(parent)
+            self.workers.append(worker)
+        self._collect('ready')
+
+        self.stats = {
+            'population_history': TimeSeries(('frame', 'population', 'time')),
+            'step_seconds': 0.0
+        }
+        self._record_population()
+        logger.info(f"🧩 TiledWorldEngine: {self.tiles[0]}x{self.tiles[1]} karo, "
+                    f"{int(self.get_populations().sum())} organizma, karo kapasitesi {organism_capacity}")
+
+    def _collect(self, expected: str):
+        """Tüm işçilerden yanıt bekle; hata varsa süreçleri kapatıp yükselt"""
+        errors = []
+        for connection in self.connections:
+            try:
+                status, message = connection.recv()
+            except EOFError:
+                status, message = 'error', "işçi süreç beklenmedik şekilde sonlandı"
+            if status != expected:
+                errors.append(message)
+        if errors:
+            self.close()
+            raise RuntimeError(f"Karo işçisi hatası: {'; '.join(errors)}")
+
+    def step(self, n: int = 1):
+        """Tüm karoları n tick ilerlet (saniyelik nüfus kaydı için parçalı)"""
+        start = time.perf_counter()
+        remaining = n
+        while remaining > 0:
+            chunk = min(remaining, self.stats_interval_ticks - self.tick % self.stats_interval_ticks)
+            for connection in self.connections:
+                connection.send(('step', chunk))
+            self._collect('done')
+            self.tick += chunk
+            self.current_time += chunk * self.dt
+            remaining -= chunk
+            if self.tick % self.stats_interval_ticks == 0:
+                self._record_population()
+        self.stats['step_seconds'] += time.perf_counter() - start
+
+    # --- Sorgular (işçiler boştayken) ---------------------------------------
+
+    def _record_population(self):
+        """Toplam nüfusu geçmişe ekle"""
+        self.stats['population_history'].append(
+            frame=self.tick,
+            population=int(self.get_populations().sum()),
+            time=self.current_time
+        )
+
+    def get_populations(self) -> np.ndarray:
+        """Karo başına canlı organizma sayısı"""
+        return np.array([buffer['counts'][ORGANISM_COUNT] for buffer in self.buffers])
+
+    def get_organism_columns(self, *names: str) -> Dict[str, np.ndarray]:
+        """İstenen organizma sütunlarının tüm karolardan birleştirilmiş kopyası"""
+        return {
+            name: np.concatenate([buffer[name][:buffer['counts'][ORGANISM_COUNT]] for buffer in self.buffers])
+            for name in names
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Karo sayaçlarının toplamı ve karo başına nüfus"""
+        totals = np.sum([buffer['stats'] for buffer in self.buffers], axis=0)
+        statistics = {
+            'tiles': self.tile_count,
+            'tick': self.tick,
+            'current_time': self.current_time,
+            'organism_count': int(self.get_populations().sum()),
+            'food_count': int(sum(buffer['counts'][FOOD_COUNT] for buffer in self.buffers)),
+            'tile_populations': self.get_populations().tolist(),
+            'ticks_per_second': self.tick / self.stats['step_seconds'] if self.stats['step_seconds'] else 0.0
+        }
+        statistics.update({name: int(totals[i]) for i, name in enumerate(TILE_STAT_NAMES)})
+        return statistics
+
+    def close(self):
+        """İşçileri durdur ve shared memory bloklarını sil"""
+        for connection, worker in zip(self.connections, self.workers):
+            if worker.is_alive():
+                try:
+                    connection.send(('stop', None))
+                except (BrokenPipeError, OSError):
+                    pass
+        for worker in self.workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        for connection in self.connections:
+            connection.close()
+        for buffer in self.buffers:
+            buffer.close()
+        self.connections, self.workers, self.buffers = [], [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,292 @@
+"""
+Ecosim Time Series - Halka Tamponlu, Çok Çözünürlüklü Zaman Serileri
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional, Sequence
+
+TIMESERIES_TAG = '__timeseries__'
+
+
+class RingBuffer:
+    """Sabit kapasiteli NumPy halka tamponu
+
+    Her örnek iki kez yazılır (``i`` ve ``i + capacity``); böylece son
+    ``n`` örnek depolamada her zaman bitişiktir ve ``view`` kopyasız,
+    eskiden yeniye sıralı bir görünüm döndürür. Ekleme O(1)'dir.
+    """
+
+    def __init__(self, capacity: int, width: Optional[int] = None, dtype=np.float64):
+        """
+        Args:
+            capacity: Tutulacak en fazla örnek
+            width: Örnek başına alan sayısı (None: tek değerli, 1 boyutlu görünümler)
+            dtype: Eleman tipi
+        """
+        self.capacity = max(1, int(capacity))
+        self.width = width
+        shape = (2 * self.capacity,) if width is None else (2 * self.capacity, int(width))
+        self._data = np.zeros(shape, dtype=dtype)
+        self._head = 0  # Sonraki yazım konumu
+        self._count = 0
+        self.total = 0  # Şimdiye kadar eklenen örnek
+
+    def append(self, value):
+        """Örnek ekle (kapasite doluysa en eskisinin üzerine yazılır)"""
+        head = self._head
+        self._data[head] = value
+        self._data[head + self.capacity] = value
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        self.total += 1
+
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """Son ``n`` örneğin (None: tümü) salt okunur, kopyasız görünümü"""
+        n = self._count if n is None else max(0, min(int(n), self._count))
+        end = self._head + self.capacity
+        window = self._data[end - n:end]
+        window.flags.writeable = False
+        return window
+
+    def last(self):
+        """En yeni örnek (boşsa None)"""
+        if self._count == 0:
+            return None
+        return self._data[self._head + self.capacity - 1]
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON'a yazılabilir durum (eskiden yeniye örnekler)"""
+        return {'capacity': self.capacity, 'total': self.total, 'values': self.view().tolist()}
+
+    def load(self, state: Dict[str, Any]):
+        """``to_dict`` çıktısını geri yükle"""
+        self.clear()
+        for value in state['values'][-self.capacity:]:
+            self.append(value)
+        self.total = int(state['total'])
+
+
+class TimeSeries:
+    """Adlandırılmış alanlı, çok çözünürlüklü zaman serisi
+
+    Seviye 0 son ``capacity`` örneği tam hızda tutar; seviye ``k`` her
+    ``factor**k`` ham örneği tek satıra indirger. Ayrıca tüm koşuyu kapsayan
+    bir geçmiş tutulur: ``capacity`` satıra ulaşınca komşu satır çiftleri
+    birleştirilir ve satır başına düşen örnek (``history_stride``) iki
+    katına çıkar. İndirgemede değer alanlarının ortalaması, ``index_fields``
+    (frame, time gibi) için bloğun son değeri alınır. Tüm örnekler üzerinden
+    en küçük/en büyük/ortalama ayrıca O(1) güncellenir.
+    """
+
+    def __init__(self, fields: Sequence[str], capacity: int = 1000, levels: int = 3, factor: int = 10,
+                 index_fields: Sequence[str] = ('frame', 'time')):
+        """
+        Args:
+            fields: Alan adları
+            capacity: Seviye ve geçmiş başına satır
+            levels: Halka seviyesi sayısı (tam hız dahil)
+            factor: Ardışık seviyeler arasındaki seyreltme oranı
+            index_fields: İndirgemede ortalaması alınmayan alanlar
+        """
+        self.fields = list(fields)
+        self._field_index = {name: i for i, name in enumerate(self.fields)}
+        width = len(self.fields)
+        self.capacity = max(2, int(capacity))
+        self.factor = max(2, int(factor))
+        self.index_fields = [name for name in index_fields if name in self._field_index]
+        self._mean_mask = np.array([name not in self.index_fields for name in self.fields])
+
+        self.levels = [RingBuffer(self.capacity, width) for _ in range(max(1, int(levels)))]
+        self.level_strides = [self.factor ** k for k in range(len(self.levels))]
+
+        # Geçmiş çift sayıda satır tutar (çift birleştirme için)
+        self._history = np.zeros((self.capacity + self.capacity % 2, width))
+        self._history_count = 0
+        self.history_stride = 1
+
+        # İndirgeme biriktiricileri: seviye 1.. ve geçmiş için toplam ve örnek sayısı
+        self._sums = np.zeros((len(self.levels) + 1, width))
+        self._counts = np.zeros(len(self.levels) + 1, dtype=np.int64)
+
+        self._min = np.full(width, np.inf)
+        self._max = np.full(width, -np.inf)
+        self._total = np.zeros(width)
+        self._valid = np.zeros(width, dtype=np.int64)
+
+    def append(self, **values):
+        """Örnek ekle (verilmeyen alanlar NaN)"""
+        sample = np.full(len(self.fields), np.nan)
+        for name, value in values.items():
+            sample[self._field_index[name]] = value
+        self._append(sample)
+
+    def append_row(self, row: Sequence[float]):
+        """Örnek ekle (değerler ``fields`` sırasında; geniş seriler için)"""
+        self._append(np.asarray(row, dtype=np.float64))
+
+    def _append(self, sample: np.ndarray):
+        self.levels[0].append(sample)
+
+        valid = ~np.isnan(sample)
+        self._valid += valid
+        self._total[valid] += sample[valid]
+        np.fmin(self._min, sample, out=self._min)
+        np.fmax(self._max, sample, out=self._max)
+
+        filled = np.nan_to_num(sample)
+        for k in range(1, len(self.levels) + 1):
+            self._sums[k] += filled
+            self._counts[k] += 1
+            stride = self.level_strides[k] if k < len(self.levels) else self.history_stride
+            if self._counts[k] >= stride:
+                row = np.where(self._mean_mask, self._sums[k] / self._counts[k], sample)
+                self._sums[k] = 0.0
+                self._counts[k] = 0
+                if k < len(self.levels):
+                    self.levels[k].append(row)
+                else:
+                    self._push_history(row)
+
+    def _push_history(self, row: np.ndarray):
+        self._history[self._history_count] = row
+        self._history_count += 1
+        if self._history_count == len(self._history):
+            # Dolunca çiftleri birleştir: çözünürlük yarıya, kapsam iki katına
+            pairs = self._history.reshape(-1, 2, self._history.shape[1])
+            merged = np.where(self._mean_mask, pairs.mean(axis=1), pairs[:, 1])
+            self._history[:len(merged)] = merged
+            self._history_count = len(merged)
+            self.history_stride *= 2
+
+    def __len__(self) -> int:
+        """Şimdiye kadar eklenen örnek sayısı"""
+        return self.levels[0].total
+
+    def recent(self, n: Optional[int] = None) -> np.ndarray:
+        """Son ``n`` tam hız örneği (kopyasız görünüm, satırlar ``fields`` sırasında)"""
+        return self.levels[0].view(n)
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Bir alanın son ``n`` tam hız değeri (kopyasız görünüm)"""
+        return self.recent(n)[:, self._field_index[name]]
+
+    def level(self, k: int, n: Optional[int] = None) -> np.ndarray:
+        """``k``. seviyenin son ``n`` satırı (her satır ``factor**k`` örnek)"""
+        return self.levels[k].view(n)
+
+    def history(self) -> np.ndarray:
+        """Tüm koşunun seyreltilmiş geçmişi (her satır ``history_stride`` örnek)"""
+        view = self._history[:self._history_count]
+        view.flags.writeable = False
+        return view
+
+    def last(self) -> Optional[Dict[str, float]]:
+        """En yeni örnek"""
+        sample = self.levels[0].last()
+        return None if sample is None else dict(zip(self.fields, sample.tolist()))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Tüm örnekler üzerinden alan başına en küçük, en büyük ve ortalama"""
+        result = {}
+        for i, name in enumerate(self.fields):
+            if self._valid[i]:
+                result[name] = {'min': float(self._min[i]), 'max': float(self._max[i]),
+                                'mean': float(self._total[i] / self._valid[i])}
+        return result
+
+    def records(self, rows: Optional[np.ndarray] = None) -> List[Dict[str, float]]:
+        """Satırları sözlük listesine çevir (varsayılan: tam hız pencere)
+
+        Tam sayı değerler int olarak yazılır, NaN alanlar atlanır.
+        """
+        rows = self.recent() if rows is None else rows
+        return [{name: int(value) if value.is_integer() else value
+                 for name, value in zip(self.fields, row) if value == value}
+                for row in rows.tolist()]
+
+    def clear(self):
+        for ring in self.levels:
+            ring.clear()
+        self._history_count = 0
+        self.history_stride = 1
+        self._sums[:] = 0.0
+        self._counts[:] = 0
+        self._min[:] = np.inf
+        self._max[:] = -np.inf
+        self._total[:] = 0.0
+        self._valid[:] = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Checkpoint'e yazılabilir tam durum"""
+        def numbers(array):
+            return [None if value != value or abs(value) == np.inf else value for value in array.tolist()]
+
+        return {
+            TIMESERIES_TAG: 1,
+            'fields': self.fields,
+            'capacity': self.capacity,
+            'factor': self.factor,
+            'index_fields': self.index_fields,
+            'levels': [ring.to_dict() for ring in self.levels],
+            'history': self.history().tolist(),
+            'history_stride': self.history_stride,
+            'sums': self._sums.tolist(),
+            'counts': self._counts.tolist(),
+            'min': numbers(self._min),
+            'max': numbers(self._max),
+            'total': self._total.tolist(),
+            'valid': self._valid.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'TimeSeries':
+        """``to_dict`` çıktısından seriyi oluştur"""
+        series = cls(state['fields'], state['capacity'], len(state['levels']), state['factor'],
+                     state['index_fields'])
+        for ring, ring_state in zip(series.levels, state['levels']):
+            ring.load(ring_state)
+        history = np.array(state['history'], dtype=np.float64).reshape(-1, len(series.fields))
+        series._history[:len(history)] = history
+        series._history_count = len(history)
+        series.history_stride = int(state['history_stride'])
+        series._sums[:] = state['sums']
+        series._counts[:] = state['counts']
+        series._min[:] = [np.inf if value is None else value for value in state['min']]
+        series._max[:] = [-np.inf if value is None else value for value in state['max']]
+        series._total[:] = state['total']
+        series._valid[:] = state['valid']
+        return series
+
+
+def encode_series(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """İstatistik sözlüğündeki zaman serilerini JSON'a yazılabilir duruma çevir"""
+    return {key: value.to_dict() if isinstance(value, TimeSeries) else value for key, value in stats.items()}
+
+
+def decode_series(stats: Dict[str, Any], defaults: Optional[Dict[str, 'TimeSeries']] = None) -> Dict[str, Any]:
+    """``encode_series`` çıktısını geri çöz
+
+    Args:
+        stats: Kodlanmış istatistikler
+        defaults: Anahtar -> boş seri; eski biçimdeki sözlük listeleri bu
+            serilere eklenerek dönüştürülür
+    """
+    decoded = dict(stats)
+    for key, value in stats.items():
+        if isinstance(value, dict) and value.get(TIMESERIES_TAG):
+            decoded[key] = TimeSeries.from_dict(value)
+        elif defaults and key in defaults and isinstance(value, list):
+            series = defaults[key]
+            for record in value:
+                series.append(**{name: record[name] for name in series.fields if name in record})
+            decoded[key] = series
+    return decoded
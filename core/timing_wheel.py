@@ -0,0 +1,116 @@
+"""
+Ecosim Timing Wheel - Tick Bazlı Zamanlanmış Olaylar
+"""
+
+import math
+from typing import Any, List, Tuple
+
+
+class TimingWheel:
+    """Simülasyon tick'ine göre anahtarlanmış hiyerarşik zamanlama çarkı
+
+    Yiyecek bozulması, yaşlılık ölümü ve üreme bekleme süresi gibi
+    deterministik bitiş zamanları bir kez kaydedilir; her tick'te tüm
+    popülasyonu taramak yerine yalnızca o tick'in kovası boşaltılır.
+
+    Seviye 0 her biri bir tick olan 256 kovadan oluşur; üst seviyeler
+    64'er kovalık ve giderek kabalaşan aralıklardır. Üst seviye kovaları
+    zamanı gelince alt seviyelere dağıtılır (cascade).
+    """
+
+    def __init__(self, tick_seconds: float = 1.0 / 60.0,
+                 level_bits: Tuple[int, ...] = (8, 6, 6, 6)):
+        """
+        Args:
+            tick_seconds: Bir tick'in simülasyon süresi (saniye)
+            level_bits: Seviye başına kova sayısının log2 değeri
+        """
+        self.tick_seconds = tick_seconds
+        self.level_bits = level_bits
+        self.shifts = []
+        shift = 0
+        for bits in level_bits:
+            self.shifts.append(shift)
+            shift += bits
+        self.total_bits = shift
+
+        self.now = 0
+        self.levels = [[[] for _ in range(1 << bits)] for bits in level_bits]
+        self.overflow: List[Tuple[int, Any]] = []
+        self.pending = 0
+
+        self.stats = {
+            'scheduled': 0,
+            'fired': 0,
+            'cascaded': 0
+        }
+
+    def ticks_for(self, seconds: float) -> int:
+        """Saniyeyi (yukarı yuvarlanmış) tick sayısına çevir, en az 1"""
+        return max(1, int(math.ceil(seconds / self.tick_seconds - 1e-9)))
+
+    def schedule(self, tick: int, item: Any):
+        """Olayı mutlak tick'e kaydet (geçmiş tick'ler bir sonraki tick'e çekilir)"""
+        self._place(max(int(tick), self.now + 1), item)
+        self.pending += 1
+        self.stats['scheduled'] += 1
+
+    def schedule_in(self, seconds: float, item: Any) -> int:
+        """Olayı şimdiden seconds sonrasına kaydet, hedef tick'i döndür"""
+        tick = self.now + self.ticks_for(seconds)
+        self.schedule(tick, item)
+        return tick
+
+    def _place(self, tick: int, item: Any):
+        """Olayı, şimdiki zamanla ortak üst bitleri paylaştığı en alt seviyeye yerleştir"""
+        for level, (bits, shift) in enumerate(zip(self.level_bits, self.shifts)):
+            span_shift = shift + bits
+            if (tick >> span_shift) == (self.now >> span_shift):
+                index = (tick >> shift) & ((1 << bits) - 1)
+                self.levels[level][index].append((tick, item))
+                return
+        self.overflow.append((tick, item))
+
+    def _cascade(self, bucket: List[Tuple[int, Any]]):
+        """Üst seviye kovasını yeniden yerleştir"""
+        for tick, item in bucket:
+            self._place(tick, item)
+        self.stats['cascaded'] += len(bucket)
+
+    def advance(self) -> List[Any]:
+        """Bir tick ilerle ve zamanı gelen olayları döndür"""
+        self.now += 1
+
+        # Taşma listesi ve üst seviyeler (yukarıdan aşağıya)
+        if self.now & ((1 << self.total_bits) - 1) == 0 and self.overflow:
+            overflow, self.overflow = self.overflow, []
+            self._cascade(overflow)
+
+        for level in range(len(self.level_bits) - 1, 0, -1):
+            shift = self.shifts[level]
+            if self.now & ((1 << shift) - 1) != 0:
+                continue
+            index = (self.now >> shift) & ((1 << self.level_bits[level]) - 1)
+            bucket = self.levels[level][index]
+            if bucket:
+                self.levels[level][index] = []
+                self._cascade(bucket)
+
+        index = self.now & ((1 << self.level_bits[0]) - 1)
+        bucket = self.levels[0][index]
+        if not bucket:
+            return []
+        self.levels[0][index] = []
+        self.pending -= len(bucket)
+        self.stats['fired'] += len(bucket)
+        return [item for _, item in bucket]
+
+    def clear(self):
+        """Tüm olayları sil ve zamanı sıfırla"""
+        self.now = 0
+        self.levels = [[[] for _ in range(1 << bits)] for bits in self.level_bits]
+        self.overflow = []
+        self.pending = 0
+
+    def __len__(self) -> int:
+        return self.pending
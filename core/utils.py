@@ -2,60 +2,111 @@
 Ecosim Utils - GPU Hızlandırma ve Yardımcı Fonksiyonlar
 """
 
+import atexit
 import numpy as np
 import time
 import logging
+import functools
+import threading
+import sys
 from typing import Tuple, List, Optional
 import json
 from pathlib import Path
 
-# GPU hızlandırma için CuPy import
-try:
-    import cupy as cp
-    GPU_AVAILABLE = True
-    print("🚀 CuPy GPU hızlandırma aktif")
-except ImportError:
-    GPU_AVAILABLE = False
-    print("⚠️  CuPy bulunamadı, CPU modunda çalışılıyor")
-
-# Numba JIT derleme
-try:
-    from numba import jit, prange
-    NUMBA_AVAILABLE = True
-    print("⚡ Numba JIT derleme aktif")
-except ImportError:
-    NUMBA_AVAILABLE = False
-    print("⚠️  Numba bulunamadı, standart Python kullanılıyor")
-
-# Logging ayarları
-import os
-from pathlib import Path
+logger = logging.getLogger(__name__)
 
-# Log dizinini oluştur
-log_dir = Path("data/logs")
-log_dir.mkdir(parents=True, exist_ok=True)
+# Hızlandırıcılar (CuPy, Numba) import sırasında değil ilk kullanımda yüklenir;
+# modül import'u yan etkisizdir (print, dizin oluşturma, logging ayarı yok)
+_accelerators = {}
 
-# Handle Unicode encoding issues on Windows console
-import sys
-if sys.platform == 'win32':
-    try:
-        # Use UTF-8 encoding for console output
-        import codecs
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
-    except:
-        pass  # Fallback if encoding setup fails
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / 'simulation.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+def get_cupy():
+    """CuPy modülünü döndür (yoksa None), ilk çağrıda yüklenir"""
+    if 'cupy' not in _accelerators:
+        try:
+            import cupy
+            _accelerators['cupy'] = cupy
+            logger.info("🚀 CuPy GPU hızlandırma aktif")
+        except ImportError:
+            _accelerators['cupy'] = None
+            logger.debug("⚠️  CuPy bulunamadı, CPU modunda çalışılıyor")
+    return _accelerators['cupy']
 
-logger = logging.getLogger(__name__)
+def get_numba():
+    """Numba modülünü döndür (yoksa None), ilk çağrıda yüklenir"""
+    if 'numba' not in _accelerators:
+        try:
+            import numba
+            _accelerators['numba'] = numba
+            logger.info("⚡ Numba JIT derleme aktif")
+        except ImportError:
+            _accelerators['numba'] = None
+            logger.debug("⚠️  Numba bulunamadı, standart Python kullanılıyor")
+    return _accelerators['numba']
+
+def lazy_jit(**options):
+    """Numba ``jit`` dekoratörünün tembel hali
+    
+    Fonksiyon ilk çağrıldığında Numba yüklenip derlenir; Numba yoksa
+    saf Python sürümü kullanılır. Orijinal fonksiyon ``py_func`` ile
+    erişilebilir. İlk çağrı birden çok thread'den gelirse derleme bir
+    kez yapılır.
+    """
+    def decorator(func):
+        compiled = None
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            nonlocal compiled
+            if compiled is None:
+                with lock:
+                    if compiled is None:
+                        numba = get_numba()
+                        compiled = numba.jit(**options)(func) if numba is not None else func
+            return compiled(*args)
+        
+        wrapper.py_func = func
+        return wrapper
+    return decorator
+
+def __getattr__(name):
+    """Eski modül seviyesi bayrak ve isimler için geriye uyumluluk (tembel)"""
+    if name == 'GPU_AVAILABLE':
+        return get_cupy() is not None
+    if name == 'NUMBA_AVAILABLE':
+        return get_numba() is not None
+    if name == 'cp' and get_cupy() is not None:
+        return get_cupy()
+    if name in ('jit', 'prange') and get_numba() is not None:
+        return getattr(get_numba(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def configure_logging(log_dir: str = "data/logs", level: int = logging.INFO):
+    """Logging'i yapılandır (yalnızca giriş noktaları çağırır)
+    
+    Log dizinini oluşturur, dosya ve konsol handler'larını ekler.
+    """
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+    
+    # Handle Unicode encoding issues on Windows console
+    if sys.platform == 'win32':
+        try:
+            # Use UTF-8 encoding for console output
+            import codecs
+            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
+            sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
+        except:
+            pass  # Fallback if encoding setup fails
+    
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_path / 'simulation.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
 
 class PerformanceMonitor:
     """Performans izleme sınıfı"""
@@ -90,12 +141,12 @@ class PerformanceMonitor:
 # Global performans monitörü
 perf_monitor = PerformanceMonitor()
 
-@jit(nopython=True) if NUMBA_AVAILABLE else lambda f: f
+@lazy_jit(nopython=True)
 def calculate_distance(pos1: np.ndarray, pos2: np.ndarray) -> float:
     """İki nokta arasındaki Öklid mesafesini hesapla"""
     return np.sqrt(np.sum((pos1 - pos2) ** 2))
 
-@jit(nopython=True) if NUMBA_AVAILABLE else lambda f: f
+@lazy_jit(nopython=True)
 def calculate_angle(pos1: np.ndarray, pos2: np.ndarray) -> float:
     """İki nokta arasındaki açıyı hesapla"""
     dx = pos2[0] - pos1[0]
@@ -104,20 +155,22 @@ def calculate_angle(pos1: np.ndarray, pos2: np.ndarray) -> float:
 
 def gpu_array_to_cpu(gpu_array):
     """GPU array'ini CPU'ya taşı"""
-    if GPU_AVAILABLE and hasattr(gpu_array, 'get'):
+    if hasattr(gpu_array, 'get') and get_cupy() is not None:
         return gpu_array.get()
     return gpu_array
 
 def cpu_array_to_gpu(cpu_array):
     """CPU array'ini GPU'ya taşı"""
-    if GPU_AVAILABLE:
+    cp = get_cupy()
+    if cp is not None:
         return cp.asarray(cpu_array)
     return cpu_array
 
 def batch_distance_calculation(positions1: np.ndarray, positions2: np.ndarray) -> np.ndarray:
     """Toplu mesafe hesaplama (GPU hızlandırmalı) - OPTİMİZE EDİLDİ"""
     # Performans moduna göre GPU kullanımı
-    if GPU_AVAILABLE and len(positions1) > 100 and len(positions2) > 100:  # Daha yüksek threshold
+    cp = get_cupy() if len(positions1) > 100 and len(positions2) > 100 else None  # Daha yüksek threshold
+    if cp is not None:
         try:
             gpu_pos1 = cpu_array_to_gpu(positions1)
             gpu_pos2 = cpu_array_to_gpu(positions2)
@@ -143,7 +196,8 @@ def batch_distance_calculation(positions1: np.ndarray, positions2: np.ndarray) -
 
 def generate_random_positions(count: int, world_size: Tuple[int, int]) -> np.ndarray:
     """Dünya içinde rastgele pozisyonlar üret"""
-    if GPU_AVAILABLE and count > 1000:
+    cp = get_cupy() if count > 1000 else None
+    if cp is not None:
         # GPU'da büyük batch'ler için
         gpu_positions = cp.random.uniform(
             low=[0, 0], 
@@ -158,14 +212,15 @@ def generate_random_positions(count: int, world_size: Tuple[int, int]) -> np.nda
             size=(count, 2)
         )
 
-def save_simulation_data(data: dict, filename: str):
-    """Simülasyon verilerini JSON formatında kaydet"""
+def save_simulation_data(data: dict, filename: str, indent: Optional[int] = 2):
+    """Simülasyon verilerini JSON formatında kaydet (indent=None: tek satır, hızlı)"""
     data_dir = Path("data/stats")
     data_dir.mkdir(parents=True, exist_ok=True)
     
     filepath = data_dir / f"{filename}.json"
+    separators = (',', ':') if indent is None else None
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, indent=indent, separators=separators, ensure_ascii=False)
     
     logger.info(f"📊 Veriler kaydedildi: {filepath}")
 
@@ -202,22 +257,40 @@ def create_color_gradient(values: np.ndarray, colormap: str = 'viridis') -> np.n
         colors[:, 1] = ((1 - normalized) * 255).astype(np.uint8)  # Yeşil
         return colors
 
+_event_log = None
+
+def get_event_log():
+    """Organizma olay günlüğü yazıcısını döndür (ilk çağrıda varsayılanlarla oluşur)"""
+    global _event_log
+    if _event_log is None:
+        from .event_log import EventLogWriter
+        _event_log = EventLogWriter()
+    return _event_log
+
+def configure_event_log(event_config: Optional[dict] = None):
+    """Olay günlüğünü verilen ayarlarla yeniden oluştur (mevcut tampon yazılır)"""
+    global _event_log
+    from .event_log import EventLogWriter
+    if _event_log is not None:
+        _event_log.close()
+    _event_log = EventLogWriter(event_config)
+    return _event_log
+
+@atexit.register
+def _close_event_log():
+    if _event_log is not None:
+        _event_log.close()
+
 def log_organism_event(organism_id: int, event_type: str, frame: int, **kwargs):
-    """Organizma olaylarını logla"""
-    event_data = {
+    """Organizma olaylarını logla (tamponlu; dosyaya arka planda toplu yazılır)"""
+    event_log = _event_log or get_event_log()
+    event_log.emit({
         'organism_id': organism_id,
         'event_type': event_type,
-        'frame': frame,
+        'frame': frame or event_log.tick,
         'timestamp': time.time(),
         **kwargs
-    }
-    
-    logger.info(f"🦠 Organism #{organism_id} {event_type} at frame {frame}")
-    
-    # JSON log dosyasına da kaydet
-    log_dir = Path("data/logs")
-    log_dir.mkdir(parents=True, exist_ok=True)
+    })
     
-    log_file = log_dir / "organism_events.jsonl"
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(event_data, ensure_ascii=False) + '\n') 
\ No newline at end of file
+    if event_log.console:
+        logger.info(f"🦠 Organism #{organism_id} {event_type} at frame {frame}")
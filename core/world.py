@@ -6,6 +6,10 @@ import numpy as np
 import random
 from typing import Dict, List, Optional, Tuple, Any
 from .utils import logger
+from .sensing import NeighborhoodSensor
+from .food import Food, FoodStore
+from .scent_field import FoodScentField
+from .timing_wheel import TimingWheel
 
 class Biome:
     """Biome (ekosistem) sınıfı"""
@@ -22,22 +26,49 @@ class Biome:
         self.food_spawn_rate = fertility * 0.5 + 0.1
         self.organism_energy_cost = (1.0 - fertility) * 0.3 + 0.7
 
+# Noise eşikleri -> biome (noise < eşik olan ilk biome seçilir)
+BIOME_THRESHOLDS = [
+    (-0.5, 'tundra'),
+    (-0.2, 'mountain'),
+    (0.0, 'forest'),
+    (0.3, 'grassland'),
+    (0.6, 'swamp'),
+    (0.8, 'desert'),
+]
+BIOME_FALLBACK = 'ocean'
+
 class World:
     """Dünya sistemi - organizmalar ve yiyecekler için ortam"""
     
-    def __init__(self, size: Tuple[int, int] = (2000, 2000)):
+    def __init__(self, size: Tuple[int, int] = (2000, 2000),
+                 scent_config: Optional[Dict[str, Any]] = None):
         self.size = np.array(size, dtype=np.float32)
         
         # Organizmalar ve yiyecekler
         self.organisms = []
+        self.free_organism_slots = []  # Yeniden kullanılabilir boş organizma slot'ları
         self.foods = []
         
+        # Yiyecek durumu dizilerde (slot = foods indeksi)
+        self.food_store = FoodStore()
+        self.free_food_slots = []  # Yeniden kullanılabilir boş yiyecek slot'ları
+        
+        # Yiyecek koku/yoğunluk alanı (gradyanla yiyecek arama)
+        self.scent_field = FoodScentField(self.size, scent_config)
+        
+        # Zamanlanmış bitişler (yiyecek bozulması, yaşlılık, üreme bekleme süresi)
+        # tick_seconds Simulation tarafından fixed_dt'ye ayarlanır
+        self.scheduler = TimingWheel()
+        
         # Spatial hash sistemi (performans için)
         self.spatial_hash = {}
         self.chunk_size = 100
         self.chunks = {}
         self.active_chunks = set()
         
+        # Tick başına komşuluk özetleri (sosyal/kaçma/sürü davranışları için)
+        self.neighborhood = NeighborhoodSensor(self.chunk_size)
+        
         # İstatistikler
         self.stats = {
             'total_organisms': 0,
@@ -50,7 +81,12 @@ class World:
         self.noise_seed = random.randint(0, 10000)
         
         # Biome sistemi
+        self.biome_cell_size = 50
         self.biomes = self._initialize_biomes()
+        self.biome_keys = [key for _, key in BIOME_THRESHOLDS] + [BIOME_FALLBACK]
+        self.biome_food_rates = np.array(
+            [self.biomes[key].food_spawn_rate for key in self.biome_keys]
+        )
         self.biome_noise = self._generate_biome_noise()
         
         # Tür yöneticisi
@@ -76,7 +112,8 @@ class World:
     def _generate_biome_noise(self) -> np.ndarray:
         """Biome dağılımı için noise oluştur"""
         # Basit Perlin noise benzeri sistem
-        width, height = int(self.size[0] // 50), int(self.size[1] // 50)  # Daha az detay
+        width = int(self.size[0] // self.biome_cell_size)  # Daha az detay
+        height = int(self.size[1] // self.biome_cell_size)
         noise = np.zeros((height, width))
         
         # Çoklu katman noise
@@ -107,27 +144,50 @@ class World:
     def get_biome_at(self, x: float, y: float) -> Biome:
         """Belirli koordinattaki biome'u döndür"""
         # Noise koordinatlarına çevir
-        nx = int(x / 50) % self.biome_noise.shape[1]
-        ny = int(y / 50) % self.biome_noise.shape[0]
+        nx = int(x / self.biome_cell_size) % self.biome_noise.shape[1]
+        ny = int(y / self.biome_cell_size) % self.biome_noise.shape[0]
         
         # Noise değerini al
         noise_value = self.biome_noise[ny, nx]
         
         # Noise değerine göre biome seç
-        if noise_value < -0.5:
-            return self.biomes['tundra']
-        elif noise_value < -0.2:
-            return self.biomes['mountain']
-        elif noise_value < 0.0:
-            return self.biomes['forest']
-        elif noise_value < 0.3:
-            return self.biomes['grassland']
-        elif noise_value < 0.6:
-            return self.biomes['swamp']
-        elif noise_value < 0.8:
-            return self.biomes['desert']
+        for threshold, biome_key in BIOME_THRESHOLDS:
+            if noise_value < threshold:
+                return self.biomes[biome_key]
+        return self.biomes[BIOME_FALLBACK]
+    
+    def get_biome_index_grid(self) -> np.ndarray:
+        """Dünyayı kaplayan hücreler için biome indeksleri (biome_keys sırası)
+        
+        Returns:
+            (hücre_y, hücre_x) boyutlu dizi; raster dünya boyutundan küçükse
+            get_biome_at ile aynı şekilde tekrarlanır
+        """
+        cells_x = int(np.ceil(self.size[0] / self.biome_cell_size))
+        cells_y = int(np.ceil(self.size[1] / self.biome_cell_size))
+        rows = np.arange(cells_y) % self.biome_noise.shape[0]
+        cols = np.arange(cells_x) % self.biome_noise.shape[1]
+        noise = self.biome_noise[np.ix_(rows, cols)]
+        thresholds = np.array([threshold for threshold, _ in BIOME_THRESHOLDS])
+        return np.searchsorted(thresholds, noise, side='right')
+    
+    def set_biome_fertility(self, biome_key: str, fertility: float):
+        """Biome verimliliğini değiştir (yiyecek üretim oranı da güncellenir)"""
+        biome = self.biomes[biome_key]
+        biome.fertility = fertility
+        biome.food_spawn_rate = fertility * 0.5 + 0.1
+        biome.organism_energy_cost = (1.0 - fertility) * 0.3 + 0.7
+        self.biome_food_rates[self.biome_keys.index(biome_key)] = biome.food_spawn_rate
+        logger.info(f"🌍 {biome.name} verimliliği: {fertility:.2f}")
+    
+    def expand_world(self, direction: str, amount: float):
+        """Dünyayı genişlet (koordinat başlangıcı sabit kalır, boyut büyür)"""
+        if direction in ('right', 'left'):
+            self.size[0] += amount
         else:
-            return self.biomes['ocean']
+            self.size[1] += amount
+        self.scent_field.resize(self.size)
+        logger.info(f"🌍 Dünya genişletildi: {direction} yönünde {amount} -> {self.size.tolist()}")
     
     def get_biome_color_at(self, x: float, y: float) -> Tuple[int, int, int]:
         """Belirli koordinattaki biome rengini döndür"""
@@ -156,7 +216,7 @@ class World:
         # Maksimum nüfus kontrolü (config'den alınacak)
         max_organisms = getattr(self, 'max_organisms', 2000)  # Varsayılan değer
         
-        if len(self.organisms) >= max_organisms:
+        if self.organism_count >= max_organisms:
             # En eski organizmayı kaldır (FIFO)
             oldest_organism = None
             oldest_index = -1
@@ -170,11 +230,23 @@ class World:
             if oldest_index >= 0:
                 self.remove_organism(oldest_index)
         
-        self.organisms.append(organism)
+        # Boş slot varsa yeniden kullan (liste canlı nüfusla sınırlı kalır)
+        if self.free_organism_slots:
+            slot = self.free_organism_slots.pop()
+            self.organisms[slot] = organism
+        else:
+            slot = len(self.organisms)
+            self.organisms.append(organism)
         self.stats['total_organisms'] += 1
         
+        # Yaşlılık ölümünü zamanla
+        self.scheduler.schedule_in(
+            organism.dna.genes['lifespan'] - organism.age, ('old_age', organism)
+        )
+        organism.lifespan_scheduled = True
+        
         # Spatial hash'e ekle
-        self._add_to_spatial_hash(organism.position, len(self.organisms) - 1, 'organism')
+        self._add_to_spatial_hash(organism.position, slot, 'organism')
         
         # Chunk'a ekle
         chunk_key = self._get_chunk_key(organism.position)
@@ -182,7 +254,12 @@ class World:
             self.chunks[chunk_key] = {'organisms': [], 'foods': []}
             self.active_chunks.add(chunk_key)
         
-        self.chunks[chunk_key]['organisms'].append(len(self.organisms) - 1)
+        self.chunks[chunk_key]['organisms'].append(slot)
+    
+    @property
+    def organism_count(self) -> int:
+        """Canlı organizma sayısı (boş slot'lar hariç)"""
+        return len(self.organisms) - len(self.free_organism_slots)
     
     def spawn_organism_for_biome(self, position: np.ndarray) -> Optional['Organism']:
         """Biome için uygun türde organizma oluştur"""
@@ -227,15 +304,25 @@ class World:
                 
                 # Organizmayı None yap (silme işlemi için)
                 self.organisms[index] = None
+                self.free_organism_slots.append(index)
+                organism.alive = False
                 self.stats['total_organisms'] -= 1
     
     def add_food(self, food):
-        """Yiyecek ekle"""
-        self.foods.append(food)
+        """Yiyecek ekle (boş slot varsa yeniden kullanılır)"""
+        if self.free_food_slots:
+            slot = self.free_food_slots.pop()
+            self.foods[slot] = food
+        else:
+            slot = len(self.foods)
+            self.foods.append(food)
+        self.food_store.attach(food, slot)
+        self.scent_field.deposit(np.array([slot]), self.food_store)
+        self._schedule_food_expiry(np.array([slot]))
         self.stats['total_food_spawned'] += 1
         
         # Spatial hash'e ekle
-        self._add_to_spatial_hash(food.position, len(self.foods) - 1, 'food')
+        self._add_to_spatial_hash(food.position, slot, 'food')
         
         # Chunk'a ekle
         chunk_key = self._get_chunk_key(food.position)
@@ -243,7 +330,49 @@ class World:
             self.chunks[chunk_key] = {'organisms': [], 'foods': []}
             self.active_chunks.add(chunk_key)
         
-        self.chunks[chunk_key]['foods'].append(len(self.foods) - 1)
+        self.chunks[chunk_key]['foods'].append(slot)
+    
+    def add_food_batch(self, batch: Dict[str, Any], frame: int = 0) -> List[int]:
+        """FoodSpawner.spawn_batch çıktısını toplu olarak ekle"""
+        count = len(batch['energies'])
+        if count == 0:
+            return []
+        
+        # Önce boş slot'lar, sonra listenin sonu
+        reused = [self.free_food_slots.pop() for _ in range(min(count, len(self.free_food_slots)))]
+        appended = list(range(len(self.foods), len(self.foods) + count - len(reused)))
+        slots = reused + appended
+        self.foods.extend([None] * len(appended))
+        
+        slot_array = np.array(slots, dtype=np.int64)
+        self.food_store.attach_batch(slot_array, batch)
+        self.scent_field.deposit(slot_array, self.food_store)
+        self._schedule_food_expiry(slot_array)
+        self.stats['total_food_spawned'] += count
+        
+        chunk_coords = (batch['positions'] // self.chunk_size).astype(np.int64).tolist()
+        sizes = batch['sizes'].tolist()
+        type_names = batch['type_names']
+        
+        for i, slot in enumerate(slots):
+            self.foods[slot] = Food.bound_to_store(
+                self.food_store, slot, type_names[i], sizes[i], frame
+            )
+            
+            chunk_key = (chunk_coords[i][0], chunk_coords[i][1])
+            
+            # Spatial hash'e ekle
+            if chunk_key not in self.spatial_hash:
+                self.spatial_hash[chunk_key] = {'organisms': [], 'foods': []}
+            self.spatial_hash[chunk_key]['foods'].append(slot)
+            
+            # Chunk'a ekle
+            if chunk_key not in self.chunks:
+                self.chunks[chunk_key] = {'organisms': [], 'foods': []}
+                self.active_chunks.add(chunk_key)
+            self.chunks[chunk_key]['foods'].append(slot)
+        
+        return slots
     
     def remove_food(self, index: int):
         """Yiyecek kaldır"""
@@ -259,8 +388,62 @@ class World:
                     if index in self.chunks[chunk_key]['foods']:
                         self.chunks[chunk_key]['foods'].remove(index)
                 
-                # Yiyeceği None yap
+                # Yiyeceği None yap ve slot'u serbest bırak
+                self.scent_field.withdraw(index, self.food_store)
+                self.food_store.release(food)
                 self.foods[index] = None
+                self.free_food_slots.append(index)
+    
+    def _schedule_food_expiry(self, slots: np.ndarray):
+        """Bozulan yiyeceklerin enerjisinin biteceği tick'i zamanla"""
+        store = self.food_store
+        decay_rates = store.decay_rates[slots]
+        decaying = decay_rates > 0
+        if not np.any(decaying):
+            return
+        slots = slots[decaying]
+        ticks = np.ceil(
+            store.energies[slots] / (decay_rates[decaying] * self.scheduler.tick_seconds) - 1e-9
+        ).astype(np.int64)
+        now = self.scheduler.now
+        for slot, ticks_left, generation in zip(slots.tolist(), ticks.tolist(),
+                                                store.generations[slots].tolist()):
+            self.scheduler.schedule(now + ticks_left, ('food_expiry', slot, generation))
+    
+    def process_scheduled_events(self, frame: int) -> Dict[str, int]:
+        """Zamanlama çarkını bir tick ilerlet ve zamanı gelen olayları uygula
+        
+        Yenen yiyecekler ve başka nedenle ölen organizmalar için kayıtlar
+        silinmez; slot nesli veya ``alive`` bayrağı tutmuyorsa atlanır.
+        """
+        counts = {'food_expired': 0, 'old_age': 0}
+        store = self.food_store
+        
+        for event in self.scheduler.advance():
+            kind = event[0]
+            if kind == 'food_expiry':
+                _, slot, generation = event
+                if not store.alive[slot] or store.generations[slot] != generation:
+                    continue
+                if store.energies[slot] > 0:
+                    # Yuvarlama veya bozulma hızı değişimi: kalan süreye göre yeniden zamanla
+                    self._schedule_food_expiry(np.array([slot]))
+                    continue
+                self.remove_food(slot)
+                counts['food_expired'] += 1
+            elif kind == 'old_age':
+                organism = event[1]
+                if organism.alive:
+                    # LOD ile biriken süreyi yaşa ekle
+                    organism.age += organism.accumulated_time
+                    organism.accumulated_time = 0.0
+                    organism.stats['lifespan'] = organism.age
+                    organism.die(self, 'old_age', frame)
+                    counts['old_age'] += 1
+            elif kind == 'reproduction_ready':
+                event[1].reproduction_ready = True
+        
+        return counts
     
     def update_organism_position(self, index: int, new_position: np.ndarray):
         """Organizma pozisyonunu güncelle"""
@@ -397,5 +580,6 @@ class World:
             'active_chunks': len(self.active_chunks),
             'total_chunks': len(self.chunks),
             'organism_count': len([org for org in self.organisms if org is not None]),
+            'scheduled_events': len(self.scheduler),
             'food_count': len([food for food in self.foods if food is not None])
         } 
\ No newline at end of file
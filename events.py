@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Ecosim - Olay Sorgulama
+Sütunlu organizma olay deposunu süzer, gruplar ve JSONL günlüklerini aktarır
+"""
+
+import sys
+import argparse
+
+from core.event_store import EventStore, import_jsonl, DEFAULT_EVENT_STORE_PATH
+from core.utils import configure_logging
+
+def parse_tick_range(text):
+    """'100:500', '100:' ya da ':500' biçimindeki aralığı çöz"""
+    low, _, high = text.partition(':')
+    return (int(low) if low else None, int(high) if high else None)
+
+def format_value(value):
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else f"{value:.4g}"
+    return str(value)
+
+def main():
+    parser = argparse.ArgumentParser(description='Ecosim - Organizma olay sorgulama')
+    parser.add_argument('store', nargs='?', default=DEFAULT_EVENT_STORE_PATH,
+                       help='Olay deposu dizini')
+    parser.add_argument('--import-jsonl', metavar='FILE',
+                       help='JSONL olay günlüğünü (.jsonl ya da .jsonl.gz) depoya aktar')
+    parser.add_argument('--backend', choices=['auto', 'parquet', 'npy'], default='auto',
+                       help='Aktarımda parça biçimi')
+    parser.add_argument('--info', action='store_true',
+                       help='Depo özetini göster')
+    parser.add_argument('--organism', type=int,
+                       help='Yalnızca bu organizmanın olayları')
+    parser.add_argument('--type',
+                       help='Yalnızca bu olay türü (ör. died, reproduced, ate_food)')
+    parser.add_argument('--ticks', type=parse_tick_range, metavar='A:B',
+                       help='Tick aralığı (uçlar dahil)')
+    parser.add_argument('--columns',
+                       help='Gösterilecek sütunlar (virgülle ayrılmış)')
+    parser.add_argument('--group-by', metavar='COLUMN',
+                       help='Bu sütuna göre grupla')
+    parser.add_argument('--agg', default='count', metavar='HOW[:COLUMN]',
+                       help='Grup toplaması: count, sum:COL, mean:COL, min:COL, max:COL')
+    parser.add_argument('--limit', type=int, default=20,
+                       help='Gösterilecek en fazla satır/grup')
+
+    args = parser.parse_args()
+
+    # Logging yalnızca giriş noktasında yapılandırılır
+    configure_logging()
+
+    try:
+        if args.import_jsonl:
+            stats = import_jsonl(args.import_jsonl, args.store, backend=args.backend)
+            print(f"📥 {stats['events']} olay {stats['chunks']} parçaya aktarıldı ({stats['backend']}): {args.store}")
+            return
+
+        store = EventStore(args.store)
+        if args.info:
+            info = store.get_info()
+            print(f"🗃️  {info['path']}: {info['rows']} olay, {info['chunks']} parça")
+            if info['rows']:
+                print(f"   Tick: {info['tick_range'][0]}-{info['tick_range'][1]}  Biçim: {', '.join(info['backends'])}")
+                print(f"   Sütunlar: {', '.join(info['columns'])}")
+            return
+
+        filters = {'organism_id': args.organism, 'event_type': args.type, 'tick_range': args.ticks}
+
+        if args.group_by:
+            how, _, value = args.agg.partition(':')
+            groups = store.aggregate(args.group_by, value or None, how, **filters)
+            label = how if not value else f"{how}({value})"
+            print(f"{args.group_by:>16}  {label}")
+            for key, result in groups[:args.limit]:
+                print(f"{format_value(key):>16}  {format_value(result)}")
+            if len(groups) > args.limit:
+                print(f"... {len(groups) - args.limit} grup daha")
+            return
+
+        columns = args.columns.split(',') if args.columns else None
+        data = store.query(columns, limit=args.limit, **filters)
+        names = list(data)
+        print('  '.join(f"{name:>12}" for name in names))
+        for i in range(len(data[names[0]]) if names else 0):
+            print('  '.join(f"{format_value(data[name][i].item() if hasattr(data[name][i], 'item') else data[name][i]):>12}"
+                            for name in names))
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Sorgu kullanıcı tarafından durduruldu")
+    except Exception as e:
+        print(f"❌ Hata: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,45 @@ from pathlib import Path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'core'))
 from core.simulation import Simulation
 from core.scenario_handler import ScenarioHandler
+from core.utils import configure_logging
 
 def load_config(config_path):
     """YAML config dosyasını yükle"""
     with open(config_path, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
 
+def run_tiled(config, tiles, ticks, network=False, listen=None):
+    """Karolara bölünmüş çok süreçli motorla headless çalıştır"""
+    from core.tiled_engine import TiledWorldEngine
+    from core.tile_network import DistributedWorldEngine
+    
+    tiles_x, tiles_y = (int(value) for value in tiles.lower().split('x'))
+    if listen:
+        host, port = listen.rsplit(':', 1)
+        engine = DistributedWorldEngine(config, tiles=(tiles_x, tiles_y), host=host, port=int(port),
+                                        local_nodes=False)
+    elif network:
+        engine = DistributedWorldEngine(config, tiles=(tiles_x, tiles_y))
+    else:
+        engine = TiledWorldEngine(config, tiles=(tiles_x, tiles_y))
+    
+    with engine:
+        print(f"🧩 {tiles_x}x{tiles_y} karo, {engine.get_statistics()['organism_count']} organizma")
+        engine.step(ticks)
+        stats = engine.get_statistics()
+    print(f"⏩ {stats['tick']} tick ({stats['current_time']:.1f} sn simülasyon): "
+          f"{stats['ticks_per_second']:.1f} tick/sn, nüfus {stats['organism_count']}, "
+          f"göç {stats['immigrants']}")
+
+def run_replay(config, path):
+    """Replay dosyasını simülasyon çalıştırmadan oynat"""
+    from visuals.replay_viewer import ReplayViewer
+    
+    visualization = config.get('visualization', {})
+    viewer = ReplayViewer(path, screen_size=visualization.get('screen_size', [1200, 800]),
+                          fps=config.get('simulation', {}).get('fps', 60))
+    viewer.run()
+
 def main():
     parser = argparse.ArgumentParser(description='Ecosim - Evrimsel Biyoloji Simülasyonu')
     parser.add_argument('--scenario', '-s', default='default', 
@@ -29,10 +62,33 @@ def main():
     parser.add_argument('--headless', action='store_true',
                        help='Görsel olmadan sadece simülasyon çalıştır')
     parser.add_argument('--export', '-e', action='store_true',
-                       help='Simülasyon sonuçlarını dışa aktar')
+                       help='Simülasyon sonuçlarını dışa aktar (istatistikler koşu boyunca data/stats/*.jsonl\'e eklenir)')
+    parser.add_argument('--ticks', type=int,
+                       help='Headless hızlı ileri sarma: bu kadar tick çalıştırıp çık (--headless ima eder)')
+    parser.add_argument('--dt', type=float,
+                       help='Sabit simülasyon adımı (saniye), config\'deki fixed_dt yerine')
+    parser.add_argument('--tiles',
+                       help='Dünyayı NxM karoya bölüp her karoyu ayrı süreçte çalıştır (--ticks ile, örn. 4x4)')
+    parser.add_argument('--network', action='store_true',
+                       help='Karo süreçleri shared memory yerine TCP üzerinden haberleşsin (--tiles ile)')
+    parser.add_argument('--listen',
+                       help='Uzak karo düğümlerini bu adreste bekle (HOST:PORT, --tiles ile; tile_node.py)')
+    parser.add_argument('--resume',
+                       help='Simülasyonu bu checkpoint dosyasından (.npz) sürdür')
+    parser.add_argument('--record',
+                       help='Her tick\'i bu replay dosyasına kaydet')
+    parser.add_argument('--render-process', action='store_true',
+                       help='Görselleştirmeyi ayrı bir süreçte çalıştır (simülasyon çizimi beklemez)')
+    parser.add_argument('--telemetry',
+                       help='Canlı istatistikleri bu adreste HTTP ile yayımla ([HOST:]PORT, örn. 8765)')
+    parser.add_argument('--replay',
+                       help='Simülasyon çalıştırmadan bu replay dosyasını oynat')
     
     args = parser.parse_args()
     
+    # Logging yalnızca giriş noktasında yapılandırılır
+    configure_logging()
+    
     # Senaryo yapılandırmasını yükle
     if args.config:
         config = load_config(args.config)
@@ -59,17 +115,51 @@ def main():
                 }
             }
     
+    if args.dt is not None:
+        config.setdefault('simulation', {})['fixed_dt'] = args.dt
+    if args.ticks is not None:
+        args.headless = True
+    if args.render_process:
+        config.setdefault('visualization', {})['render_process'] = True
+    
+    if args.replay:
+        run_replay(config, args.replay)
+        return
+    
+    if args.tiles:
+        if args.ticks is None:
+            print("❌ Hata: --tiles yalnızca --ticks ile kullanılabilir")
+            sys.exit(1)
+        run_tiled(config, args.tiles, args.ticks, network=args.network, listen=args.listen)
+        return
+    
     # Simülasyonu başlat
     try:
         simulation = Simulation(config, headless=args.headless)
         scenario_handler = ScenarioHandler(args.scenario, simulation)
+        if args.resume:
+            simulation.load_checkpoint(args.resume, scenario_handler)
+        if args.record:
+            simulation.start_recording(args.record)
+        if args.export and simulation.exporter is None:
+            # Örnekler koşu boyunca yazılır; çökse bile o ana kadarkiler kalır
+            simulation.start_export(config.get('simulation', {}).get('export'))
+        
+        if args.telemetry:
+            host, _, port = args.telemetry.rpartition(':')
+            simulation.start_telemetry({'host': host or '127.0.0.1', 'port': int(port)})
         
         print(f"🎮 Ecosim başlatılıyor...")
         print(f"📊 Senaryo: {args.scenario}")
         print(f"⚙️  Config: {config.get('simulation', {})}")
         
         # Ana simülasyon döngüsü
-        simulation.run(scenario_handler)
+        if args.ticks is not None:
+            result = simulation.run_fast_forward(args.ticks, scenario_handler)
+            print(f"⏩ {result['ticks']} tick ({result['simulated_seconds']:.1f} sn simülasyon) "
+                  f"{result['elapsed']:.2f} sn'de tamamlandı: {result['ticks_per_second']:.1f} tick/sn")
+        else:
+            simulation.run(scenario_handler)
         
         if args.export:
             simulation.export_results()
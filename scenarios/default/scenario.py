@@ -125,6 +125,7 @@ class Scenario:
             direction = np.random.choice(directions)
             amount = np.random.randint(200, 800)
             simulation.world.expand_world(direction, amount)
+            simulation.food_spawner.on_world_resized(simulation.world)
             
             print(f"🌍 Dünya genişletildi: {direction} yönünde {amount} birim")
     
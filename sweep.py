@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Ecosim - Parametre Taraması
+YAML tanımındaki config noktalarını paralel headless tekrarlarla çalıştırır
+"""
+
+import sys
+import argparse
+
+from core.sweep import ParameterSweep, load_sweep_spec
+from core.utils import configure_logging
+
+def main():
+    parser = argparse.ArgumentParser(description='Ecosim - Paralel parametre taraması')
+    parser.add_argument('spec',
+                       help='Tarama tanımı (YAML)')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='İşçi süreç sayısı (varsayılan: tüm çekirdekler)')
+    parser.add_argument('--output', '-o', default='data/sweeps',
+                       help='Sonuç tablolarının dizini')
+
+    args = parser.parse_args()
+
+    # Logging yalnızca giriş noktasında yapılandırılır
+    configure_logging()
+
+    try:
+        sweep = ParameterSweep(load_sweep_spec(args.spec), output_dir=args.output, workers=args.workers)
+        print(f"🧪 Tarama: {sweep.name} ({len(sweep.points)} nokta x {sweep.replicates} tekrar, {sweep.workers} işçi)")
+
+        summary = sweep.run()
+
+        for entry in summary:
+            parameters = ', '.join(f"{key}={entry[key]}" for key in sweep.parameter_keys)
+            print(f"  [{entry['point_id']}] {parameters}: "
+                  f"nüfus {entry['final_population_mean']:.1f} "
+                  f"(%95 GA {entry['final_population_ci_low']:.1f}-{entry['final_population_ci_high']:.1f})")
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Tarama kullanıcı tarafından durduruldu")
+    except Exception as e:
+        print(f"❌ Hata: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
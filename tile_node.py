@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Ecosim - Dağıtık Karo Düğümü
+Koordinatöre bağlanıp atanan karoyu çalıştırır (main.py --tiles NxM --listen HOST:PORT)
+"""
+
+import argparse
+
+from core.tile_network import run_tile_node
+from core.utils import configure_logging
+
+def main():
+    parser = argparse.ArgumentParser(description='Ecosim - Dağıtık karo düğümü')
+    parser.add_argument('--coordinator', required=True,
+                       help='Koordinatör adresi (HOST:PORT)')
+    parser.add_argument('--listen-host', default='0.0.0.0',
+                       help='Komşu düğüm bağlantıları için dinlenecek arayüz')
+    parser.add_argument('--timeout', type=float, default=60.0,
+                       help='Bağlantı ve komşu mesajı zaman aşımı (saniye)')
+
+    args = parser.parse_args()
+
+    # Logging yalnızca giriş noktasında yapılandırılır
+    configure_logging()
+
+    host, port = args.coordinator.rsplit(':', 1)
+    run_tile_node(host, int(port), listen_host=args.listen_host, timeout=args.timeout)
+
+if __name__ == "__main__":
+    main()
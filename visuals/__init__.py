@@ -7,11 +7,15 @@ from .food_renderer import FoodRenderer
 from .ui_renderer import UIRenderer
 from .camera_overlay import CameraOverlay
 from .performance_monitor import PerformanceMonitor
+from .frame_renderer import FrameRenderer
+from .replay_viewer import ReplayViewer
 
 __all__ = [
     'OrganismRenderer',
     'FoodRenderer', 
     'UIRenderer',
     'CameraOverlay',
-    'PerformanceMonitor'
+    'PerformanceMonitor',
+    'FrameRenderer',
+    'ReplayViewer'
 ] 
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Kare Görselleştirme - Kayıt Satırlarını Mevcut Renderer'larla Çizme
+"""
+
+import pygame
+import numpy as np
+from typing import Dict, Sequence, Tuple
+
+from core.replay import REPLAY_STATES, REPLAY_GENES
+from core.food import FOOD_TYPE_CODES
+from .organism_renderer import OrganismRenderer
+from .food_renderer import FoodRenderer
+from .ui_renderer import UIRenderer
+from .camera_overlay import CameraOverlay
+
+FOOD_TYPE_NAMES = sorted(FOOD_TYPE_CODES, key=FOOD_TYPE_CODES.get)
+
+
+class _FrameDNA:
+    """Renderer'ların okuduğu gen sözlüğü"""
+
+    __slots__ = ('genes',)
+
+    def __init__(self, genes: Dict[str, float]):
+        self.genes = genes
+
+
+class FrameOrganism:
+    """Kare satırından oluşturulan, renderer'lara organizma gibi görünen nesne"""
+
+    __slots__ = ('organism_id', 'position', 'energy', 'age', 'size', 'fitness',
+                 'state', 'color', 'dna', 'stats')
+
+    def __init__(self, row, states: Sequence[str] = REPLAY_STATES, gene_names: Sequence[str] = REPLAY_GENES):
+        self.organism_id = int(row['id'])
+        self.position = row['position'].astype(np.float64)
+        self.energy = float(row['energy'])
+        self.age = float(row['age'])
+        self.size = float(row['size'])
+        self.fitness = float(row['fitness'])
+        code = int(row['state'])
+        self.state = states[code] if code < len(states) else 'unknown'
+        self.color = tuple(int(c) for c in row['color'])
+        self.dna = _FrameDNA(dict(zip(gene_names, row['genes'].astype(float).tolist())))
+        self.stats = {}
+
+    def get_render_position(self, alpha: float) -> np.ndarray:
+        return self.position
+
+    def get_fitness(self) -> float:
+        return self.fitness
+
+
+class FrameFood:
+    """Kare satırından oluşturulan yiyecek görünümü"""
+
+    __slots__ = ('position', 'energy_value', 'size', 'food_type', 'is_moving')
+
+    def __init__(self, row, food_types: Sequence[str] = FOOD_TYPE_NAMES):
+        self.position = row['position'].astype(np.float64)
+        self.energy_value = float(row['energy'])
+        self.size = float(row['size'])
+        code = int(row['type'])
+        self.food_type = food_types[code] if code < len(food_types) else 'basic'
+        self.is_moving = bool(row['moving'])
+
+
+class FrameRenderer:
+    """ORGANISM_FRAME_DTYPE / FOOD_FRAME_DTYPE satırlarını ekrana çizer
+
+    Replay görüntüleyici ve ayrı süreçteki renderer ortak kullanır.
+    Yalnızca kamera içindeki satırlar için vekil nesne oluşturulur.
+    """
+
+    def __init__(self, screen_size: Tuple[int, int], states: Sequence[str] = REPLAY_STATES,
+                 gene_names: Sequence[str] = REPLAY_GENES, food_types: Sequence[str] = FOOD_TYPE_NAMES):
+        """
+        Args:
+            screen_size: Ekran boyutu
+            states: Durum kodu -> ad tablosu
+            gene_names: Gen sütunlarının adları
+            food_types: Yiyecek tür kodu -> ad tablosu
+        """
+        self.states = list(states)
+        self.gene_names = list(gene_names)
+        self.food_types = list(food_types)
+        self.organism_renderer = OrganismRenderer()
+        self.food_renderer = FoodRenderer()
+        self.ui_renderer = UIRenderer(screen_size)
+        self.camera_overlay = CameraOverlay(screen_size)
+        self.show_grid = True
+
+    @staticmethod
+    def visible_mask(camera, positions: np.ndarray) -> np.ndarray:
+        """Kamera içindeki satırlar (vektörel culling)"""
+        screen_pos = camera.world_to_screen(positions)
+        margin = camera.culling_margin
+        width, height = camera.screen_size
+        return ((screen_pos[:, 0] >= -margin) & (screen_pos[:, 0] <= width + margin) &
+                (screen_pos[:, 1] >= -margin) & (screen_pos[:, 1] <= height + margin))
+
+    def draw(self, screen: pygame.Surface, camera, organism_rows: np.ndarray,
+             food_rows: np.ndarray) -> Tuple[int, int]:
+        """Kareyi çiz, çizilen organizma ve yiyecek sayısını döndür"""
+        zoom = camera.zoom_level
+        screen.fill((20, 20, 40))
+        if self.show_grid and zoom < 3.0:
+            self.camera_overlay.draw_all_overlays(screen, camera)
+
+        organisms = [FrameOrganism(row, self.states, self.gene_names)
+                     for row in organism_rows[self.visible_mask(camera, organism_rows['position'])]]
+        show_details = zoom > 2.0
+        show_energy = zoom > 1.0
+        for organism in organisms:
+            self.organism_renderer.draw_organism(screen, organism, camera,
+                                                 show_details=show_details, show_energy=show_energy)
+        self.ui_renderer.draw_organism_labels(screen, organisms, camera, zoom)
+
+        foods = food_rows[self.visible_mask(camera, food_rows['position'])]
+        food_show_details = zoom > 2.5
+        for row in foods:
+            self.food_renderer.draw_food(screen, FrameFood(row, self.food_types),
+                                         camera, show_details=food_show_details)
+        return len(organisms), len(foods)
@@ -16,6 +16,9 @@ class OrganismRenderer:
         self.cache_hits = 0
         self.cache_misses = 0
         
+        # Sabit zaman adımı render interpolasyonu (0-1)
+        self.interpolation_alpha = 1.0
+        
         # Durum renkleri
         self.state_colors = {
             'wandering': (100, 100, 100),   # Gri
@@ -162,8 +165,9 @@ class OrganismRenderer:
     def draw_organism(self, screen: pygame.Surface, organism, camera, 
                      show_details: bool = True, show_energy: bool = True):
         """Organizmayı çiz (genişletilmiş)"""
-        # Dünya koordinatlarını ekran koordinatlarına çevir
-        screen_pos = camera.world_to_screen(organism.position)
+        # Dünya koordinatlarını ekran koordinatlarına çevir (tick'ler arası interpolasyon)
+        render_position = organism.get_render_position(self.interpolation_alpha)
+        screen_pos = camera.world_to_screen(render_position)
         screen_x, screen_y = int(screen_pos[0]), int(screen_pos[1])
         
         # Ekran dışındaysa çizme (frustum culling)
@@ -4,7 +4,9 @@ Performans İzleme Sistemi
 
 import time
 import pygame
+import numpy as np
 from typing import Dict, Any, List
+from core.timeseries import RingBuffer
 from core.utils import logger, perf_monitor
 
 class PerformanceMonitor:
@@ -14,8 +16,8 @@ class PerformanceMonitor:
         self.debug_mode = debug_mode
         self.enabled = debug_mode  # Debug modda aktif
         
-        self.frame_times = []
         self.max_frame_history = 60  # Son 60 frame'i tut
+        self.frame_times = RingBuffer(self.max_frame_history)
         
         # Performans metrikleri
         self.metrics = {
@@ -53,12 +55,10 @@ class PerformanceMonitor:
         
         # Frame zamanını kaydet
         self.frame_times.append(frame_time)
-        if len(self.frame_times) > self.max_frame_history:
-            self.frame_times.pop(0)
         
         # FPS hesapla
         if len(self.frame_times) > 1:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
+            avg_frame_time = float(self.frame_times.view().mean())
             self.metrics['fps'] = 1000.0 / avg_frame_time if avg_frame_time > 0 else 0
         else:
             self.metrics['fps'] = 1000.0 / frame_time if frame_time > 0 else 0
@@ -105,6 +105,7 @@ class PerformanceMonitor:
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Performans istatistiklerini döndür"""
+        frame_times = self.frame_times.view()
         return {
             'fps': self.metrics['fps'],
             'frame_time': self.metrics['frame_time'],
@@ -116,9 +117,9 @@ class PerformanceMonitor:
             'visible_foods': self.metrics['visible_foods'],
             'total_organisms': self.metrics['total_organisms'],
             'total_foods': self.metrics['total_foods'],
-            'avg_frame_time': sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0,
-            'min_frame_time': min(self.frame_times) if self.frame_times else 0,
-            'max_frame_time': max(self.frame_times) if self.frame_times else 0,
+            'avg_frame_time': float(frame_times.mean()) if len(frame_times) else 0,
+            'min_frame_time': float(frame_times.min()) if len(frame_times) else 0,
+            'max_frame_time': float(frame_times.max()) if len(frame_times) else 0,
             'warnings': len(self.warnings)
         }
     
@@ -136,7 +137,8 @@ class PerformanceMonitor:
     
     def draw_performance_graph(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
         """Performans grafiği çiz"""
-        if not self.frame_times:
+        frame_times = self.frame_times.view()
+        if not len(frame_times):
             return
         
         # Grafik arka planı
@@ -144,22 +146,18 @@ class PerformanceMonitor:
         pygame.draw.rect(screen, (100, 100, 100), (x, y, width, height), 1)
         
         # Frame time grafiği
-        if len(self.frame_times) > 1:
-            max_time = max(self.frame_times)
-            min_time = min(self.frame_times)
+        if len(frame_times) > 1:
+            max_time = float(frame_times.max())
+            min_time = float(frame_times.min())
             time_range = max_time - min_time if max_time != min_time else 1
             
-            points = []
-            for i, frame_time in enumerate(self.frame_times):
-                graph_x = x + (i / len(self.frame_times)) * width
-                graph_y = y + height - ((frame_time - min_time) / time_range) * height
-                points.append((graph_x, graph_y))
-            
-            if len(points) > 1:
-                pygame.draw.lines(screen, (0, 255, 255), False, points, 2)
+            graph_x = x + np.arange(len(frame_times)) / len(frame_times) * width
+            graph_y = y + height - (frame_times - min_time) / time_range * height
+            points = np.column_stack((graph_x, graph_y)).tolist()
+            pygame.draw.lines(screen, (0, 255, 255), False, points, 2)
         
         # FPS çizgisi (16.67ms = 60 FPS)
-        target_fps_y = y + height - (16.67 / max(self.frame_times) if self.frame_times else 1) * height
+        target_fps_y = y + height - (16.67 / float(frame_times.max())) * height
         pygame.draw.line(screen, (255, 255, 0), (x, target_fps_y), (x + width, target_fps_y), 1)
         
         # FPS metni
@@ -169,13 +167,14 @@ class PerformanceMonitor:
     
     def log_performance_summary(self):
         """Performans özetini logla"""
-        if not self.frame_times:
+        frame_times = self.frame_times.view()
+        if not len(frame_times):
             return
         
         avg_fps = self.metrics['fps']
-        avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-        min_frame_time = min(self.frame_times)
-        max_frame_time = max(self.frame_times)
+        avg_frame_time = float(frame_times.mean())
+        min_frame_time = float(frame_times.min())
+        max_frame_time = float(frame_times.max())
         
         summary = f"""
 📊 Performans Özeti:
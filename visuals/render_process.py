@@ -0,0 +1,123 @@
+"""
+Ayrı Süreç Renderer - Shared Memory Karelerini Çizme
+"""
+
+import pygame
+from typing import List, Tuple
+
+from core.camera import Camera
+from core.render_bridge import (FRONT, SEQ, CONSUMED, GENERATION, CLOSED,
+                                control_layout, frame_layout)
+from core.tiled_engine import SharedColumns
+from core.utils import configure_logging, logger
+from .frame_renderer import FrameRenderer
+
+
+def _attach(names: List[str], capacities: Tuple[int, int]) -> List[SharedColumns]:
+    layout = frame_layout(*capacities)
+    return [SharedColumns(layout, name=name) for name in names]
+
+
+def render_main(control_name: str, buffer_names: List[str], capacities: Tuple[int, int],
+                screen_size: Tuple[int, int], world_size: Tuple[float, float], fps: int, connection):
+    """Renderer süreci giriş noktası (RenderBridge tarafından başlatılır)
+
+    Args:
+        control_name: Kontrol bloğunun adı
+        buffer_names: İki kare tamponunun blok adları
+        capacities: Tampon kapasiteleri (organizma, yiyecek)
+        screen_size: Pencere boyutu
+        world_size: Dünya boyutu
+        fps: Hedef kare hızı
+        connection: Simülasyon sürecine giden boru ucu
+    """
+    configure_logging()
+    control_block = SharedColumns(control_layout(), name=control_name)
+    control = control_block['control']
+    buffers = _attach(buffer_names, capacities)
+    generation = 0
+
+    pygame.init()
+    screen = pygame.display.set_mode(screen_size)
+    pygame.display.set_caption("Ecosim - Evrimsel Biyoloji Simülasyonu")
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 24)
+    camera = Camera(screen_size, world_size)
+    frame_renderer = FrameRenderer(screen_size)
+
+    last_camera = None
+    last_tick = None
+    sim_rate = 0.0
+    running = True
+    logger.info("🖼️  Renderer süreci hazır")
+
+    try:
+        while running and not control[CLOSED]:
+            real_dt = clock.tick(fps) / 1000.0
+
+            # Simülasyondan gelen mesajlar (tampon değişimi, kapanış)
+            while connection.poll():
+                message = connection.recv()
+                if message[0] == 'buffers':
+                    for buffer in buffers:
+                        buffer.close()
+                    generation = message[1]
+                    buffers = _attach(message[2], message[3])
+                elif message[0] == 'close':
+                    running = False
+
+            # Girdiler: kamera yerelde, simülasyonu etkileyenler boruya
+            mouse_wheel = 0
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    connection.send(('quit',))
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        connection.send(('pause',))
+                    elif event.key == pygame.K_g:
+                        frame_renderer.show_grid = not frame_renderer.show_grid
+                    elif event.key == pygame.K_l:
+                        ui_renderer = frame_renderer.ui_renderer
+                        ui_renderer.show_organism_labels = not ui_renderer.show_organism_labels
+                    elif event.key == pygame.K_r:
+                        camera.reset_view()
+                elif event.type == pygame.MOUSEWHEEL:
+                    mouse_wheel = event.y
+            camera.handle_input(pygame.key.get_pressed(), pygame.mouse.get_pos(), mouse_wheel, real_dt)
+
+            camera_state = (float(camera.position[0]), float(camera.position[1]), camera.zoom_level)
+            if camera_state != last_camera:
+                connection.send(('camera', camera_state[:2], camera_state[2]))
+                last_camera = camera_state
+
+            # Tampon değişimi mesajı henüz gelmediyse bu kareyi atla
+            if control[GENERATION] != generation:
+                continue
+
+            # SEQ önce, FRONT sonra okunur (simülasyon FRONT'u önce yazar)
+            seq = int(control[SEQ])
+            if seq == 0:
+                continue
+            buffer = buffers[int(control[FRONT])]
+            header = buffer['header']
+            tick, sim_time = int(header[0]), float(header[1])
+            n_org, n_food = int(header[4]), int(header[5])
+            frame_renderer.draw(screen, camera, buffer['organisms'][:n_org], buffer['foods'][:n_food])
+            control[CONSUMED] = seq
+
+            if last_tick is not None and real_dt > 0:
+                sim_rate = 0.9 * sim_rate + 0.1 * (tick - last_tick) / real_dt
+            last_tick = tick
+            status = (f"Tick {tick}  t={sim_time:.1f} sn  Organizma: {n_org}  Yiyecek: {n_food}  "
+                      f"FPS: {clock.get_fps():.0f}  Sim: {sim_rate:.0f} tick/sn  Zoom: {camera.zoom_level:.2f}")
+            screen.blit(font.render(status, True, (230, 230, 230)), (10, 10))
+            pygame.display.flip()
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        pygame.quit()
+        for buffer in buffers:
+            buffer.close()
+        control_block.close()
+        connection.close()
@@ -0,0 +1,208 @@
+"""
+Replay Görüntüleyici - Kayıttan Yalnızca Render ile Oynatma
+"""
+
+import pygame
+from typing import Dict, Any, Tuple
+
+from core.camera import Camera
+from core.replay import ReplayReader
+from core.utils import logger
+from .frame_renderer import FrameRenderer
+
+
+class ReplayViewer:
+    """Replay dosyasını mevcut renderer'larla oynatır; simülasyon çalıştırmaz
+
+    Kareler mmap'ten okunur ve ``FrameRenderer`` ile çizilir. Kontroller:
+    SPACE duraklat, ``,``/``.`` kare adımı, ``[``/``]`` hız yarıya/iki katına,
+    BACKSPACE ters yön, PgUp/PgDn ±10 sn, HOME/END başa/sona,
+    ilerleme çubuğuna tıklama ile arama; kamera her zamanki gibi
+    (WASD, sürükleme, tekerlek).
+    """
+
+    SPEEDS = [0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0]
+
+    def __init__(self, path, screen_size: Tuple[int, int] = (1200, 800), fps: int = 60):
+        """
+        Args:
+            path: Replay dosyası yolu
+            screen_size: Pencere boyutu
+            fps: Görüntüleme kare hızı
+        """
+        self.reader = ReplayReader(path)
+        if len(self.reader) == 0:
+            raise ValueError(f"Replay dosyasında kare yok: {path}")
+        self.fps = fps
+        self.screen_size = tuple(int(v) for v in screen_size)
+
+        pygame.init()
+        self.screen = pygame.display.set_mode(self.screen_size)
+        pygame.display.set_caption(f"Ecosim Replay - {self.reader.path.name}")
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.Font(None, 24)
+        self.small_font = pygame.font.Font(None, 18)
+
+        world_size = self.reader.index['world_size'][0]
+        self.camera = Camera(self.screen_size, world_size)
+        self.frame_renderer = FrameRenderer(self.screen_size, self.reader.states,
+                                            self.reader.genes, self.reader.food_types)
+
+        # Oynatma durumu (cursor kare indeksi, kesirli)
+        self.cursor = 0.0
+        self.speed_index = self.SPEEDS.index(1.0)
+        self.direction = 1
+        self.paused = False
+        self.running = True
+
+        self.progress_rect = pygame.Rect(10, self.screen_size[1] - 22, self.screen_size[0] - 20, 12)
+
+        self.stats = {
+            'frames_shown': 0,
+            'seeks': 0,
+            'organisms_drawn': 0,
+            'foods_drawn': 0
+        }
+
+        info = self.reader.get_info()
+        logger.info(f"🎞️  ReplayViewer: {info['frames']} kare, tick {info['first_tick']}-{info['last_tick']}")
+
+    @property
+    def speed(self) -> float:
+        return self.SPEEDS[self.speed_index]
+
+    @property
+    def frame_index(self) -> int:
+        return int(self.cursor)
+
+    def seek(self, frame: float):
+        """Verilen kare indeksine atla"""
+        self.cursor = float(min(max(frame, 0), len(self.reader) - 1))
+        self.stats['seeks'] += 1
+
+    def _advance(self, real_dt: float):
+        """Oynatma hızına göre imleci ilerlet"""
+        if self.paused:
+            return
+        frames = real_dt * self.speed / self.reader.frame_seconds
+        cursor = self.cursor + self.direction * frames
+        last = len(self.reader) - 1
+        if cursor >= last:
+            # Kayıt sürüyorsa yeni kareleri al
+            self.reader.refresh()
+            last = len(self.reader) - 1
+            if cursor >= last:
+                cursor = last
+                self.paused = True
+        elif cursor <= 0:
+            cursor = 0.0
+            self.paused = True
+        self.cursor = cursor
+
+    def _handle_events(self):
+        """Oynatma ve kamera girdilerini işle"""
+        mouse_wheel = 0
+        seconds_per_frame = self.reader.frame_seconds
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.running = False
+                elif event.key == pygame.K_SPACE:
+                    self.paused = not self.paused
+                elif event.key == pygame.K_PERIOD:
+                    self.paused = True
+                    self.seek(self.frame_index + 1)
+                elif event.key == pygame.K_COMMA:
+                    self.paused = True
+                    self.seek(self.frame_index - 1)
+                elif event.key == pygame.K_RIGHTBRACKET:
+                    self.speed_index = min(self.speed_index + 1, len(self.SPEEDS) - 1)
+                elif event.key == pygame.K_LEFTBRACKET:
+                    self.speed_index = max(self.speed_index - 1, 0)
+                elif event.key == pygame.K_BACKSPACE:
+                    self.direction = -self.direction
+                    self.paused = False
+                elif event.key == pygame.K_PAGEUP:
+                    self.seek(self.cursor + 10.0 / seconds_per_frame)
+                elif event.key == pygame.K_PAGEDOWN:
+                    self.seek(self.cursor - 10.0 / seconds_per_frame)
+                elif event.key == pygame.K_HOME:
+                    self.seek(0)
+                elif event.key == pygame.K_END:
+                    self.reader.refresh()
+                    self.seek(len(self.reader) - 1)
+                elif event.key == pygame.K_g:
+                    self.frame_renderer.show_grid = not self.frame_renderer.show_grid
+                elif event.key == pygame.K_l:
+                    ui_renderer = self.frame_renderer.ui_renderer
+                    ui_renderer.show_organism_labels = not ui_renderer.show_organism_labels
+            elif event.type == pygame.MOUSEWHEEL:
+                mouse_wheel = event.y
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if self.progress_rect.collidepoint(event.pos):
+                    ratio = (event.pos[0] - self.progress_rect.x) / self.progress_rect.width
+                    self.seek(ratio * (len(self.reader) - 1))
+
+        keys_pressed = pygame.key.get_pressed()
+        mouse_pos = pygame.mouse.get_pos()
+        self.camera.handle_input(keys_pressed, mouse_pos, mouse_wheel, 1.0 / self.fps)
+
+    def _render(self):
+        """Mevcut kareyi çiz"""
+        organism_rows, food_rows = self.reader.frame(self.frame_index)
+        drawn_organisms, drawn_foods = self.frame_renderer.draw(self.screen, self.camera,
+                                                                organism_rows, food_rows)
+        self._draw_status(len(organism_rows), len(food_rows))
+        pygame.display.flip()
+
+        self.stats['frames_shown'] += 1
+        self.stats['organisms_drawn'] += drawn_organisms
+        self.stats['foods_drawn'] += drawn_foods
+
+    def _draw_status(self, organism_count: int, food_count: int):
+        """Oynatma durumu ve ilerleme çubuğu"""
+        entry = self.reader.index[self.frame_index]
+        if self.paused:
+            mode = "⏸"
+        else:
+            mode = "▶" if self.direction > 0 else "◀"
+        lines = [
+            f"{mode} {self.speed:g}x  kare {self.frame_index + 1}/{len(self.reader)}  "
+            f"tick {int(entry['tick'])}  t={float(entry['time']):.1f} sn",
+            f"Organizma: {organism_count}  Yiyecek: {food_count}  Zoom: {self.camera.zoom_level:.2f}",
+            "SPACE duraklat  ,/. kare  [/] hız  BACKSPACE yön  PgUp/PgDn ±10 sn  HOME/END"
+        ]
+        for i, line in enumerate(lines):
+            font = self.font if i < 2 else self.small_font
+            self.screen.blit(font.render(line, True, (230, 230, 230)), (10, 10 + i * 24))
+
+        pygame.draw.rect(self.screen, (60, 60, 80), self.progress_rect)
+        progress = self.cursor / max(len(self.reader) - 1, 1)
+        filled = self.progress_rect.copy()
+        filled.width = int(self.progress_rect.width * progress)
+        pygame.draw.rect(self.screen, (120, 200, 120), filled)
+        pygame.draw.rect(self.screen, (200, 200, 200), self.progress_rect, 1)
+
+    def run(self, max_frames: int = None):
+        """Görüntüleme döngüsü
+
+        Args:
+            max_frames: Bu kadar ekran karesinden sonra dur (None: pencere kapanana kadar)
+        """
+        shown = 0
+        try:
+            while self.running and (max_frames is None or shown < max_frames):
+                real_dt = self.clock.tick(self.fps) / 1000.0
+                self._handle_events()
+                self._advance(real_dt)
+                self._render()
+                shown += 1
+        finally:
+            pygame.quit()
+        logger.info(f"🎞️  Replay kapatıldı: {self.stats['frames_shown']} kare gösterildi")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Görüntüleyici istatistiklerini döndür"""
+        return dict(self.stats, frame=self.frame_index, speed=self.speed, paused=self.paused)